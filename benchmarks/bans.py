@@ -0,0 +1,98 @@
+"""
+Bulk scrim ban/unban and ban expiry, offline.
+
+    python -m benchmarks.bans --users 100 500 --expire-after 1
+
+Bans a batch of users from an open scrim (half of them temporarily), checks
+that registration sees the bans, waits for the temporary ones to be removed
+by the expiry timer and then unbans the rest. The exit code is 1 if a
+--max-* limit is broken or a check fails (counted in `errors`).
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from constants import ALL_DAYS
+from models.esports.scrims import Scrim, ScrimBan
+from cogs.esports.events.scrims import ScrimAutomation
+
+from . import fakes
+from .harness import QueryCounter, base_parser, close_db, init_db, make_bot, report
+
+
+async def run_bans(db_url: str, users: int, expire_after: float) -> dict:
+    await init_db(db_url)
+
+    guild = fakes.FakeGuild()
+    channel = guild.add_channel(name="register")
+    scrim = await Scrim.create(
+        guild_id=guild.id, host_id=guild.me.id, title="Ban list",
+        scrim_time=datetime.now(timezone.utc), scrim_days=ALL_DAYS, is_open=True, reg_channel_id=channel.id,
+    )
+
+    bot = await make_bot([guild])
+    cog = ScrimAutomation(bot)
+    await bot.add_cog(cog)  # starts registration, which loads the (empty) ban list
+    bans = cog.bans
+    registration = cog.registrations.get(scrim.id)
+
+    user_ids = [fakes.snowflake() for _ in range(users)]
+    temporary, permanent = user_ids[: users // 2], user_ids[users // 2:]
+    expires_at = datetime.now(timezone.utc) + timedelta(seconds=expire_after)
+
+    errors = 0
+    with QueryCounter() as ban_queries:
+        started = time.perf_counter()
+        await bans.ban(scrim, temporary, guild.me.id, reason="stress", expires_at=expires_at)
+        await bans.ban(scrim, permanent, guild.me.id, reason="stress")
+        ban_seconds = time.perf_counter() - started
+
+    errors += registration.banned != set(user_ids)
+    errors += await ScrimBan.filter(scrim_id=scrim.id).count() != users
+
+    started = time.perf_counter()
+    checks = sum([user_id in registration.banned for user_id in user_ids * 100])
+    check_us = (time.perf_counter() - started) / (users * 100) * 1e6
+    errors += checks != users * 100
+
+    await asyncio.sleep(expire_after + 0.5)
+    errors += registration.banned != set(permanent)
+    errors += await ScrimBan.filter(scrim_id=scrim.id).count() != len(permanent)
+
+    with QueryCounter() as unban_queries:
+        started = time.perf_counter()
+        lifted = await bans.unban(scrim, permanent, guild.me.id)
+        unban_seconds = time.perf_counter() - started
+
+    errors += len(lifted) != len(permanent)
+    errors += bool(registration.banned) or await ScrimBan.filter(scrim_id=scrim.id).exists()
+
+    await bot.remove_cog(cog.qualified_name)
+    await bot.scrim_writes.close()
+    await Scrim.filter(id=scrim.id).delete()
+    await close_db()
+
+    return {
+        "name": f"users={users}",
+        "ban_seconds": ban_seconds,
+        "ban_queries": ban_queries.count,
+        "unban_seconds": unban_seconds,
+        "unban_queries": unban_queries.count,
+        "check_us": check_us,
+        "errors": errors,
+    }
+
+
+async def main():
+    parser = base_parser("Bulk scrim ban/unban and ban expiry benchmark.")
+    parser.add_argument("--users", type=int, nargs="+", default=[100, 500], help="users banned at once")
+    parser.add_argument("--expire-after", type=float, default=1.0, help="seconds until the temporary bans expire")
+    parser.add_argument("--max-ban-queries", type=float)
+    args = parser.parse_args()
+
+    results = [await run_bans(args.db, users, args.expire_after) for users in args.users]
+    raise SystemExit(report(results, {"max_ban_queries": args.max_ban_queries, "max_errors": 0}, as_json=args.json))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
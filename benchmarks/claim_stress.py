@@ -0,0 +1,134 @@
+"""
+Stress test for slot cancel/claim on a closed scrim, offline.
+
+    python -m benchmarks.claim_stress --claimers 500 --cancels 10 --reserves 3
+    python -m benchmarks.claim_stress --db "asyncpg://postgres@localhost/me_bench" --claimers 1000
+
+A full scrim is created, some of its teams cancel at the same time (the first
+freed slots go to the reserves, oldest first) and then every claimer clicks
+"claim" at once, some of them twice. Afterwards the slots are checked: every
+freed slot must end up with exactly one team, nobody may hold two slots and
+the reserves must have been served in order. Any violation is counted in
+`errors` and makes the exit code 1.
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from constants import ALL_DAYS
+from models.esports.scrims import Scrim, ScrimReserve, ScrimSlot
+from cogs.esports.events.scrims import ScrimAutomation
+from cogs.esports.helper.claims import SlotClaims, SlotHeld
+
+from . import fakes
+from .harness import QueryCounter, base_parser, close_db, init_db, make_bot, report
+
+
+async def click(claims: SlotClaims, scrim: Scrim, member: fakes.FakeMember):
+    try:
+        return await claims.claim(scrim, member)
+    except SlotHeld:
+        return None
+
+
+async def run_stress(db_url: str, slots: int, cancels: int, reserves: int, claimers: int) -> dict:
+    await init_db(db_url)
+    fakes.calls.clear()
+
+    guild = fakes.FakeGuild()
+    channel = guild.add_channel(name="register")
+    slotlist = guild.add_channel(name="slotlist")
+    scrim = await Scrim.create(
+        guild_id=guild.id, host_id=guild.me.id, title="Claim stress",
+        scrim_time=datetime.now(timezone.utc), scrim_days=ALL_DAYS,
+        total_slots=slots, is_open=False,
+        reg_channel_id=channel.id, slotlist_channel_id=slotlist.id, slotlist_message_id=fakes.snowflake(),
+    )
+
+    leaders = [fakes.FakeMember(guild, name=f"leader{n}") for n in range(1, slots + 1)]
+    await ScrimSlot.bulk_create([
+        ScrimSlot(scrim_id=scrim.id, slot_no=n, user_id=leader.id, team_name=f"Team {n}", members=[leader.id])
+        for n, leader in enumerate(leaders, start=1)
+    ])
+    waiting = [fakes.FakeMember(guild, name=f"reserve{n}") for n in range(reserves)]
+    for n, member in enumerate(waiting):
+        # One at a time, so created_at gives them a definite order.
+        await ScrimReserve.create(scrim_id=scrim.id, user_id=member.id, team_name=f"Reserve {n}", members=[member.id])
+
+    bot = await make_bot([guild])
+    cog = ScrimAutomation(bot)
+    await bot.add_cog(cog)
+    claims = cog.claims
+
+    crowd = [fakes.FakeMember(guild, name=f"claimer{n}") for n in range(claimers)]
+    # Every tenth claimer double-clicks.
+    clicks = crowd + crowd[::10]
+
+    with QueryCounter() as queries:
+        started = time.perf_counter()
+        released = await asyncio.gather(*(claims.cancel(scrim, leader.id) for leader in leaders[:cancels]))
+        cancel_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        claimed = await asyncio.gather(*(click(claims, scrim, member) for member in clicks))
+        claim_seconds = time.perf_counter() - started
+        await bot.outbound.drain()
+
+    rows = await ScrimSlot.filter(scrim_id=scrim.id)
+    left = await ScrimReserve.filter(scrim_id=scrim.id).values_list("user_id", flat=True)
+
+    freed = [slot for result in released for slot, _ in result]
+    to_reserves = [reserve.user_id for result in released for _, reserve in result if reserve]
+    served = min(cancels, reserves)
+    crowd_ids = {member.id for member in crowd}
+    winners = [slot for slot in claimed if slot]
+    holders = [row.user_id for row in rows if row.user_id is not None]
+
+    errors = 0
+    errors += len(freed) != cancels                                                # every cancel freed its slot
+    errors += sorted(to_reserves) != sorted(m.id for m in waiting[:served])       # oldest reserves first
+    errors += list(left) != [m.id for m in waiting[served:]]
+    errors += len(winners) != min(cancels - served, claimers)                      # one winner per free slot
+    errors += len({slot.slot_no for slot in winners}) != len(winners)
+    errors += len(holders) != len(set(holders))                                    # nobody holds two slots
+    errors += len(rows) != slots
+    errors += sum(row.user_id is None for row in rows) != max(cancels - served - claimers, 0)
+    errors += len({row.user_id for row in rows} & crowd_ids) != len(winners)
+
+    await bot.remove_cog(cog.qualified_name)
+    await bot.scrim_writes.close()
+    await Scrim.filter(id=scrim.id).delete()
+    await close_db()
+
+    stats = claims.stats()
+    return {
+        "name": f"slots={slots} cancels={cancels} reserves={reserves} claimers={claimers}",
+        "cancel_seconds": cancel_seconds,
+        "claim_seconds": claim_seconds,
+        "clicks": len(clicks),
+        "claimed": len(winners),
+        "conflicts": stats["conflicts"],
+        "claim_p99_ms": stats["p99_ms"],
+        "queries": queries.count,
+        "slotlist_edits": fakes.calls["edit"],
+        "errors": errors,
+    }
+
+
+async def main():
+    parser = base_parser("Concurrent slot cancel/claim stress test.")
+    parser.add_argument("--slots", type=int, default=25, help="slots of the (full) scrim")
+    parser.add_argument("--cancels", type=int, nargs="+", default=[1, 10], help="teams that cancel at once")
+    parser.add_argument("--reserves", type=int, default=3, help="teams on the reserve list")
+    parser.add_argument("--claimers", type=int, default=500, help="users clicking claim at once")
+    args = parser.parse_args()
+
+    results = [
+        await run_stress(args.db, args.slots, min(cancels, args.slots), args.reserves, args.claimers)
+        for cancels in args.cancels
+    ]
+    raise SystemExit(report(results, {"max_errors": 0}, as_json=args.json))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+Measures rendering the scrims manager dashboard, offline.
+
+    python -m benchmarks.dashboard --scrims 10 100 1000 --renders 200
+
+Renders go through ScrimManagerView.render like the smanager command does:
+once cold (right after the guild's dashboard was invalidated) and then warm
+from the dashboard cache, flipping through every page.
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from models.esports.scrims import Scrim
+from cogs.esports.helper.dashboard import dashboards
+from cogs.esports.helper.registration import percentile
+from cogs.esports.views.scrims.manager import ScrimManagerView
+
+from . import fakes
+from .harness import QueryCounter, base_parser, close_db, init_db, make_bot, report
+
+
+async def run(db_url: str, scrims: int, renders: int) -> dict:
+    await init_db(db_url)
+
+    guild = fakes.FakeGuild()
+    await Scrim.bulk_create([
+        Scrim(
+            guild_id=guild.id, host_id=guild.me.id, title=f"Scrim {i}",
+            scrim_time=datetime.now(timezone.utc), scrim_days=0b0010101,
+            total_slots=25, is_open=False, reg_channel_id=fakes.snowflake(),
+        )
+        for i in range(scrims)
+    ])
+    bot = await make_bot([guild])
+    user = fakes.FakeMember(guild, name="admin")
+
+    cold, warm = [], []
+    with QueryCounter() as queries:
+        for i in range(renders):
+            if i % 10 == 0:
+                dashboards.invalidate(guild.id)
+                samples = cold
+            else:
+                samples = warm
+
+            started = time.perf_counter()
+            embed, view = await ScrimManagerView.render(bot, guild.id, user, page=i)
+            samples.append(time.perf_counter() - started)
+            view.stop()
+
+    await bot.scrim_writes.close()
+    await close_db()
+
+    return {
+        "name": f"scrims={scrims}",
+        "renders": renders,
+        "cold_p50_ms": percentile(cold, 50) * 1000,
+        "warm_p50_ms": percentile(warm, 50) * 1000,
+        "warm_p99_ms": percentile(warm, 99) * 1000,
+        "queries": queries.count,
+        "queries_per_render": queries.count / renders,
+    }
+
+
+async def main():
+    parser = base_parser("Offline scrims dashboard benchmark.")
+    parser.add_argument("--scrims", type=int, nargs="+", default=[10, 100, 1000], help="scrims in the guild")
+    parser.add_argument("--renders", type=int, default=200)
+    parser.add_argument("--max-warm-p99-ms", type=float)
+    parser.add_argument("--max-queries-per-render", type=float)
+    args = parser.parse_args()
+
+    results = [await run(args.db, scrims, args.renders) for scrims in args.scrims]
+    limits = {"max_warm_p99_ms": args.max_warm_p99_ms, "max_queries_per_render": args.max_queries_per_render}
+    raise SystemExit(report(results, limits, as_json=args.json))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+"""
+Minimal stand-ins for the discord.py objects the registration path touches.
+
+They only implement what ME actually reads or calls, and every API call is a
+no-op coroutine that is counted, so a benchmark can tell how much Discord
+traffic a burst would have caused.
+"""
+import itertools
+from collections import Counter
+from typing import Dict, List, Optional
+
+_ids = itertools.count(900_000_000_000_000_000)
+
+# Discord API calls the fakes "made", by method name.
+calls: Counter = Counter()
+
+
+def snowflake() -> int:
+    return next(_ids)
+
+
+class FakeAsset:
+    url = "https://cdn.discordapp.com/embed/avatars/0.png"
+
+
+class FakeUser:
+    def __init__(self, user_id: Optional[int] = None, name: str = "player", bot: bool = False):
+        self.id = user_id or snowflake()
+        self.name = name
+        self.display_name = name
+        self.bot = bot
+        self.mention = f"<@{self.id}>"
+        self.display_avatar = FakeAsset()
+
+    def __str__(self) -> str:
+        return self.name
+
+    async def send(self, content: Optional[str] = None, **kwargs):
+        calls["dm"] += 1
+
+
+class FakeMember(FakeUser):
+    def __init__(self, guild: "FakeGuild", **kwargs):
+        super().__init__(**kwargs)
+        self.guild = guild
+
+    async def add_roles(self, *roles, reason: Optional[str] = None):
+        calls["add_roles"] += 1
+
+
+class FakeRole:
+    def __init__(self, guild: "FakeGuild", role_id: Optional[int] = None, name: str = "role"):
+        self.id = role_id or snowflake()
+        self.guild = guild
+        self.name = name
+        self.mention = f"<@&{self.id}>"
+
+
+class FakeChannel:
+    def __init__(self, guild: "FakeGuild", channel_id: Optional[int] = None, name: str = "channel"):
+        self.id = channel_id or snowflake()
+        self.guild = guild
+        self.name = name
+        self.mention = f"<#{self.id}>"
+
+    async def send(self, content: Optional[str] = None, **kwargs) -> "FakeMessage":
+        calls["send"] += 1
+        return FakeMessage(self, self.guild.me, content or "")
+
+    def get_partial_message(self, message_id: int) -> "FakeMessage":
+        message = FakeMessage(self, self.guild.me, "")
+        message.id = message_id
+        return message
+
+
+class FakeGuild:
+    def __init__(self, guild_id: Optional[int] = None, name: str = "guild"):
+        self.id = guild_id or snowflake()
+        self.name = name
+        self.channels: Dict[int, FakeChannel] = {}
+        self.roles: Dict[int, FakeRole] = {}
+        self.me = FakeMember(self, name="ME", bot=True)
+
+    def add_channel(self, **kwargs) -> FakeChannel:
+        channel = FakeChannel(self, **kwargs)
+        self.channels[channel.id] = channel
+        return channel
+
+    def add_role(self, **kwargs) -> FakeRole:
+        role = FakeRole(self, **kwargs)
+        self.roles[role.id] = role
+        return role
+
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:
+        return self.channels.get(channel_id)
+
+    def get_role(self, role_id: int) -> Optional[FakeRole]:
+        return self.roles.get(role_id)
+
+
+class FakeMessage:
+    def __init__(self, channel: FakeChannel, author: FakeUser, content: str, mentions: Optional[List[FakeUser]] = None):
+        self.id = snowflake()
+        self.channel = channel
+        self.guild = channel.guild
+        self.author = author
+        self.content = content
+        self.mentions = mentions or []
+
+    async def add_reaction(self, emoji: str):
+        calls["add_reaction"] += 1
+
+    async def edit(self, **kwargs) -> "FakeMessage":
+        calls["edit"] += 1
+        return self
+
+    async def reply(self, content: Optional[str] = None, **kwargs) -> "FakeMessage":
+        calls["reply"] += 1
+        return FakeMessage(self.channel, self.guild.me, content or "")
+
+
+def registration_message(channel: FakeChannel, team_no: int, teammates: int = 4) -> FakeMessage:
+    """A typical registration: team name on the first line, then the teammates' mentions."""
+    guild = channel.guild
+    leader = FakeMember(guild, name=f"leader{team_no}")
+    members = [FakeMember(guild, name=f"player{team_no}_{i}") for i in range(teammates - 1)]
+    content = f"Team Name: Team {team_no}\n" + " ".join(m.mention for m in [leader, *members])
+    return FakeMessage(channel, leader, content, mentions=[leader, *members])
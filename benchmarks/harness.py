@@ -0,0 +1,116 @@
+"""
+Shared plumbing for the offline benchmarks: database setup, a query counter
+and a bot wired to fake guilds instead of the gateway.
+
+The benchmarks import the real bot, so a config.py must be importable; a copy
+of config-example.py is enough because the database settings are overridden.
+"""
+import argparse
+import json
+import sys
+import tempfile
+from typing import Dict, Iterable, List, Optional
+
+from tortoise import Tortoise
+
+from core.Bot import ME
+from core.db import metrics as db_metrics
+from core.writebehind import ScrimWriteBuffer
+
+from .fakes import FakeGuild
+
+MODELS = ["models.misc.guild", "models.esports.scrims"]
+
+
+# --- Database ---
+async def init_db(db_url: str, create_schema: bool = True):
+    await Tortoise.init(db_url=db_url, modules={"models": MODELS})
+    if create_schema:
+        await Tortoise.generate_schemas(safe=True)
+
+
+async def close_db():
+    await Tortoise.close_connections()
+
+
+class QueryCounter:
+    """
+    Counts statements sent to the database while it is active. The counts
+    come from the bot's DatabaseMetrics (`core.db.metrics`), which already
+    wraps the execute methods of every Tortoise client class and counts
+    nested calls once; this only observes it.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def _observe(self, kind: str, ms: float):
+        self.count += 1
+
+    def install(self):
+        db_metrics.install()
+        db_metrics.observers.append(self._observe)
+
+    def uninstall(self):
+        if self._observe in db_metrics.observers:
+            db_metrics.observers.remove(self._observe)
+
+    def __enter__(self) -> "QueryCounter":
+        self.install()
+        return self
+
+    def __exit__(self, *exc):
+        self.uninstall()
+
+
+# --- Bot ---
+async def make_bot(guilds: Iterable[FakeGuild]) -> ME:
+    """A bot that never connects; its cache lookups are answered by the fake guilds."""
+    bot = ME()
+    await bot._async_setup_hook()  # binds the bot to the running loop, as login() would
+    guilds = {guild.id: guild for guild in guilds}
+    channels = {channel.id: channel for guild in guilds.values() for channel in guild.channels.values()}
+
+    bot.get_guild = guilds.get
+    bot.get_channel = channels.get
+    bot.scrim_writes = ScrimWriteBuffer(tempfile.mkdtemp(prefix="me-bench-"), interval=0.25)
+    bot.scrim_writes.start()
+    return bot
+
+
+# --- Reporting ---
+def base_parser(description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--db", default="sqlite://:memory:", help="Tortoise database URL")
+    parser.add_argument("--json", action="store_true", help="print results as JSON lines")
+    return parser
+
+
+def report(results: List[dict], limits: Dict[str, Optional[float]], as_json: bool = False) -> int:
+    """
+    Prints the results and returns the exit code: 1 if any result is outside
+    its limit. Limits named `max_<key>` cap a value, `min_<key>` set a floor.
+    """
+    failures = []
+    for result in results:
+        for name, limit in limits.items():
+            if limit is None:
+                continue
+            kind, key = name.split("_", 1)
+            value = result.get(key)
+            if value is None:
+                continue
+            if (kind == "max" and value > limit) or (kind == "min" and value < limit):
+                failures.append(f"{result['name']}: {key} = {value:.2f} (limit {kind} {limit})")
+
+        if as_json:
+            print(json.dumps(result))
+        else:
+            print(f"{result['name']}:")
+            for key, value in result.items():
+                if key != "name":
+                    print(f"  {key:>22}: {value:.2f}" if isinstance(value, float) else f"  {key:>22}: {value}")
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
@@ -0,0 +1,104 @@
+"""
+Replays a registration burst against the real message path, offline.
+
+    python -m benchmarks.registration --burst 100 1000 5000 --scrims 10
+    python -m benchmarks.registration --burst 2000 --max-p99-ms 250 --max-queries-per-reg 0.5
+
+Every message goes through ME.on_message, the ScrimAutomation cog and the
+registration engine, and is written through the write-behind buffer to the
+database given by --db (SQLite in memory by default). The exit code is 1 if a
+--max-* / --min-* limit is broken, so the script can gate CI.
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from constants import ALL_DAYS
+from models.esports.scrims import Scrim, ScrimSlot
+from cogs.esports.events.scrims import ScrimAutomation
+from cogs.esports.helper.registration import percentile
+
+from . import fakes
+from .harness import QueryCounter, base_parser, close_db, init_db, make_bot, report
+
+
+async def run_burst(db_url: str, burst: int, scrims: int, timeout: float) -> dict:
+    await init_db(db_url)
+    fakes.calls.clear()
+
+    guild = fakes.FakeGuild()
+    slots_per_scrim = -(-burst // scrims)
+    channels = []
+    for i in range(scrims):
+        channel = guild.add_channel(name=f"register-{i}")
+        slotlist = guild.add_channel(name=f"slotlist-{i}")
+        channels.append(channel)
+        await Scrim.create(
+            guild_id=guild.id, host_id=guild.me.id, title=f"Scrim {i}",
+            scrim_time=datetime.now(timezone.utc), scrim_days=ALL_DAYS,
+            total_slots=slots_per_scrim, is_open=True,
+            reg_channel_id=channel.id, slotlist_channel_id=slotlist.id,
+        )
+
+    bot = await make_bot([guild])
+    cog = ScrimAutomation(bot)
+    await bot.add_cog(cog)  # resumes registration for the open scrims
+
+    messages = [fakes.registration_message(channels[i % scrims], i) for i in range(burst)]
+
+    with QueryCounter() as queries:
+        started = time.perf_counter()
+        for message in messages:
+            await bot.on_message(message)
+
+        deadline = started + timeout
+        while cog.registrations.channels and time.perf_counter() < deadline:
+            await asyncio.sleep(0.005)
+        await bot.outbound.drain()
+        await bot.scrim_writes.flush()
+        elapsed = time.perf_counter() - started
+
+    samples = list(cog.registrations.latencies)
+    registered = await ScrimSlot.all().count()
+
+    await bot.remove_cog(cog.qualified_name)
+    await bot.scrim_writes.close()
+    await close_db()
+
+    return {
+        "name": f"burst={burst} scrims={scrims}",
+        "registered": registered,
+        "seconds": elapsed,
+        "throughput": registered / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "queries": queries.count,
+        "queries_per_reg": queries.count / max(registered, 1),
+        "api_calls_per_reg": sum(fakes.calls.values()) / max(registered, 1),
+        "slotlist_edits": fakes.calls["edit"],
+        "timed_out": int(registered < burst),
+    }
+
+
+async def main():
+    parser = base_parser("Offline registration burst benchmark.")
+    parser.add_argument("--burst", type=int, nargs="+", default=[100, 1000, 5000], help="messages per burst")
+    parser.add_argument("--scrims", type=int, default=10, help="open scrims the burst is spread over")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds to wait for a burst to drain")
+    parser.add_argument("--max-p99-ms", type=float)
+    parser.add_argument("--max-queries-per-reg", type=float)
+    parser.add_argument("--min-throughput", type=float, help="registrations per second")
+    args = parser.parse_args()
+
+    results = [await run_burst(args.db, burst, args.scrims, args.timeout) for burst in args.burst]
+    limits = {
+        "max_p99_ms": args.max_p99_ms,
+        "max_queries_per_reg": args.max_queries_per_reg,
+        "min_throughput": args.min_throughput,
+        "max_timed_out": 0,
+    }
+    raise SystemExit(report(results, limits, as_json=args.json))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
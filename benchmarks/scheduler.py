@@ -0,0 +1,50 @@
+"""
+Times a scheduler rebuild, as done once on startup for every scrim.
+
+    python -m benchmarks.scheduler --scrims 1000 10000 100000 --max-ms 500
+"""
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+
+import pytz
+
+from cogs.esports.helper.scheduler import ScrimScheduler
+from constants import IST
+
+from .harness import base_parser, report
+
+
+async def noop(scrim_id: int):
+    pass
+
+
+def run(scrims: int, repeat: int) -> dict:
+    rng = random.Random(scrims)
+    start = datetime(2026, 1, 1, tzinfo=pytz.utc)
+    rows = [(i, start + timedelta(seconds=rng.randrange(86400)), rng.randrange(1, 128), IST) for i in range(scrims)]
+
+    scheduler = ScrimScheduler(noop)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        scheduler.rebuild(rows)
+        samples.append(time.perf_counter() - started)
+
+    return {"name": f"scrims={scrims}", "scheduled": len(scheduler), "ms": min(samples) * 1000}
+
+
+async def main():
+    parser = base_parser("Scheduler rebuild benchmark.")
+    parser.add_argument("--scrims", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-ms", type=float)
+    args = parser.parse_args()
+
+    results = [run(scrims, args.repeat) for scrims in args.scrims]
+    raise SystemExit(report(results, {"max_ms": args.max_ms}, as_json=args.json))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""
+Compares parse_time against the implementation it replaced.
+
+    python -m benchmarks.time_parser --iterations 20000 --min-speedup 5
+"""
+import asyncio
+import re
+import time
+from datetime import datetime, timedelta
+
+import pytz
+from dateutil.parser import parse
+
+from cogs.esports.helper.time_parser import _parse_normalized, parse_time, parse_times
+
+from .harness import base_parser, report
+
+INPUTS = ["5pm", "4:00am", "13:00", "2h", "30m", "1d", "11:30 PM", "9am", "00:15", "5:30 p.m."]
+
+LEGACY_IST = pytz.timezone("Asia/Kolkata")
+
+
+def legacy_parse_time(time_str: str) -> datetime:
+    """The original implementation: a regex compiled per call, then dateutil's fuzzy parser."""
+    now_utc = datetime.now(pytz.utc)
+    now_ist = now_utc.astimezone(LEGACY_IST)
+
+    relative_match = re.match(r"(\d+)\s*(d|h|m)$", time_str.lower())
+    if relative_match:
+        value = int(relative_match.group(1))
+        unit = relative_match.group(2)
+        if unit == 'd':
+            return now_utc + timedelta(days=value)
+        elif unit == 'h':
+            return now_utc + timedelta(hours=value)
+        elif unit == 'm':
+            return now_utc + timedelta(minutes=value)
+
+    parsed_time = parse(time_str, fuzzy=True)
+    scrim_time_ist = now_ist.replace(hour=parsed_time.hour, minute=parsed_time.minute, second=0, microsecond=0)
+    if scrim_time_ist < now_ist:
+        scrim_time_ist += timedelta(days=1)
+    return scrim_time_ist.astimezone(pytz.utc)
+
+
+def timed(func, iterations: int) -> float:
+    """Microseconds per parse."""
+    started = time.perf_counter()
+    for i in range(iterations):
+        func(INPUTS[i % len(INPUTS)])
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def check_equivalence():
+    """The new parser must land on the same minute as the legacy one for every sample input."""
+    for text in INPUTS:
+        old, new = legacy_parse_time(text), parse_time(text)
+        if abs((old - new).total_seconds()) >= 60:
+            raise SystemExit(f"parse_time({text!r}) = {new}, legacy gave {old}")
+
+
+async def main():
+    parser = base_parser("parse_time microbenchmark.")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--min-speedup", type=float, help="required legacy / warm ratio")
+    args = parser.parse_args()
+
+    check_equivalence()
+
+    legacy = timed(legacy_parse_time, args.iterations)
+
+    def cold(text):
+        _parse_normalized.cache_clear()
+        return parse_time(text)
+
+    uncached = timed(cold, args.iterations)
+    warm = timed(parse_time, args.iterations)
+
+    started = time.perf_counter()
+    rounds = max(1, args.iterations // len(INPUTS))
+    for _ in range(rounds):
+        parse_times(INPUTS)
+    bulk = (time.perf_counter() - started) / (rounds * len(INPUTS)) * 1e6
+
+    result = {
+        "name": f"parse_time x{args.iterations}",
+        "legacy_us": legacy,
+        "uncached_us": uncached,
+        "cached_us": warm,
+        "bulk_us": bulk,
+        "speedup": legacy / warm,
+    }
+    raise SystemExit(report([result], {"min_speedup": args.min_speedup}, as_json=args.json))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,19 +1,133 @@
-from discord.ext import commands, tasks
+from datetime import timezone, tzinfo
+
+import discord
+from discord.ext import commands
 from core.Bot import ME
+from core.telemetry import log
+from models.esports.scrims import Scrim
+from constants import EsportsLog, RegMsg
+
+from ..helper.bans import ScrimBans
+from ..helper.claims import SlotClaims
+from ..helper.registration import RegistrationEngine, log_event
+from ..helper.dashboard import dashboards
+from ..helper.scheduler import ScrimScheduler, as_utc, next_occurrence
+from ..views.scrims.registration import RegistrationView, ScrimButton
+
 
 class ScrimAutomation(commands.Cog):
     def __init__(self, bot: ME):
         self.bot = bot
-        # In the future, we will start a background task here.
-        # self.auto_open_scrims.start()
+        # Scrims are kept in a timer queue keyed on their next open time,
+        # so we wake up exactly when something is due instead of polling.
+        self.scheduler = ScrimScheduler(self.open_scrim)
+        self.bans = ScrimBans(bot)
+        self.registrations = RegistrationEngine(bot, on_full=self.close_scrim, bans=self.bans)
+        self.claims = SlotClaims(bot, self.registrations.slotlists)
+
+    async def cog_load(self):
+        # In cluster mode each process only schedules the guilds on its own shards.
+        rows = await Scrim.all().values_list("id", "guild_id", "scrim_time", "scrim_days")
+        self.scheduler.rebuild([
+            (scrim_id, scrim_time, scrim_days, self.bot.timezones.get(guild_id))
+            for scrim_id, guild_id, scrim_time, scrim_days in rows
+            if self.bot.owns_guild(guild_id)
+        ])
+        self.scheduler.start()
+        log.info("Scheduled %d scrims.", len(self.scheduler))
+        await self.bans.start()
+
+        # Resume registration for scrims that were open when the bot went down.
+        for scrim in await Scrim.filter(is_open=True, reg_channel_id__isnull=False):
+            if self.bot.owns_guild(scrim.guild_id):
+                await self.registrations.start(scrim)
+
+    async def cog_unload(self):
+        self.scheduler.stop()
+        self.bans.stop()
+        for registration in list(self.registrations.channels.values()):
+            await self.registrations.stop(registration.scrim.id)
+
+    def arm(self, scrim: Scrim):
+        """(Re)schedules the next open of a scrim."""
+        tz = self.bot.timezones.get(scrim.guild_id)
+        self.scheduler.arm(scrim.id, next_occurrence(scrim.scrim_time, scrim.scrim_days, tz=tz))
+
+    async def open_scrim(self, scrim_id: int):
+        """Opens registration for a scrim and schedules its next occurrence."""
+        await self.bot.wait_until_ready()
+
+        scrim = await Scrim.get_or_none(id=scrim_id)
+        if not scrim:
+            return
+
+        self.arm(scrim)
+
+        # Each open starts a fresh registration round.
+        self.bot.scrim_writes.update(scrim, is_open=True)
+        self.bot.scrim_writes.reset_slots(scrim.id)
+
+        channel = self.bot.get_channel(scrim.reg_channel_id)
+        if channel:
+            embed = self.bot.embed(title=RegMsg.sopen.value, description=scrim.open_message)
+            content = f"<@&{scrim.ping_role_id}>" if scrim.ping_role_id else None
+            self.bot.outbound.send(channel, content=content, embed=embed, view=RegistrationView(scrim.id))
+        log_event(self.bot, scrim, EsportsLog.open, f"Registration opened in <#{scrim.reg_channel_id}>.")
+
+        await self.registrations.start(scrim, new_round=True)
+        self.bot.dispatch("scrim_open", scrim)
+
+    async def close_scrim(self, scrim: Scrim):
+        """Stops registration for a scrim, e.g. once every slot is filled."""
+        await self.registrations.stop(scrim.id)
+
+        self.bot.scrim_writes.update(scrim, is_open=False)
+
+        channel = self.bot.get_channel(scrim.reg_channel_id)
+        if channel:
+            embed = self.bot.embed(title=RegMsg.sclose.value, description="All slots have been filled.")
+            self.bot.outbound.send(channel, embed=embed)
+        log_event(self.bot, scrim, EsportsLog.closed, "All slots have been filled.")
+
+        self.bot.dispatch("scrim_close", scrim)
+
+    # --- Listeners ---
+    @commands.Cog.listener()
+    async def on_registration_message(self, message: discord.Message):
+        # Messages from ME.reg_channels; the engine keeps that set in sync.
+        self.registrations.submit(message)
+
+    @commands.Cog.listener()
+    async def on_scrim_create(self, scrim: Scrim):
+        self.arm(scrim)
+
+    @commands.Cog.listener()
+    async def on_scrim_update(self, scrim: Scrim):
+        self.arm(scrim)
+        # Pick up edited rules or a new registration channel without losing the round.
+        self.registrations.update(scrim)
+
+    @commands.Cog.listener()
+    async def on_guild_timezone_update(self, guild_id: int, old_tz: tzinfo, new_tz: tzinfo):
+        # Keep every scrim at the same wall-clock time, now read in the new timezone.
+        scrims = await Scrim.filter(guild_id=guild_id)
+        for scrim in scrims:
+            wall = as_utc(scrim.scrim_time).astimezone(old_tz).replace(tzinfo=new_tz)
+            scrim.scrim_time = wall.astimezone(timezone.utc)
+            self.arm(scrim)
+        if scrims:
+            await Scrim.bulk_update(scrims, fields=["scrim_time"])
+            dashboards.invalidate(guild_id)
+
+    @commands.Cog.listener()
+    async def on_scrim_delete(self, scrim: Scrim):
+        self.scheduler.cancel(scrim.id)
+        self.bans.expiry.cancel(scrim.id)
+        await self.registrations.stop(scrim.id)
+        self.bot.scrim_writes.forget(scrim.id)
 
-    # @tasks.loop(minutes=1)
-    # async def auto_open_scrims(self):
-    #     """
-    #     This background task will run every minute to check for scrims
-    #     that need to have their registration opened or closed automatically.
-    #     """
-    #     pass
 
 async def setup(bot: ME):
+    # Buttons of registration messages, including ones posted before a restart.
+    bot.add_dynamic_items(ScrimButton)
     await bot.add_cog(ScrimAutomation(bot))
@@ -0,0 +1,173 @@
+import re
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+import discord
+from tortoise.transactions import in_transaction
+
+from constants import ScrimBanType
+from models.esports.scrims import Scrim, ScrimBan
+
+from .registration import log_event
+from .scheduler import ScrimScheduler, as_utc
+
+if TYPE_CHECKING:
+    from core.Bot import ME
+
+USER_RE = re.compile(r"<@!?(\d{15,20})>|\b(\d{15,20})\b")
+DURATION_RE = re.compile(r"\b(\d{1,4})\s*(m|h|d|w)\b", re.IGNORECASE)
+DURATION_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+# Mentions listed in one log entry; the rest are counted.
+LOG_MENTIONS = 40
+
+
+def parse_targets(text: str) -> Tuple[List[int], Optional[timedelta], Optional[str]]:
+    """
+    Splits ban input into user IDs, an optional duration ("30m", "12h", "7d", "2w")
+    and whatever is left as the reason. Raises ValueError for a zero duration.
+    """
+    user_ids = list(dict.fromkeys(int(a or b) for a, b in USER_RE.findall(text)))
+    rest = USER_RE.sub(" ", text)
+
+    duration = None
+    if match := DURATION_RE.search(rest):
+        amount, unit = match.groups()
+        if not int(amount):
+            raise ValueError(f"`{match.group(0)}` is not a valid duration.")
+        duration = timedelta(**{DURATION_UNITS[unit.lower()]: int(amount)})
+        rest = rest[:match.start()] + rest[match.end():]
+
+    reason = " ".join(rest.split())[:200] or None
+    return user_ids, duration, reason
+
+
+def _mentions(user_ids: List[int]) -> str:
+    shown = " ".join(f"<@{user_id}>" for user_id in user_ids[:LOG_MENTIONS])
+    if len(user_ids) > LOG_MENTIONS:
+        shown += f" and {len(user_ids) - LOG_MENTIONS} more"
+    return shown
+
+
+class ScrimBans:
+    """
+    The scrim ban lists of the guilds this process runs.
+
+    Bans live in scrim_bans, one row per (scrim, user) with the guild beside
+    it. While a scrim's registration is running its banned user IDs are also
+    held in a set, which the registration checks, so a ban check is a set
+    lookup and a ban or unban shows up in it right away.
+
+    Bans with an expiry are not filtered on read; instead each scrim is armed
+    in a timer queue at its earliest expiry and the passed bans are deleted
+    when it fires.
+    """
+
+    def __init__(self, bot: "ME"):
+        self.bot = bot
+        self.banned: Dict[int, Set[int]] = {}  # scrim_id -> banned user IDs, for scrims with open registration
+        self.expiry = ScrimScheduler(self._expire)
+
+    async def start(self):
+        """Arms the expiry of every temporary ban in this process's guilds."""
+        rows = await ScrimBan.filter(expires_at__isnull=False).values_list("scrim_id", "guild_id", "expires_at")
+        earliest: Dict[int, datetime] = {}
+        for scrim_id, guild_id, expires_at in rows:
+            if self.bot.owns_guild(guild_id):
+                expires_at = as_utc(expires_at)
+                earliest[scrim_id] = min(expires_at, earliest.get(scrim_id, expires_at))
+        for scrim_id, expires_at in earliest.items():
+            self.expiry.arm(scrim_id, expires_at)
+        self.expiry.start()
+
+    def stop(self):
+        self.expiry.stop()
+
+    # --- Lookups ---
+    async def load(self, scrim_id: int) -> Set[int]:
+        """Loads the banned user IDs of a scrim whose registration is starting. The set is kept up to date."""
+        banned = self.banned[scrim_id] = set(await ScrimBan.filter(scrim_id=scrim_id).values_list("user_id", flat=True))
+        return banned
+
+    def forget(self, scrim_id: int):
+        self.banned.pop(scrim_id, None)
+
+    async def is_banned(self, scrim_id: int, user_id: int) -> bool:
+        banned = self.banned.get(scrim_id)
+        if banned is not None:
+            return user_id in banned
+        return await ScrimBan.exists(scrim_id=scrim_id, user_id=user_id)
+
+    # --- Changes ---
+    async def ban(self, scrim: Scrim, user_ids: Iterable[int], banned_by: int, reason: Optional[str] = None,
+                  expires_at: Optional[datetime] = None) -> List[int]:
+        """
+        Bans users from a scrim in one transaction, however many there are.
+        Users who are banned already get the new reason and expiry.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return []
+
+        fields = {"banned_by": banned_by, "reason": reason, "expires_at": expires_at}
+        async with in_transaction() as conn:
+            existing = set(
+                await ScrimBan.filter(scrim_id=scrim.id, user_id__in=user_ids).using_db(conn).values_list("user_id", flat=True)
+            )
+            if existing:
+                await ScrimBan.filter(scrim_id=scrim.id, user_id__in=existing).using_db(conn).update(**fields)
+            rows = [ScrimBan(guild_id=scrim.guild_id, scrim_id=scrim.id, user_id=user_id, **fields)
+                    for user_id in user_ids if user_id not in existing]
+            if rows:
+                await ScrimBan.bulk_create(rows, ignore_conflicts=True, using_db=conn)
+
+        if scrim.id in self.banned:
+            self.banned[scrim.id].update(user_ids)
+        if expires_at:
+            due = self.expiry.next_due(scrim.id)
+            if due is None or expires_at < due:
+                self.expiry.arm(scrim.id, expires_at)
+
+        description = f"{_mentions(user_ids)}\nBy: <@{banned_by}>"
+        if reason:
+            description += f"\nReason: {reason}"
+        if expires_at:
+            description += f"\nExpires: {discord.utils.format_dt(expires_at, 'R')}"
+        log_event(self.bot, scrim, ScrimBanType.ban, description)
+        return user_ids
+
+    async def unban(self, scrim: Scrim, user_ids: Iterable[int], unbanned_by: int) -> List[int]:
+        """Lifts the bans of users in one transaction. Returns the users who were banned."""
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return []
+
+        async with in_transaction() as conn:
+            query = ScrimBan.filter(scrim_id=scrim.id, user_id__in=user_ids).using_db(conn)
+            lifted = list(await query.values_list("user_id", flat=True))
+            if lifted:
+                await query.delete()
+
+        if lifted:
+            self.banned.get(scrim.id, set()).difference_update(lifted)
+            log_event(self.bot, scrim, ScrimBanType.unban, f"{_mentions(lifted)}\nBy: <@{unbanned_by}>")
+        return lifted
+
+    async def _expire(self, scrim_id: int):
+        """Deletes a scrim's bans that have run out and arms its next expiry."""
+        now = discord.utils.utcnow()
+        async with in_transaction() as conn:
+            query = ScrimBan.filter(scrim_id=scrim_id, expires_at__lte=now).using_db(conn)
+            expired = list(await query.values_list("user_id", flat=True))
+            if expired:
+                await query.delete()
+
+        upcoming = await ScrimBan.filter(scrim_id=scrim_id, expires_at__isnull=False).order_by("expires_at").first()
+        if upcoming:
+            self.expiry.arm(scrim_id, as_utc(upcoming.expires_at))
+
+        if expired:
+            self.banned.get(scrim_id, set()).difference_update(expired)
+            scrim = await Scrim.get_or_none(id=scrim_id)
+            if scrim:
+                log_event(self.bot, scrim, ScrimBanType.unban, f"{_mentions(expired)}\nBan expired.")
@@ -0,0 +1,186 @@
+import time
+from collections import deque
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+
+import discord
+from tortoise.expressions import Q, Subquery
+from tortoise.transactions import in_transaction
+
+from constants import EsportsLog
+from models.esports.scrims import Scrim, ScrimReserve, ScrimSlot
+
+from .bans import USER_RE
+from .registration import TEAM_NAME_RE, log_event, percentile
+from .slotlist import SlotlistManager
+
+if TYPE_CHECKING:
+    from core.Bot import ME
+
+
+def parse_team(text: str) -> Tuple[List[int], Optional[str]]:
+    """Splits reserve input into user IDs, leader first, and the team name written around them."""
+    user_ids = list(dict.fromkeys(int(a or b) for a, b in USER_RE.findall(text)))
+    rest = " ".join(USER_RE.sub(" ", text).split())
+    if match := TEAM_NAME_RE.search(rest):
+        rest = match.group(1)
+    return user_ids, rest.strip(" :-*_`")[:200] or None
+
+
+class SlotHeld(Exception):
+    """Raised when a user who already has a slot tries to claim another."""
+
+
+class _Conflict(Exception):
+    """Rolls back a hand-over whose slot changed hands in the meantime."""
+
+
+class SlotClaims:
+    """
+    Cancelling and claiming slots once a scrim's registration has closed.
+
+    Every change of a slot's holder is a compare-and-set on the slot's version
+    (see ScrimSlot.swap), so when dozens of users claim the same free slot at
+    once, exactly one UPDATE matches; everybody else reads the free slots
+    again and tries another, until none are left. Nothing is locked beyond the row
+    being updated, and claims for different scrims never wait on each other.
+
+    A cancelled slot goes to the first team on the scrim's reserve list, in the
+    same transaction, so it is never up for claims while a reserve is waiting.
+    The list belongs to one registration round; opening the next round clears
+    it (see ScrimWriteBuffer.reset_slots).
+    """
+
+    def __init__(self, bot: "ME", slotlists: SlotlistManager):
+        self.bot = bot
+        self.slotlists = slotlists
+        self.claims = 0
+        self.conflicts = 0  # swaps that lost the race for a slot
+        self.latencies: "deque[float]" = deque(maxlen=5000)
+        self._claiming: Set[Tuple[int, int]] = set()  # (scrim_id, user_id) of claims in progress
+
+    async def cancel(self, scrim: Scrim, user_id: int) -> List[Tuple[ScrimSlot, Optional[ScrimReserve]]]:
+        """
+        Frees every slot the user registered. Returns each freed slot with the reserve it went to,
+        or None if it is now up for claims. Raises FlushError if buffered writes couldn't be flushed.
+        """
+        # Slots of a round that closed a moment ago may still be in the write buffer.
+        await self.bot.scrim_writes.flush()
+
+        released = []
+        for slot in await ScrimSlot.filter(scrim_id=scrim.id, user_id=user_id):
+            team_name = slot.team_name
+            try:
+                async with in_transaction() as conn:
+                    reserve = await self._take_reserve(scrim.id, conn)
+                    if reserve:
+                        swapped = await ScrimSlot.swap(slot, reserve.user_id, reserve.team_name, reserve.members, using_db=conn)
+                    else:
+                        swapped = await ScrimSlot.swap(slot, None, using_db=conn)
+                    if not swapped:
+                        raise _Conflict()
+            except _Conflict:
+                self.conflicts += 1  # cancelled twice at once; the other cancel handled it
+                continue
+
+            released.append((slot, reserve))
+            log_event(self.bot, scrim, EsportsLog.cancel, f"Slot **{slot.slot_no}**: {team_name} (<@{user_id}>)")
+            if reserve:
+                self._announce_reserve(scrim, slot)
+
+        if released:
+            await self._publish(scrim)
+        return released
+
+    async def _take_reserve(self, scrim_id: int, conn) -> Optional[ScrimReserve]:
+        """Removes and returns the longest-waiting reserve that doesn't hold a slot already."""
+        holders = ScrimSlot.filter(scrim_id=scrim_id, user_id__isnull=False).values("user_id")
+        while True:
+            reserve = await (
+                ScrimReserve.filter(scrim_id=scrim_id)
+                .exclude(user_id__in=Subquery(holders))
+                .order_by("created_at", "id")
+                .using_db(conn)
+                .first()
+            )
+            if reserve is None:
+                return None
+            # Deleting the row is what takes it: of two concurrent cancels only one deletes it.
+            if await ScrimReserve.filter(id=reserve.id).using_db(conn).delete():
+                return reserve
+
+    async def claim(self, scrim: Scrim, user: discord.abc.User) -> Optional[ScrimSlot]:
+        """
+        Gives the user one of the scrim's free slots. None if every free slot was taken first.
+        Raises SlotHeld if the user has a slot already, or is claiming one right now (a double click).
+        """
+        key = (scrim.id, user.id)
+        # ScrimSlot.swap refuses a user who holds a slot, but two of one user's swaps for different
+        # slots could both pass that check before either commits, so a user's claims run one at a time.
+        if key in self._claiming:
+            raise SlotHeld()
+        self._claiming.add(key)
+        try:
+            slot = await self._claim(scrim, user)
+        finally:
+            self._claiming.discard(key)
+
+        if slot:
+            await self._publish(scrim)
+        return slot
+
+    async def _claim(self, scrim: Scrim, user: discord.abc.User) -> Optional[ScrimSlot]:
+        started = time.perf_counter()
+        team_name = f"{user.display_name}'s team"[:200]
+        while True:
+            # The free slots, read together with any the user holds (e.g. one just handed over from the reserves).
+            vacant = await ScrimSlot.filter(Q(user_id__isnull=True) | Q(user_id=user.id), scrim_id=scrim.id).order_by("slot_no")
+            if any(slot.user_id == user.id for slot in vacant):
+                raise SlotHeld()
+            if not vacant:
+                return None
+            # Each user aims at a different free slot, so a crowd spreads out instead of all racing for the first.
+            slot = vacant[user.id % len(vacant)]
+            if await ScrimSlot.swap(slot, user.id, team_name, [user.id]):
+                break
+            # Someone else got it, or the user got another one; the list we read is stale now, so read it again.
+            self.conflicts += 1
+
+        self.claims += 1
+        self.latencies.append(time.perf_counter() - started)
+        log_event(self.bot, scrim, EsportsLog.claim, f"Slot **{slot.slot_no}**: {team_name} ({user.mention})")
+        return slot
+
+    # --- Reserves ---
+    async def add_reserve(self, scrim: Scrim, user_ids: List[int], team_name: str) -> bool:
+        """Puts a team at the end of the scrim's reserve list; the first user leads it. False if they're on it already."""
+        _, created = await ScrimReserve.get_or_create(
+            scrim_id=scrim.id, user_id=user_ids[0], defaults={"team_name": team_name, "members": user_ids},
+        )
+        if created:
+            log_event(self.bot, scrim, EsportsLog.reserve, f"Added {team_name} (<@{user_ids[0]}>)")
+        return created
+
+    async def remove_reserves(self, scrim: Scrim, user_ids: List[int]) -> int:
+        """Takes teams off the scrim's reserve list by their leaders. Returns how many were on it."""
+        removed = await ScrimReserve.filter(scrim_id=scrim.id, user_id__in=user_ids).delete()
+        if removed:
+            log_event(self.bot, scrim, EsportsLog.reserve, "Removed " + " ".join(f"<@{user_id}>" for user_id in user_ids))
+        return removed
+
+    def _announce_reserve(self, scrim: Scrim, slot: ScrimSlot):
+        user = self.bot.get_user(slot.user_id)
+        if user:
+            self.bot.outbound.dm(user, content=f"A slot opened up in {scrim.title}: your team **{slot.team_name}** now has slot **{slot.slot_no}**.")
+        log_event(self.bot, scrim, EsportsLog.claim, f"Slot **{slot.slot_no}**: {slot.team_name} (<@{slot.user_id}>, from reserves)")
+
+    async def _publish(self, scrim: Scrim):
+        self.slotlists.publish(scrim, await ScrimSlot.filter(scrim_id=scrim.id))
+
+    def stats(self) -> dict:
+        samples = list(self.latencies)
+        return {
+            "claims": self.claims,
+            "conflicts": self.conflicts,
+            "p50_ms": percentile(samples, 50) * 1000,
+            "p99_ms": percentile(samples, 99) * 1000,
+        }
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional
+
+from models.esports.scrims import Scrim
+from .scheduler import as_utc
+
+# Discord allows 25 options in a select menu, so a page never holds more than that.
+PAGE_SIZE = 25
+
+
+class DashboardRow(NamedTuple):
+    id: int
+    title: str
+    reg_channel_id: Optional[int]
+    time_str: str
+
+
+class Dashboard:
+    """A guild's scrims, formatted once and paged from memory."""
+
+    def __init__(self, guild_id: int, rows: List[DashboardRow]):
+        self.guild_id = guild_id
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def pages(self) -> int:
+        return max(1, -(-len(self.rows) // PAGE_SIZE))
+
+    def page(self, page: int) -> List[DashboardRow]:
+        start = page * PAGE_SIZE
+        return self.rows[start:start + PAGE_SIZE]
+
+    def description(self, page: int) -> str:
+        if not self.rows:
+            return "Click `Create Scrim` button for new scrim."
+
+        start = page * PAGE_SIZE
+        lines = [
+            f"{i:02}. <:positive:1397965897498628166> : <#{row.reg_channel_id}> - {row.time_str}"
+            for i, row in enumerate(self.page(page), start + 1)
+        ]
+        return "\n".join(lines) + "\n\nClick the `Create Scrim` button to start a new scrim."
+
+
+class DashboardCache:
+    """
+    Caches one Dashboard per guild.
+
+    The wizard and editor must call `invalidate` whenever a scrim is
+    created, updated or deleted, so the next render re-queries the guild.
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[int, Dashboard]" = OrderedDict()
+
+    async def get(self, guild_id: int) -> Dashboard:
+        dashboard = self._data.get(guild_id)
+        if dashboard is not None:
+            self._data.move_to_end(guild_id)
+            return dashboard
+
+        scrims = await Scrim.filter(guild_id=guild_id).order_by("scrim_time").values_list(
+            "id", "title", "reg_channel_id", "scrim_time"
+        )
+        # Discord renders <t:...> in each viewer's own timezone, so no conversion happens here.
+        rows = [
+            DashboardRow(scrim_id, title, reg_channel_id, f"<t:{int(as_utc(scrim_time).timestamp())}:t>")
+            for scrim_id, title, reg_channel_id, scrim_time in scrims
+        ]
+
+        dashboard = self._data[guild_id] = Dashboard(guild_id, rows)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return dashboard
+
+    def invalidate(self, guild_id: int):
+        self._data.pop(guild_id, None)
+
+
+dashboards = DashboardCache()
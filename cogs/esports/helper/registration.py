@@ -0,0 +1,309 @@
+import asyncio
+import heapq
+import re
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import discord
+
+from constants import EsportsLog, RegDeny, ScrimBanType
+from core.telemetry import log
+from models.esports.scrims import Scrim, ScrimSlot
+
+from .slotlist import SlotlistManager
+from .teams import TeamIndex
+
+if TYPE_CHECKING:
+    from core.Bot import ME
+
+    from .bans import ScrimBans
+
+TEAM_NAME_RE = re.compile(r"team[\s_-]*name\s*[:\-=]?\s*(.+)", re.IGNORECASE)
+MENTION_RE = re.compile(r"<@[!&]?\d+>|@everyone|@here")
+
+# How many queued messages a worker takes per round trip to the database.
+BATCH_SIZE = 25
+
+
+def find_team_name(message: discord.Message) -> str:
+    """Picks the team name out of a registration message."""
+    lines = [MENTION_RE.sub("", line).strip() for line in message.content.splitlines()]
+
+    for line in lines:
+        if match := TEAM_NAME_RE.search(line):
+            if name := match.group(1).strip(" :-*_`"):
+                return name[:200]
+
+    for line in lines:
+        if line:
+            return line[:200]
+
+    return f"{message.author.display_name}'s team"[:200]
+
+
+LOG_TITLES = {
+    EsportsLog.open: "Registration Opened",
+    EsportsLog.closed: "Registration Closed",
+    EsportsLog.success: "Team Registered",
+    EsportsLog.cancel: "Slot Cancelled",
+    EsportsLog.claim: "Slot Claimed",
+    EsportsLog.reserve: "Reserves Updated",
+    ScrimBanType.ban: "Users Banned",
+    ScrimBanType.unban: "Users Unbanned",
+}
+
+
+def log_event(bot: "ME", scrim: Scrim, kind: Union[EsportsLog, ScrimBanType], description: str):
+    """Queues an entry for the scrim's log channel, if it has one."""
+    channel = bot.get_channel(scrim.log_channel_id) if scrim.log_channel_id else None
+    if channel:
+        embed = discord.Embed(
+            title=f"{LOG_TITLES[kind]} | {scrim.title}",
+            description=description,
+            color=bot.config.COLOR,
+            timestamp=discord.utils.utcnow(),
+        )
+        bot.outbound.log(channel, embed)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class QueuedMessage(NamedTuple):
+    message: discord.Message
+    received_at: float  # time.perf_counter() when the gateway event arrived
+
+
+class ScrimRegistration:
+    """
+    The in-memory registration state of one open scrim.
+
+    Messages are handled by a single worker in the order they were received,
+    so slot numbers follow arrival order and no slot can be handed out twice.
+    The worker drains whatever has queued up and hands the new slots to the
+    bot's write-behind buffer, which batches them with other scrims' writes.
+    """
+
+    def __init__(self, engine: "RegistrationEngine", scrim: Scrim, teams: TeamIndex, banned: set):
+        self.engine = engine
+        self.scrim = scrim
+        self.banned = banned
+        self.queue: "asyncio.Queue[QueuedMessage]" = asyncio.Queue()
+
+        self.teams = teams
+        self.free = [n for n in range(1, scrim.total_slots + 1) if n not in teams]
+        heapq.heapify(self.free)
+
+        self.task = asyncio.create_task(self._run())
+
+    @property
+    def is_full(self) -> bool:
+        return not self.free
+
+    def update(self, scrim: Scrim):
+        """Applies edited scrim settings without interrupting the queue."""
+        taken = set(range(1, self.scrim.total_slots + 1)).difference(self.free)
+        self.free = [n for n in range(1, scrim.total_slots + 1) if n not in taken]
+        heapq.heapify(self.free)
+        self.scrim = scrim
+
+    def slots_of(self, user_id: int) -> List[ScrimSlot]:
+        """Slots the user registered or was tagged in."""
+        return self.teams.slots_of(user_id)
+
+    def cancel(self, user_id: int) -> List[ScrimSlot]:
+        """Frees every slot the user registered and queues the deletes."""
+        cancelled = self.teams.led_by(user_id)
+        for slot in cancelled:
+            self.teams.remove(slot.slot_no)
+            heapq.heappush(self.free, slot.slot_no)
+            self.engine.bot.scrim_writes.delete_slot(self.scrim.id, slot.slot_no)
+        self.engine.slotlists.remove(self.scrim.id, [slot.slot_no for slot in cancelled])
+        return cancelled
+
+    def validate(self, message: discord.Message, team_name: str) -> Optional[RegDeny]:
+        scrim = self.scrim
+        mentions = {m.id: m for m in message.mentions}
+
+        if any(m.bot for m in mentions.values()):
+            return RegDeny.botmention
+
+        if scrim.required_lines and len([line for line in message.content.splitlines() if line.strip()]) < scrim.required_lines:
+            return RegDeny.nolines
+
+        if len(mentions) < scrim.required_mentions:
+            return RegDeny.nomention
+
+        if message.author.id in self.banned:
+            return RegDeny.banned
+
+        if any(user_id in self.banned for user_id in mentions):
+            return RegDeny.bannedteammate
+
+        if not scrim.multiregister and self.teams.has_leader(message.author.id):
+            return RegDeny.multiregister
+
+        if not scrim.duplicate_tags and self.teams.tagged(mentions) is not None:
+            return RegDeny.faketag
+
+        if not scrim.duplicate_name and self.teams.has_name(team_name):
+            return RegDeny.duplicate
+
+        return None
+
+    async def _run(self):
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < BATCH_SIZE and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            try:
+                await self._process(batch)
+            except Exception:
+                log.exception("Registration batch for scrim %s failed", self.scrim.id)
+
+            if self.is_full:
+                await self.engine.on_full(self.scrim)
+                return
+
+    async def _process(self, batch: List[QueuedMessage]):
+        accepted: List[Tuple[QueuedMessage, ScrimSlot]] = []
+        denied: List[Tuple[QueuedMessage, RegDeny]] = []
+
+        for item in batch:
+            if self.is_full:
+                break  # Late messages are ignored, the scrim is about to close.
+
+            message = item.message
+            team_name = find_team_name(message)
+            if reason := self.validate(message, team_name):
+                denied.append((item, reason))
+                continue
+
+            slot = ScrimSlot(
+                scrim_id=self.scrim.id,
+                slot_no=heapq.heappop(self.free),
+                user_id=message.author.id,
+                team_name=team_name,
+                members=list({message.author.id, *(m.id for m in message.mentions)}),
+                message_id=message.id,
+            )
+            self.teams.add(slot)
+            accepted.append((item, slot))
+
+        if accepted:
+            slots = [slot for _, slot in accepted]
+            self.engine.bot.scrim_writes.insert_slots(self.scrim.id, slots)
+            self.engine.slotlists.add(self.scrim.id, slots)
+
+        self._notify(accepted, denied)
+
+        now = time.perf_counter()
+        self.engine.latencies.extend(now - item.received_at for item, _ in accepted)
+
+    def _notify(self, accepted, denied):
+        """Queues reactions, role grants, DMs, logs and denial notices for a batch."""
+        bot = self.engine.bot
+        outbound = bot.outbound
+        guild = bot.get_guild(self.scrim.guild_id)
+        role = guild.get_role(self.scrim.success_role_id) if guild and self.scrim.success_role_id else None
+        dm = self.scrim.dm_message.replace("{scrim_title}", self.scrim.title) if self.scrim.dm_message else None
+
+        for item, slot in accepted:
+            author = item.message.author
+            outbound.react(item.message, "✅")
+            if role and isinstance(author, discord.Member):
+                outbound.add_roles(author, role, reason="Scrim registration")
+            if dm:
+                outbound.dm(author, content=dm)
+            log_event(bot, self.scrim, EsportsLog.success, f"Slot **{slot.slot_no}**: {slot.team_name} ({author.mention})")
+
+        for item, reason in denied:
+            outbound.react(item.message, "❌")
+            outbound.reply(item.message, content=f"Registration denied: **{reason.value}**", delete_after=10)
+
+
+class RegistrationEngine:
+    """Routes registration messages to the queue of the open scrim that owns the channel."""
+
+    def __init__(self, bot: "ME", on_full: Callable[[Scrim], Awaitable[None]], bans: "ScrimBans"):
+        self.bot = bot
+        self.on_full = on_full
+        self.bans = bans
+        self.channels: Dict[int, ScrimRegistration] = {}
+        self.slotlists = SlotlistManager(bot, delay=getattr(bot.config, "SLOTLIST_EDIT_DELAY", 2.0))
+        self.latencies: "deque[float]" = deque(maxlen=5000)
+
+    def __contains__(self, channel_id: int) -> bool:
+        return channel_id in self.channels
+
+    def get(self, scrim_id: int) -> Optional[ScrimRegistration]:
+        return next((reg for reg in self.channels.values() if reg.scrim.id == scrim_id), None)
+
+    async def start(self, scrim: Scrim, new_round: bool = False) -> ScrimRegistration:
+        """
+        Loads a scrim's slots and bans and starts accepting registrations for it.
+        Raises FlushError, without starting, if buffered writes couldn't reach the database.
+        """
+        await self.stop(scrim.id)
+        # Make sure slots still sitting in the write buffer are visible to the load below.
+        await self.bot.scrim_writes.flush()
+        # Slots freed after the last close go back to registration rather than claims.
+        await ScrimSlot.filter(scrim_id=scrim.id, user_id__isnull=True).delete()
+
+        teams = await TeamIndex.load(scrim.id)
+        banned = await self.bans.load(scrim.id)
+
+        registration = ScrimRegistration(self, scrim, teams, banned)
+        self.slotlists.open(scrim, teams.slots.values(), new_round=new_round)
+        self.channels[scrim.reg_channel_id] = registration
+        self.bot.reg_channels.add(scrim.reg_channel_id)
+        return registration
+
+    def update(self, scrim: Scrim):
+        registration = self.get(scrim.id)
+        if not registration:
+            return
+
+        del self.channels[registration.scrim.reg_channel_id]
+        self.bot.reg_channels.discard(registration.scrim.reg_channel_id)
+        registration.update(scrim)
+        self.slotlists.update(scrim)
+        self.channels[scrim.reg_channel_id] = registration
+        self.bot.reg_channels.add(scrim.reg_channel_id)
+
+    async def stop(self, scrim_id: int):
+        registration = self.get(scrim_id)
+        if not registration:
+            return
+
+        del self.channels[registration.scrim.reg_channel_id]
+        self.bot.reg_channels.discard(registration.scrim.reg_channel_id)
+        self.slotlists.close(scrim_id)
+        self.bans.forget(scrim_id)
+        if registration.task is not asyncio.current_task():
+            registration.task.cancel()
+
+    def submit(self, message: discord.Message) -> bool:
+        """Queues a message if it was sent in an open registration channel."""
+        registration = self.channels.get(message.channel.id)
+        if registration is None:
+            return False
+
+        registration.queue.put_nowait(QueuedMessage(message, time.perf_counter()))
+        return True
+
+    def stats(self) -> dict:
+        samples = list(self.latencies)
+        return {
+            "open_scrims": len(self.channels),
+            "queued": sum(reg.queue.qsize() for reg in self.channels.values()),
+            "registrations": len(samples),
+            "p50_ms": percentile(samples, 50) * 1000,
+            "p99_ms": percentile(samples, 99) * 1000,
+        }
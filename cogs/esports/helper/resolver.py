@@ -0,0 +1,87 @@
+import re
+import time
+from typing import Dict, Optional, Tuple
+
+import discord
+from core.telemetry import log
+
+CHANNEL_RE = re.compile(r"<#(\d{15,20})>|(\d{15,20})")
+ROLE_RE = re.compile(r"<@&(\d{15,20})>|(\d{15,20})")
+
+# How long an ID that doesn't resolve is remembered before we ask Discord again.
+NEGATIVE_TTL = 300.0
+
+# (guild ID, channel or role ID) -> when the entry expires.
+_missing: Dict[Tuple[int, int], float] = {}
+
+
+def parse_id(pattern: re.Pattern, value: str) -> Optional[int]:
+    """Returns the ID from a mention or a raw ID, or None if the input is neither."""
+    match = pattern.fullmatch(str(value).strip())
+    if not match:
+        return None
+    return int(match.group(1) or match.group(2))
+
+
+def _is_missing(key: Tuple[int, int]) -> bool:
+    expires = _missing.get(key)
+    if expires is None:
+        return False
+    if expires < time.monotonic():
+        del _missing[key]
+        return False
+    return True
+
+
+def _mark_missing(key: Tuple[int, int]):
+    now = time.monotonic()
+    if len(_missing) > 10_000:
+        for stale in [stale for stale, expires in _missing.items() if expires < now]:
+            del _missing[stale]
+    _missing[key] = now + NEGATIVE_TTL
+
+
+def _is_guild_text_channel(channel, guild: discord.Guild) -> bool:
+    return isinstance(channel, discord.TextChannel) and channel.guild.id == guild.id
+
+
+async def resolve_channel(bot: discord.Client, guild: discord.Guild, channel_id: int) -> Optional[discord.TextChannel]:
+    """
+    Resolves a channel ID (see parse_id) to a text channel in `guild`.
+    The gateway cache is checked first; REST is only used on a cache miss, and
+    IDs that REST can't turn into one of the guild's text channels are remembered.
+    """
+    channel = bot.get_channel(channel_id)
+    if channel is not None:
+        return channel if _is_guild_text_channel(channel, guild) else None
+
+    if _is_missing((guild.id, channel_id)):
+        return None
+    try:
+        channel = await bot.fetch_channel(channel_id)
+    except (discord.NotFound, discord.Forbidden):
+        channel = None
+    except discord.HTTPException as e:
+        log.warning("Fetching channel %s for guild %s failed: %s", channel_id, guild.id, e)
+        return None
+
+    if not _is_guild_text_channel(channel, guild):
+        _mark_missing((guild.id, channel_id))
+        return None
+    return channel
+
+
+async def resolve_role(guild: discord.Guild, role_id: int) -> Optional[discord.Role]:
+    """Resolves a role ID (see parse_id), falling back to a single role fetch on a cache miss."""
+    role = guild.get_role(role_id)
+    if role is None:
+        if _is_missing((guild.id, role_id)):
+            return None
+        try:
+            role = discord.utils.get(await guild.fetch_roles(), id=role_id)
+        except discord.HTTPException as e:
+            log.warning("Fetching roles for guild %s failed: %s", guild.id, e)
+            return None
+        if role is None:
+            _mark_missing((guild.id, role_id))
+    return role
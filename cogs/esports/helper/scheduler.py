@@ -0,0 +1,233 @@
+import asyncio
+import heapq
+import itertools
+from datetime import datetime, timedelta, tzinfo
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pytz
+
+from constants import DAY_BITS, Day
+from core.telemetry import log
+from .time_parser import IST
+
+# Index matches datetime.weekday(): 0 -> "Mo", 6 -> "Su"
+DAY_ABBRS = [day.name[:2].capitalize() for day in Day]
+
+DAY_SECONDS = 86400
+EPOCH = datetime(1970, 1, 1, tzinfo=pytz.utc)
+
+
+def days_to_mask(days) -> int:
+    return sum(DAY_BITS[day] for day in days)
+
+
+def mask_to_days(mask: int) -> List[Day]:
+    return [day for day in Day if mask & DAY_BITS[day]]
+
+
+def format_days(mask: int) -> str:
+    """Formats a day mask the way it is shown to users, e.g. "Mo, We, Fr"."""
+    return ", ".join(DAY_ABBRS[i] for i in range(7) if mask >> i & 1) or "None"
+
+
+def _build_offsets() -> List[Tuple[int, ...]]:
+    """
+    OFFSETS[mask][weekday * 2 + later_today] is how many days after `weekday`
+    the next selected day falls, or -1 if the mask is empty. `later_today` is 1
+    when today's open time hasn't passed yet, so today itself still counts.
+    """
+    table = []
+    for mask in range(128):
+        row = []
+        for weekday in range(7):
+            for later_today in (0, 1):
+                start = 0 if later_today else 1
+                row.append(next((d for d in range(start, start + 7) if mask >> ((weekday + d) % 7) & 1), -1))
+        table.append(tuple(row))
+    return table
+
+
+OFFSETS = _build_offsets()
+
+
+def as_utc(dt: datetime) -> datetime:
+    """Makes a datetime from the database timezone-aware (naive values are stored as UTC)."""
+    return dt.replace(tzinfo=pytz.utc) if dt.tzinfo is None else dt.astimezone(pytz.utc)
+
+
+def _observes_dst(tz: tzinfo) -> bool:
+    return tz.utcoffset(datetime(2000, 1, 1)) != tz.utcoffset(datetime(2000, 7, 1))
+
+
+def _wall_seconds(t: datetime, tz: tzinfo) -> int:
+    local = as_utc(t).astimezone(tz)
+    return local.hour * 3600 + local.minute * 60 + local.second
+
+
+def _next_occurrence_slow(scrim_time: datetime, mask: int, local_now: datetime, tz: tzinfo) -> Optional[datetime]:
+    """Day-by-day search with zoneinfo, for the rare week that contains a DST change."""
+    open_at = as_utc(scrim_time).astimezone(tz).time().replace(tzinfo=None)
+    for offset in range(8):
+        day = local_now.date() + timedelta(days=offset)
+        if mask >> day.weekday() & 1:
+            candidate = datetime.combine(day, open_at, tzinfo=tz)
+            if candidate > local_now:
+                return candidate.astimezone(pytz.utc)
+    return None
+
+
+def next_occurrences(
+    scrim_times: Sequence[datetime], masks: Sequence[int], now: Optional[datetime] = None, tz: tzinfo = IST
+) -> List[Optional[datetime]]:
+    """
+    Returns the next UTC open datetime for many scrims of one timezone at once.
+
+    Scrims open at the wall-clock time of their `scrim_time` in `tz` on the days
+    in their mask. While the UTC offset doesn't change over the coming week,
+    everything reduces to integer arithmetic on epoch seconds plus one lookup
+    in OFFSETS per scrim; no day-by-day search happens per scrim.
+    """
+    now = now or datetime.now(pytz.utc)
+    local_now = now.astimezone(tz)
+    if local_now.utcoffset() != (now + timedelta(days=8)).astimezone(tz).utcoffset():
+        return [_next_occurrence_slow(t, mask, local_now, tz) for t, mask in zip(scrim_times, masks)]
+
+    utc_offset = int(local_now.utcoffset().total_seconds())
+    now_local = int(now.timestamp()) + utc_offset
+    midnight = now_local - now_local % DAY_SECONDS - utc_offset  # epoch of local midnight today
+    now_sec = now_local % DAY_SECONDS
+    column = local_now.weekday() * 2
+
+    if _observes_dst(tz):
+        # A time saved in winter must keep its wall clock in summer, so use each scrim's own offset.
+        open_secs = [_wall_seconds(t, tz) for t in scrim_times]
+    else:
+        open_secs = [
+            (int((t if t.tzinfo else t.replace(tzinfo=pytz.utc)).timestamp()) + utc_offset) % DAY_SECONDS
+            for t in scrim_times
+        ]
+    offsets = [OFFSETS[mask & 127][column + (sec > now_sec)] for mask, sec in zip(masks, open_secs)]
+
+    return [
+        None if offset < 0 else EPOCH + timedelta(seconds=midnight + offset * DAY_SECONDS + sec)
+        for offset, sec in zip(offsets, open_secs)
+    ]
+
+
+def next_occurrence(
+    scrim_time: datetime, scrim_days: int, now: Optional[datetime] = None, tz: tzinfo = IST
+) -> Optional[datetime]:
+    """Returns the next UTC datetime at which a scrim should open, or None if no day is selected."""
+    return next_occurrences([scrim_time], [scrim_days], now, tz)[0]
+
+
+class ScrimScheduler:
+    """
+    An in-process timer queue for scrim events.
+
+    Due times live in a min-heap, so arming a scrim is O(log n) and the runner
+    sleeps exactly until the earliest event instead of polling every scrim.
+    Re-arming a scrim invalidates its older heap entry lazily.
+    """
+
+    def __init__(self, callback: Callable[[int], Awaitable[None]]):
+        self.callback = callback
+
+        self._heap: List[Tuple[datetime, int, int]] = []
+        self._entries: Dict[int, int] = {}  # scrim_id -> sequence of its live heap entry
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def arm(self, scrim_id: int, when: Optional[datetime]):
+        """Schedules (or reschedules) a scrim. Passing None cancels it."""
+        if when is None:
+            return self.cancel(scrim_id)
+
+        seq = next(self._counter)
+        self._entries[scrim_id] = seq
+        heapq.heappush(self._heap, (when, seq, scrim_id))
+
+        # Stale entries are dropped when popped, but don't let them pile up forever.
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+        if self._heap[0][1] == seq:
+            self._wakeup.set()
+
+    def cancel(self, scrim_id: int):
+        self._entries.pop(scrim_id, None)
+
+    def next_due(self, scrim_id: int) -> Optional[datetime]:
+        seq = self._entries.get(scrim_id)
+        if seq is None:
+            return None
+        return next((when for when, s, _ in self._heap if s == seq), None)
+
+    def rebuild(self, rows: List[Tuple[int, datetime, int, tzinfo]], now: Optional[datetime] = None):
+        """
+        Replaces the queue with (scrim_id, scrim_time, scrim_days, tz) rows from a single query.
+        Rows are grouped by timezone so each group is computed in one batch.
+        """
+        self._heap.clear()
+        self._entries.clear()
+
+        groups: Dict[tzinfo, List[Tuple[int, datetime, int]]] = {}
+        for scrim_id, scrim_time, scrim_days, tz in rows:
+            groups.setdefault(tz, []).append((scrim_id, scrim_time, scrim_days))
+
+        for tz, group in groups.items():
+            scrim_ids, scrim_times, masks = zip(*group)
+            for scrim_id, when in zip(scrim_ids, next_occurrences(scrim_times, masks, now, tz)):
+                if when is None:
+                    continue
+                seq = next(self._counter)
+                self._entries[scrim_id] = seq
+                self._heap.append((when, seq, scrim_id))
+
+        heapq.heapify(self._heap)
+        self._wakeup.set()
+
+    def _compact(self):
+        self._heap = [entry for entry in self._heap if self._entries.get(entry[2]) == entry[1]]
+        heapq.heapify(self._heap)
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            now = datetime.now(pytz.utc)
+
+            while self._heap and self._heap[0][0] <= now:
+                _, seq, scrim_id = heapq.heappop(self._heap)
+                if self._entries.get(scrim_id) != seq:
+                    continue  # cancelled or re-armed since
+                del self._entries[scrim_id]
+
+                task = asyncio.create_task(self._fire(scrim_id))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+
+            timeout = (self._heap[0][0] - now).total_seconds() if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _fire(self, scrim_id: int):
+        try:
+            await self.callback(scrim_id)
+        except Exception:
+            log.exception("Scheduled event for scrim %s failed", scrim_id)
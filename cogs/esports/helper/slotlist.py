@@ -0,0 +1,187 @@
+import asyncio
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+import discord
+
+from models.esports.scrims import Scrim, ScrimSlot
+
+if TYPE_CHECKING:
+    from core.Bot import ME
+
+# Slots per embed field; a change re-renders only the field holding the slot.
+FIELD_SIZE = 5
+
+
+class Slotlist:
+    """
+    The slotlist of one scrim round: one line per slot, grouped into embed fields.
+
+    Lines are kept in slot order, so a registration or cancel touches one line
+    and marks its field dirty; `embed()` re-joins only the dirty fields.
+    """
+
+    def __init__(self, scrim: Scrim, slots: Iterable[ScrimSlot]):
+        self.scrim = scrim
+        self.message: Optional[discord.PartialMessage] = None
+        self.closed = False  # closed before its message was posted; publish once it is
+        self.teams: Dict[int, ScrimSlot] = {}
+        self.lines: List[str] = []
+        self.fields: List[Optional[str]] = []
+        self.resize()
+        for slot in slots:
+            self.set(slot)
+
+    def resize(self):
+        """Re-renders every line, e.g. after the slot count or "Slotlist Start from" changed."""
+        self.lines = [self._line(n) for n in range(1, self.scrim.total_slots + 1)]
+        self.fields = [None] * -(-len(self.lines) // FIELD_SIZE)
+
+    def _line(self, slot_no: int) -> str:
+        number = slot_no + self.scrim.slotlist_start - 1
+        slot = self.teams.get(slot_no)
+        if slot is None:
+            return f"`{number:02}` —"
+        # Team names are cut so a full field stays within Discord's 1024 characters.
+        return f"`{number:02}` **{discord.utils.escape_markdown(slot.team_name[:40])}** <@{slot.user_id}>"
+
+    def _touch(self, slot_no: int):
+        if 1 <= slot_no <= len(self.lines):
+            self.lines[slot_no - 1] = self._line(slot_no)
+            self.fields[(slot_no - 1) // FIELD_SIZE] = None
+
+    def set(self, slot: ScrimSlot):
+        if slot.is_vacant:
+            return self.remove(slot.slot_no)
+        self.teams[slot.slot_no] = slot
+        self._touch(slot.slot_no)
+
+    def remove(self, slot_no: int):
+        if self.teams.pop(slot_no, None) is not None:
+            self._touch(slot_no)
+
+    def embed(self, color: int) -> discord.Embed:
+        embed = discord.Embed(title=f"{self.scrim.title} Slotlist", color=color)
+        for i, value in enumerate(self.fields):
+            if value is None:
+                value = self.fields[i] = "\n".join(self.lines[i * FIELD_SIZE:(i + 1) * FIELD_SIZE])
+            first = i * FIELD_SIZE + self.scrim.slotlist_start
+            last = min((i + 1) * FIELD_SIZE, len(self.lines)) + self.scrim.slotlist_start - 1
+            embed.add_field(name=f"Slots {first}-{last}", value=value, inline=False)
+        embed.set_footer(text=f"Registered: {len(self.teams)}/{self.scrim.total_slots}")
+        return embed
+
+
+class SlotlistManager:
+    """
+    Keeps the posted slotlist of every open scrim in sync with its slots.
+
+    Changes are collected for `delay` seconds before the message is edited,
+    and the edit goes through the outbound queue, which merges it with any
+    edit still waiting there. A burst of registrations costs a few edits.
+    """
+
+    def __init__(self, bot: "ME", delay: float = 2.0):
+        self.bot = bot
+        self.delay = delay
+        self.slotlists: Dict[int, Slotlist] = {}
+        self._timers: Dict[int, asyncio.TimerHandle] = {}
+        self.edits = 0
+
+    def get(self, scrim_id: int) -> Optional[Slotlist]:
+        return self.slotlists.get(scrim_id)
+
+    def open(self, scrim: Scrim, slots: Iterable[ScrimSlot], new_round: bool = False):
+        """Starts tracking a scrim. A new round posts a new message; otherwise the posted one is reused."""
+        self.close(scrim.id, publish=False)
+        channel = self.bot.get_channel(scrim.slotlist_channel_id) if scrim.slotlist_channel_id else None
+        if channel is None:
+            return
+
+        slotlist = self.slotlists[scrim.id] = Slotlist(scrim, slots)
+        if scrim.slotlist_message_id and not new_round:
+            slotlist.message = channel.get_partial_message(scrim.slotlist_message_id)
+            self._schedule(scrim.id)
+            return
+
+        posted = self.bot.outbound.send(channel, embed=slotlist.embed(self.bot.config.COLOR))
+        posted.add_done_callback(lambda future: self._posted(slotlist, future.result()))
+
+    def _posted(self, slotlist: Slotlist, message: Optional[discord.Message]):
+        current = self.slotlists.get(slotlist.scrim.id) is slotlist
+        if message is None:
+            # Couldn't post (e.g. missing permissions); stop tracking this round.
+            if current:
+                self.close(slotlist.scrim.id, publish=False)
+            return
+        if not (current or slotlist.closed):
+            return
+
+        slotlist.message = message
+        self.bot.scrim_writes.update(slotlist.scrim, slotlist_message_id=message.id)
+        if slotlist.closed:
+            self._edit(slotlist)
+
+    def update(self, scrim: Scrim):
+        """Applies edited scrim settings (title, slot count, first slot number)."""
+        slotlist = self.slotlists.get(scrim.id)
+        if slotlist:
+            slotlist.scrim = scrim
+            slotlist.resize()
+            self._schedule(scrim.id)
+
+    def add(self, scrim_id: int, slots: Iterable[ScrimSlot]):
+        slotlist = self.slotlists.get(scrim_id)
+        if slotlist:
+            for slot in slots:
+                slotlist.set(slot)
+            self._schedule(scrim_id)
+
+    def remove(self, scrim_id: int, slot_nos: Iterable[int]):
+        slotlist = self.slotlists.get(scrim_id)
+        if slotlist:
+            for slot_no in slot_nos:
+                slotlist.remove(slot_no)
+            self._schedule(scrim_id)
+
+    def close(self, scrim_id: int, publish: bool = True):
+        """Stops tracking a scrim, publishing pending changes first."""
+        timer = self._timers.pop(scrim_id, None)
+        if timer:
+            timer.cancel()
+        slotlist = self.slotlists.pop(scrim_id, None)
+        if slotlist is None or not publish or timer is None:
+            return
+        if slotlist.message is None:
+            slotlist.closed = True
+        else:
+            self._edit(slotlist)
+
+    def publish(self, scrim: Scrim, slots: Iterable[ScrimSlot]):
+        """Re-renders the posted slotlist of a closed round, e.g. after a slot was cancelled or claimed."""
+        if scrim.id in self.slotlists or not (scrim.slotlist_channel_id and scrim.slotlist_message_id):
+            return
+        channel = self.bot.get_channel(scrim.slotlist_channel_id)
+        if channel is None:
+            return
+        slotlist = Slotlist(scrim, slots)
+        slotlist.message = channel.get_partial_message(scrim.slotlist_message_id)
+        self._edit(slotlist)
+
+    # --- Publishing ---
+    def _schedule(self, scrim_id: int):
+        if scrim_id not in self._timers:
+            self._timers[scrim_id] = asyncio.get_running_loop().call_later(self.delay, self._publish, scrim_id)
+
+    def _publish(self, scrim_id: int):
+        self._timers.pop(scrim_id, None)
+        slotlist = self.slotlists.get(scrim_id)
+        if slotlist is None:
+            return
+        if slotlist.message is None:
+            # Still being posted; try again once it is.
+            return self._schedule(scrim_id)
+        self._edit(slotlist)
+
+    def _edit(self, slotlist: Slotlist):
+        self.edits += 1
+        self.bot.outbound.edit(slotlist.message, embed=slotlist.embed(self.bot.config.COLOR))
@@ -0,0 +1,98 @@
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set
+
+from models.esports.scrims import ScrimSlot
+
+
+def normalize_name(name: str) -> str:
+    """
+    Folds a team name for comparison: compatibility forms, accents, invisible
+    format characters (zero-width spaces and joiners, bidi marks), case and
+    whitespace, so "Team  X", "team x", "Ｔｅａｍ Ｘ", "Téam X" and "Team\u200bX"
+    compare equal.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(
+        ch for ch in decomposed if not unicodedata.combining(ch) and unicodedata.category(ch) != "Cf"
+    )
+    return "".join(stripped.casefold().split())
+
+
+def _add(index: Dict, key, slot_no: int):
+    index.setdefault(key, set()).add(slot_no)
+
+
+def _discard(index: Dict, key, slot_no: int):
+    slot_nos = index.get(key)
+    if slot_nos is not None:
+        slot_nos.discard(slot_no)
+        if not slot_nos:
+            del index[key]
+
+
+class TeamIndex:
+    """
+    The teams registered in one scrim round, indexed for the registration checks.
+
+    Folded team names, leaders and tagged members each map to the slots they
+    appear in, so duplicate names, multi-registers and duplicate tags are
+    single lookups however many teams are registered. A key can map to more
+    than one slot when the scrim allows duplicates.
+    """
+
+    def __init__(self, slots: Iterable[ScrimSlot] = ()):
+        self.slots: Dict[int, ScrimSlot] = {}        # slot_no -> slot
+        self.names: Dict[str, Set[int]] = {}         # folded team name -> slot numbers
+        self.leaders: Dict[int, Set[int]] = {}       # registrant's user id -> slot numbers
+        self.members: Dict[int, Set[int]] = {}       # tagged user id -> slot numbers
+        for slot in slots:
+            self.add(slot)
+
+    @classmethod
+    async def load(cls, scrim_id: int) -> "TeamIndex":
+        """Builds the index from the scrim's slots in the database."""
+        return cls(await ScrimSlot.filter(scrim_id=scrim_id, user_id__isnull=False))
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __contains__(self, slot_no: int) -> bool:
+        return slot_no in self.slots
+
+    def add(self, slot: ScrimSlot):
+        if slot.slot_no in self.slots:
+            self.remove(slot.slot_no)
+        self.slots[slot.slot_no] = slot
+        _add(self.names, normalize_name(slot.team_name), slot.slot_no)
+        _add(self.leaders, slot.user_id, slot.slot_no)
+        for user_id in slot.members:
+            _add(self.members, user_id, slot.slot_no)
+
+    def remove(self, slot_no: int) -> Optional[ScrimSlot]:
+        slot = self.slots.pop(slot_no, None)
+        if slot is None:
+            return None
+        _discard(self.names, normalize_name(slot.team_name), slot_no)
+        _discard(self.leaders, slot.user_id, slot_no)
+        for user_id in slot.members:
+            _discard(self.members, user_id, slot_no)
+        return slot
+
+    # --- Lookups ---
+    def has_name(self, team_name: str) -> bool:
+        return normalize_name(team_name) in self.names
+
+    def has_leader(self, user_id: int) -> bool:
+        return user_id in self.leaders
+
+    def tagged(self, user_ids: Iterable[int]) -> Optional[int]:
+        """The first of the users who is already in a team, if any."""
+        return next((user_id for user_id in user_ids if user_id in self.members), None)
+
+    def led_by(self, user_id: int) -> List[ScrimSlot]:
+        return [self.slots[n] for n in sorted(self.leaders.get(user_id, ()))]
+
+    def slots_of(self, user_id: int) -> List[ScrimSlot]:
+        """Slots the user registered or was tagged in."""
+        slot_nos = self.leaders.get(user_id, set()) | self.members.get(user_id, set())
+        return [self.slots[n] for n in sorted(slot_nos)]
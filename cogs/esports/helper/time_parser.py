@@ -1,53 +1,83 @@
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
 from dateutil.parser import parse
-import pytz
 
-# Define the timezone for India Standard Time
-IST = pytz.timezone("Asia/Kolkata")
+# The default guild timezone (India Standard Time); guilds can pick their own with `settimezone`.
+from constants import IST
+
+RELATIVE_RE = re.compile(r"(\d+)\s*(d|h|m)")
+CLOCK_RE = re.compile(r"(\d{1,2})(?:[:.](\d{2}))?\s*(am|pm)?")
+
+RELATIVE_UNITS = {"d": 86400, "h": 3600, "m": 60}
+
+INVALID_TIME = "Invalid time format. Use '2h', '5pm', '13:00', etc."
+
 
-def parse_time(time_str: str) -> datetime:
+@lru_cache(maxsize=4096)
+def _parse_normalized(text: str) -> Tuple[bool, int]:
     """
-    Parses a flexible time string and returns a future, timezone-aware datetime object in UTC.
-    
-    Handles relative time (e.g., '2h', '30m'), 12-hour format ('5pm', '4:00am'), 
-    and 24-hour format ('13:00').
+    Parses a lowercased, stripped time string into (is_relative, seconds):
+    an offset from now for '2h', or seconds after midnight for '5pm' / '13:00'.
+    The common forms are matched directly; anything else goes through dateutil.
     """
-    now_utc = datetime.now(pytz.utc)
-    now_ist = now_utc.astimezone(IST)
-    
-    # --- 1. Check for relative time (e.g., 1d, 2h, 30m) ---
-    relative_match = re.match(r"(\d+)\s*(d|h|m)$", time_str.lower())
-    if relative_match:
-        value = int(relative_match.group(1))
-        unit = relative_match.group(2)
-        
-        if unit == 'd':
-            return now_utc + timedelta(days=value)
-        elif unit == 'h':
-            return now_utc + timedelta(hours=value)
-        elif unit == 'm':
-            return now_utc + timedelta(minutes=value)
-
-    # --- 2. Parse absolute time (e.g., 5pm, 13:00, 4:00am) ---
+    if match := RELATIVE_RE.fullmatch(text):
+        return True, int(match.group(1)) * RELATIVE_UNITS[match.group(2)]
+
+    if match := CLOCK_RE.fullmatch(text):
+        hour, minute, meridiem = int(match.group(1)), int(match.group(2) or 0), match.group(3)
+        if meridiem:
+            if not 1 <= hour <= 12:
+                raise ValueError(INVALID_TIME)
+            hour = hour % 12 + (12 if meridiem == "pm" else 0)
+        if hour < 24 and minute < 60 and (meridiem or match.group(2)):
+            return False, hour * 3600 + minute * 60
+
+    # --- Slow path: anything dateutil can make sense of (e.g. "5:30 p.m.") ---
     try:
-        # The 'fuzzy=True' helps parse strings like "5pm" correctly
-        parsed_time = parse(time_str, fuzzy=True)
-        
-        # Combine the parsed time with today's date in IST
-        scrim_time_ist = now_ist.replace(
-            hour=parsed_time.hour,
-            minute=parsed_time.minute,
-            second=0,
-            microsecond=0
-        )
-        
-        # If the calculated time is in the past for today, schedule it for tomorrow
-        if scrim_time_ist < now_ist:
-            scrim_time_ist += timedelta(days=1)
-            
-        # Convert the final IST time back to UTC for storage
-        return scrim_time_ist.astimezone(pytz.utc)
-
-    except ValueError:
-        raise ValueError("Invalid time format. Use '2h', '5pm', '13:00', etc.")
+        parsed = parse(text, fuzzy=True)
+    except (ValueError, OverflowError):
+        raise ValueError(INVALID_TIME)
+    return False, parsed.hour * 3600 + parsed.minute * 60
+
+
+def _resolve(parsed: Tuple[bool, int], now: datetime, local_now: datetime, tz: ZoneInfo) -> datetime:
+    relative, seconds = parsed
+    if relative:
+        return now + timedelta(seconds=seconds)
+
+    # Today at that wall-clock time, or tomorrow if it has already passed.
+    wall = time(seconds // 3600, seconds % 3600 // 60)
+    candidate = datetime.combine(local_now.date(), wall, tzinfo=tz)
+    if candidate < local_now:
+        candidate = datetime.combine(local_now.date() + timedelta(days=1), wall, tzinfo=tz)
+    return candidate.astimezone(timezone.utc)
+
+
+def parse_time(time_str: str, tz: ZoneInfo = IST, now: Optional[datetime] = None) -> datetime:
+    """
+    Parses a flexible time string and returns a future, timezone-aware datetime object in UTC.
+
+    Handles relative time (e.g., '2h', '30m'), 12-hour format ('5pm', '4:00am'),
+    and 24-hour format ('13:00'). Wall-clock times are read in `tz`.
+    """
+    parsed = _parse_normalized(time_str.strip().lower())
+    now = now or datetime.now(timezone.utc)
+    return _resolve(parsed, now, now.astimezone(tz), tz)
+
+
+def parse_times(time_strs: Iterable[str], tz: ZoneInfo = IST, now: Optional[datetime] = None) -> List[Optional[datetime]]:
+    """Parses many time strings against the same `now`. Invalid entries come back as None."""
+    now = now or datetime.now(timezone.utc)
+    local_now = now.astimezone(tz)
+
+    results = []
+    for time_str in time_strs:
+        try:
+            results.append(_resolve(_parse_normalized(time_str.strip().lower()), now, local_now, tz))
+        except ValueError:
+            results.append(None)
+    return results
@@ -1,17 +1,20 @@
 import discord
+from core.views import BaseView
 
 # --- NEW: Import the Day enum from your constants file ---
-from constants import Day
+from constants import DAY_BITS, Day
+from ...helper.scheduler import days_to_mask
 
-class DaySelectorView(discord.ui.View):
+class DaySelectorView(BaseView):
     """An interactive view for selecting the days a scrim should run."""
     
     def __init__(self, parent_view):
         super().__init__(timeout=180.0)
         self.parent_view = parent_view
         
-        # --- UPDATED: Use the Day enum for state management ---
-        self.day_states = {day: True for day in Day}
+        # --- UPDATED: Use the Day enum for state management, starting from the parent's current mask ---
+        mask = parent_view.data["Scrim Days"]
+        self.day_states = {day: bool(mask & DAY_BITS[day]) for day in Day}
         
         # Create the buttons by iterating through the Day enum
         for i, day in enumerate(Day):
@@ -35,11 +38,8 @@ class DaySelectorView(discord.ui.View):
     @discord.ui.button(label="Save", style=discord.ButtonStyle.success, row=3)
     async def save_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Saves the selected days back to the parent wizard view."""
-        # --- UPDATED: Generate the abbreviation string from the enum ---
-        selected_days = [day.name[:2].capitalize() for day, is_active in self.day_states.items() if is_active]
-        
-        # Update the parent view's data
-        self.parent_view.data["Scrim Days"] = ", ".join(selected_days)
+        # --- UPDATED: Store the selection as a day bitmask ---
+        self.parent_view.data["Scrim Days"] = days_to_mask(day for day, is_active in self.day_states.items() if is_active)
         
         # Re-build the parent embed and show it
         parent_embed = await self.parent_view.build_embed()
@@ -1,12 +1,17 @@
 import discord
 import asyncio
-import pytz
 from core.Bot import ME
+from core.prompts import PromptCancelled
+from core.views import BaseView
+from constants import ALL_DAYS
 from models.esports.scrims import Scrim
-from ...helper.time_parser import parse_time, IST
+from ...helper.scheduler import format_days
+from ...helper.time_parser import parse_time
+from ...helper.dashboard import dashboards
+from ...helper.resolver import CHANNEL_RE, ROLE_RE, parse_id, resolve_channel, resolve_role
 from ._days import DaySelectorView
 
-class ScrimWizardView(discord.ui.View):
+class ScrimWizardView(BaseView):
     """An interactive view for creating a new scrim step-by-step using chat input."""
 
     def __init__(self, bot: ME, original_interaction: discord.Interaction):
@@ -21,9 +26,11 @@ class ScrimWizardView(discord.ui.View):
             "Req. Mentions": 4,
             "Total Slots": 25,
             "Open Time": "Not-Set",
-            "Scrim Days": "Mo, Tu, We, Th, Fr, Sa, Su",
+            "Scrim Days": ALL_DAYS,
             "Reactions": "✅, ❌",
         }
+        # Parsed once when "Open Time" is entered and reused on save.
+        self.scrim_time = None
         self.save_scrim.disabled = True
 
     def _check_save_button_state(self):
@@ -44,30 +51,24 @@ class ScrimWizardView(discord.ui.View):
             value = int(value)
         
         if key in ["Reg. Channel", "Slotlist Channel"]:
-            if not value.startswith("<#") and not value.isdigit():
+            channel_id = parse_id(CHANNEL_RE, value)
+            if channel_id is None:
                 return await interaction.followup.send("Error: Please provide a valid channel mention or ID.", ephemeral=True)
-            try:
-                channel_id = int("".join(filter(str.isdigit, str(value))))
-                channel = await self.bot.fetch_channel(channel_id)
-                if not isinstance(channel, discord.TextChannel): raise ValueError()
-                value = channel
-            except (ValueError, discord.NotFound, discord.Forbidden):
+            value = await resolve_channel(self.bot, interaction.guild, channel_id)
+            if value is None:
                 return await interaction.followup.send("Error: Invalid channel ID or I can't see that channel.", ephemeral=True)
 
         if key == "Success Role":
-            if not value.startswith("<@&") and not value.isdigit():
+            role_id = parse_id(ROLE_RE, value)
+            if role_id is None:
                 return await interaction.followup.send("Error: Please provide a valid role mention or ID.", ephemeral=True)
-            try:
-                role_id = int("".join(filter(str.isdigit, str(value))))
-                role = interaction.guild.get_role(role_id)
-                if not role: raise ValueError()
-                value = role
-            except (ValueError, TypeError):
-                 return await interaction.followup.send("Error: Invalid role ID.", ephemeral=True)
+            value = await resolve_role(interaction.guild, role_id)
+            if value is None:
+                return await interaction.followup.send("Error: Invalid role ID.", ephemeral=True)
         
         if key == "Open Time":
             try:
-                parse_time(value)
+                self.scrim_time = parse_time(value, tz=self.bot.timezones.get(interaction.guild.id))
             except ValueError as e:
                 return await interaction.followup.send(f"Error: {e}", ephemeral=True)
 
@@ -96,8 +97,9 @@ class ScrimWizardView(discord.ui.View):
         embed.add_field(name="🇨 Success Role:", value=format_field('Success Role'), inline=True)
         embed.add_field(name="🇩 Req. Mentions:", value=format_field('Req. Mentions'), inline=True)
         embed.add_field(name="🇪 Total Slots:", value=format_field('Total Slots'), inline=True)
-        embed.add_field(name="🇫 Open Time:", value=format_field('Open Time'), inline=True)
-        embed.add_field(name="🇬 Scrim Days:", value=f"```{self.data['Scrim Days']}```", inline=False)
+        open_time = f"<t:{int(self.scrim_time.timestamp())}:t>" if self.scrim_time else format_field('Open Time')
+        embed.add_field(name="🇫 Open Time:", value=open_time, inline=True)
+        embed.add_field(name="🇬 Scrim Days:", value=f"```{format_days(self.data['Scrim Days'])}```", inline=False)
         embed.add_field(name="🇭 Reactions:", value=self.data['Reactions'], inline=False)
         embed.set_footer(text="EliteQ Premium servers can set custom reactions.")
         return embed
@@ -112,10 +114,13 @@ class ScrimWizardView(discord.ui.View):
         await interaction.response.defer()
 
         try:
-            message = await self.bot.wait_for("message", timeout=60.0, check=lambda m: m.author == interaction.user and m.channel == interaction.channel)
+            message = await self.bot.prompts.ask(interaction.channel.id, interaction.user.id, timeout=60.0)
         except asyncio.TimeoutError:
             await prompt.delete()
             return await interaction.followup.send("You took too long to respond.", ephemeral=True)
+        except PromptCancelled:
+            # Replaced by a newer prompt from the same user in this channel.
+            return await prompt.delete()
 
         await prompt.delete()
         try: await message.delete()
@@ -126,26 +131,7 @@ class ScrimWizardView(discord.ui.View):
     async def _return_to_dashboard(self, interaction: discord.Interaction):
         """A helper function to build and send the main scrim manager dashboard."""
         from ..scrims.manager import ScrimManagerView
-        scrims = await Scrim.filter(guild_id=interaction.guild.id).order_by("scrim_time")
-        
-        if not scrims:
-            description = "Click `Create Scrim` button for new scrim."
-        else:
-            lines = []
-            for i, s in enumerate(scrims, 1):
-                # --- CORRECTED TIME CONVERSION ---
-                utc_time = s.scrim_time.replace(tzinfo=pytz.utc)
-                ist_time = utc_time.astimezone(IST)
-                time_str = ist_time.strftime('%I:%M %p IST')
-                lines.append(
-                    f"{i:02}. <:positive:1397965897498628166> : <#{s.reg_channel_id}> - {time_str}"
-                )
-            description = "\n".join(lines) + "\n\nClick the `Create Scrim` button to start a new scrim."
-
-        embed = self.bot.embed(title="Scrims Manager", description=description)
-        embed.set_footer(text=f"Total Scrims in this server: {len(scrims)}", icon_url=interaction.user.display_avatar.url)
-        
-        view = ScrimManagerView(self.bot, scrims_exist=bool(scrims))
+        embed, view = await ScrimManagerView.render(self.bot, interaction.guild.id, interaction.user)
         if interaction.response.is_done():
             await self.original_interaction.edit_original_response(embed=embed, view=view)
         else:
@@ -194,20 +180,24 @@ class ScrimWizardView(discord.ui.View):
     @discord.ui.button(label="Save Scrim", style=discord.ButtonStyle.success, row=3)
     async def save_scrim(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Validates and saves the scrim to the database."""
-        scrim_time = parse_time(self.data["Open Time"])
+        scrim_time = self.scrim_time
         title = f"Scrim @ {scrim_time.strftime('%I:%M %p')}"
 
-        await Scrim.create(
+        scrim = await Scrim.create(
             guild_id=interaction.guild.id,
             host_id=interaction.user.id,
             title=title,
             scrim_time=scrim_time,
             total_slots=self.data["Total Slots"],
+            required_mentions=self.data["Req. Mentions"],
             reg_channel_id=self.data["Reg. Channel"].id,
             slotlist_channel_id=self.data["Slotlist Channel"].id if isinstance(self.data["Slotlist Channel"], discord.TextChannel) else None,
             success_role_id=self.data["Success Role"].id if isinstance(self.data["Success Role"], discord.Role) else None,
-            scrim_days=self.data["Scrim Days"]
+            scrim_days=self.data["Scrim Days"],
+            is_open=False,  # The scheduler opens registration at the scrim time
         )
-        
+        dashboards.invalidate(interaction.guild.id)
+        self.bot.dispatch("scrim_create", scrim)
+
         await interaction.response.send_message("✅ Scrim saved successfully!", ephemeral=True)
         await self._return_to_dashboard(interaction)
@@ -0,0 +1,119 @@
+import asyncio
+from typing import Optional
+
+import discord
+from core.Bot import ME
+from core.prompts import PromptCancelled
+from core.views import BaseView
+from models.esports.scrims import Scrim, ScrimBan
+from ...helper.bans import parse_targets
+from ...helper.dashboard import DashboardRow
+
+# Bans listed in the embed; the rest are counted.
+SHOWN_BANS = 20
+
+
+class BanScrimSelect(discord.ui.Select):
+    """Chooses the scrim whose ban list the view manages."""
+
+    def __init__(self, bot: ME, scrims: list[DashboardRow]):
+        options = []
+        for scrim in scrims:
+            channel = bot.get_channel(scrim.reg_channel_id)
+            label_name = channel.name if channel else scrim.title
+            options.append(discord.SelectOption(label=f"ID: {scrim.id} | #{label_name}", value=str(scrim.id)))
+        super().__init__(placeholder="Select a scrim...", options=options)
+
+    async def callback(self, interaction: discord.Interaction):
+        view: ScrimBanView = self.view
+        view.scrim = await Scrim.get_or_none(id=int(self.values[0]))
+        view.ban.disabled = view.unban.disabled = view.scrim is None
+        await interaction.response.edit_message(embed=await view.build_embed(), view=view)
+
+
+class ScrimBanView(BaseView):
+    """Bans and unbans users from a scrim, several at once, from the scrim manager."""
+
+    def __init__(self, bot: ME, scrims: list[DashboardRow], original_interaction: discord.Interaction):
+        super().__init__(timeout=180.0)
+        self.bot = bot
+        self.original_interaction = original_interaction
+        self.scrim: Optional[Scrim] = None
+        self.add_item(BanScrimSelect(bot, scrims))
+        self.ban.disabled = self.unban.disabled = True
+
+    @property
+    def bans(self):
+        return self.bot.get_cog("ScrimAutomation").bans
+
+    async def build_embed(self) -> discord.Embed:
+        if self.scrim is None:
+            return self.bot.embed(title="Ban/Unban", description="Select the scrim whose ban list you want to manage.")
+
+        total = await ScrimBan.filter(scrim_id=self.scrim.id).count()
+        lines = []
+        for ban in await ScrimBan.filter(scrim_id=self.scrim.id).order_by("created_at").limit(SHOWN_BANS):
+            line = f"<@{ban.user_id}>"
+            if ban.expires_at:
+                line += f" (until {discord.utils.format_dt(ban.expires_at, 'f')})"
+            if ban.reason:
+                line += f" - {ban.reason}"
+            lines.append(line)
+        if total > SHOWN_BANS:
+            lines.append(f"...and {total - SHOWN_BANS} more")
+
+        embed = self.bot.embed(title=f"Ban/Unban | {self.scrim.title}", description="\n".join(lines) or "Nobody is banned.")
+        embed.set_footer(text=f"Banned users: {total}")
+        return embed
+
+    async def _get_chat_input(self, interaction: discord.Interaction, action: str):
+        """Asks for the users to ban or unban in the chat and applies it."""
+        hint = "Mention the users or paste their IDs."
+        if action == "ban":
+            hint += " Add a duration like `12h`, `7d` or `2w` for a temporary ban; anything else is the reason."
+        prompt = await interaction.channel.send(embed=discord.Embed(description=hint, color=self.bot.config.COLOR))
+        await interaction.response.defer()
+
+        try:
+            message = await self.bot.prompts.ask(interaction.channel.id, interaction.user.id, timeout=60.0)
+        except asyncio.TimeoutError:
+            await prompt.delete()
+            return await interaction.followup.send("You took too long to respond.", ephemeral=True)
+        except PromptCancelled:
+            return await prompt.delete()
+
+        await prompt.delete()
+        try: await message.delete()
+        except discord.NotFound: pass
+
+        try:
+            user_ids, duration, reason = parse_targets(message.content)
+        except ValueError as e:
+            return await interaction.followup.send(str(e), ephemeral=True)
+        if not user_ids:
+            return await interaction.followup.send("No users found, mention them or paste their IDs.", ephemeral=True)
+
+        if action == "ban":
+            expires_at = discord.utils.utcnow() + duration if duration else None
+            done = await self.bans.ban(self.scrim, user_ids, interaction.user.id, reason=reason, expires_at=expires_at)
+            summary = f"Banned {len(done)} user(s)" + (f" until {discord.utils.format_dt(expires_at, 'f')}." if expires_at else ".")
+        else:
+            done = await self.bans.unban(self.scrim, user_ids, interaction.user.id)
+            summary = f"Unbanned {len(done)} user(s)." if done else "None of them were banned."
+
+        await interaction.followup.send(summary, ephemeral=True)
+        await self.original_interaction.edit_original_response(embed=await self.build_embed(), view=self)
+
+    @discord.ui.button(label="Ban", style=discord.ButtonStyle.danger, row=1)
+    async def ban(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._get_chat_input(interaction, "ban")
+
+    @discord.ui.button(label="Unban", style=discord.ButtonStyle.success, row=1)
+    async def unban(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._get_chat_input(interaction, "unban")
+
+    @discord.ui.button(label="Back", style=discord.ButtonStyle.secondary, row=1)
+    async def back(self, interaction: discord.Interaction, button: discord.ui.Button):
+        from .manager import ScrimManagerView
+        embed, view = await ScrimManagerView.render(self.bot, interaction.guild.id, interaction.user)
+        await interaction.response.edit_message(embed=embed, view=view)
@@ -1,14 +1,18 @@
 import discord
 import asyncio
-import pytz
-from datetime import datetime
 from core.Bot import ME
+from core.prompts import PromptCancelled
+from core.views import BaseView
 from models.esports.scrims import Scrim
-from ...helper.time_parser import parse_time, IST
+from ...helper.time_parser import parse_time
+from ...helper.dashboard import dashboards
+from ...helper.resolver import CHANNEL_RE, ROLE_RE, parse_id, resolve_channel, resolve_role
+from ...helper.scheduler import as_utc, format_days
+from ._days import DaySelectorView
 
 # --- NEW: Import the manager view to return to it ---
 
-class ConfirmView(discord.ui.View):
+class ConfirmView(BaseView):
     def __init__(self):
         super().__init__(timeout=60.0)
         self.value = None
@@ -23,7 +27,7 @@ class ConfirmView(discord.ui.View):
         self.value = False
         self.stop()
 
-class ScrimEditView(discord.ui.View):
+class ScrimEditView(BaseView):
     """An interactive view for editing an existing scrim."""
 
     def __init__(self, bot: ME, scrim: Scrim, original_interaction: discord.Interaction):
@@ -34,33 +38,31 @@ class ScrimEditView(discord.ui.View):
         
         guild = self.bot.get_guild(scrim.guild_id)
         
-        # --- CORRECTED TIME CONVERSION ON LOAD ---
-        utc_time = scrim.scrim_time.replace(tzinfo=pytz.utc)
-        ist_time = utc_time.astimezone(IST)
-        
         self.data = {
             "Name": scrim.title,
             "Registration Channel": self.bot.get_channel(scrim.reg_channel_id) or "Not-Set",
             "Slotlist Channel": self.bot.get_channel(scrim.slotlist_channel_id) or "Not-Set",
             "Success Role": guild.get_role(scrim.success_role_id) if guild else "Not-Set",
-            "Mentions": 4, # Placeholder
+            "Mentions": scrim.required_mentions,
             "Slots": scrim.total_slots,
-            # Format Open Time as only the time string (e.g., '04:00 AM')
-            "Open Time": ist_time.strftime("%I:%M %p"),
+            # Shown from self.scrim_time as a Discord timestamp in each viewer's timezone
+            "Open Time": "Set",
             "Reactions": "✅, ❌", # Placeholder
             "Ping Role": "Not-Set", # Placeholder
             "Open Role": "@everyone", # Placeholder
-            "Multi-Register": "Not allowed!", # Placeholder
+            "Multi-Register": "Allowed" if scrim.multiregister else "Not allowed!",
             "Team Compulsion": "No!", # Placeholder
-            "Duplicate Team Name": "Allowed", # Placeholder
+            "Duplicate Team Name": "Allowed" if scrim.duplicate_name else "Not allowed!",
             "Autodelete Rejected": "No!", # Placeholder
             "Autodelete Late Messages": "Yes!", # Placeholder
-            "Slotlist Start from": 1, # Placeholder
+            "Slotlist Start from": scrim.slotlist_start,
             "Autoclean": "4:00 AM (Channel, Role)", # Placeholder
             "Scrim Days": scrim.scrim_days,
-            "Required Lines": "Not set", # Placeholder
-            "Duplicate / Fake Tags": ";; Allowed", # Placeholder
+            "Required Lines": scrim.required_lines or "Not set",
+            "Duplicate / Fake Tags": "Allowed" if scrim.duplicate_tags else "Not allowed!",
         }
+        # Replaced by the parsed value when "Open Time" is edited, so save never re-parses.
+        self.scrim_time = scrim.scrim_time
         self.save_changes.disabled = False
 
     def _check_save_button_state(self):
@@ -82,44 +84,52 @@ class ScrimEditView(discord.ui.View):
             value = int(value)
         
         if key in ["Registration Channel", "Slotlist Channel"]:
-            if not value.startswith("<#"):
+            channel_id = parse_id(CHANNEL_RE, value)
+            if channel_id is None:
                 return await interaction.followup.send("Error: Please provide a valid channel mention.", ephemeral=True)
-            try:
-                channel_id = int("".join(filter(str.isdigit, str(value))))
-                channel = await self.bot.fetch_channel(channel_id)
-                if not isinstance(channel, discord.TextChannel): raise ValueError()
-                value = channel
-            except (ValueError, discord.NotFound, discord.Forbidden):
+            value = await resolve_channel(self.bot, interaction.guild, channel_id)
+            if value is None:
                 return await interaction.followup.send("Error: Invalid channel ID or I can't see that channel.", ephemeral=True)
 
         if key == "Ping Role":
             if value.lower() == "@everyone":
                 value = interaction.guild.default_role
-            elif not value.startswith("<@&"):
+            elif (role_id := parse_id(ROLE_RE, value)) is None:
                 return await interaction.followup.send("Error: Please provide a valid role mention or '@everyone'.", ephemeral=True)
             else:
-                try:
-                    role_id = int("".join(filter(str.isdigit, str(value))))
-                    role = interaction.guild.get_role(role_id)
-                    if not role: raise ValueError()
-                    value = role
-                except (ValueError, TypeError):
-                     return await interaction.followup.send("Error: Invalid role ID.", ephemeral=True)
+                value = await resolve_role(interaction.guild, role_id)
+                if value is None:
+                    return await interaction.followup.send("Error: Invalid role ID.", ephemeral=True)
         
         if key in ["Success Role", "Open Role"]:
-            if not value.startswith("<@&"):
+            role_id = parse_id(ROLE_RE, value)
+            if role_id is None:
                 return await interaction.followup.send("Error: Please provide a valid role mention.", ephemeral=True)
-            try:
-                role_id = int("".join(filter(str.isdigit, str(value))))
-                role = interaction.guild.get_role(role_id)
-                if not role: raise ValueError()
-                value = role
-            except (ValueError, TypeError):
-                 return await interaction.followup.send("Error: Invalid role ID.", ephemeral=True)
+            value = await resolve_role(interaction.guild, role_id)
+            if value is None:
+                return await interaction.followup.send("Error: Invalid role ID.", ephemeral=True)
         
+        if key in ["Multi-Register", "Duplicate Team Name", "Duplicate / Fake Tags"]:
+            if value.lower() in ("yes", "y", "allow", "allowed", "on", "true"):
+                value = "Allowed"
+            elif value.lower() in ("no", "n", "deny", "not allowed", "off", "false"):
+                value = "Not allowed!"
+            else:
+                return await interaction.followup.send("Error: Please reply with `yes` or `no`.", ephemeral=True)
+
+        if key == "Slotlist Start from":
+            if not str(value).isdigit() or not (1 <= int(value) <= 100):
+                return await interaction.followup.send("Error: The first slot number must be between 1 and 100.", ephemeral=True)
+            value = int(value)
+
+        if key == "Required Lines":
+            if not str(value).isdigit() or not (0 <= int(value) <= 20):
+                return await interaction.followup.send("Error: Required lines must be a number between 0 and 20.", ephemeral=True)
+            value = int(value) or "Not set"
+
         if key == "Open Time":
             try:
-                parse_time(value)
+                self.scrim_time = parse_time(value, tz=self.bot.timezones.get(interaction.guild.id))
             except ValueError as e:
                 return await interaction.followup.send(f"Error: {e}", ephemeral=True)
 
@@ -153,7 +163,7 @@ class ScrimEditView(discord.ui.View):
         embed.add_field(name="🇩 Success Role:", value=format_field('Success Role'), inline=True)
         embed.add_field(name="🇪 Mentions:", value=format_field('Mentions'), inline=True)
         embed.add_field(name="🇫 Slots:", value=format_field('Slots'), inline=True)
-        embed.add_field(name="🇬 Open Time:", value=format_field('Open Time'), inline=True)
+        embed.add_field(name="🇬 Open Time:", value=f"<t:{int(as_utc(self.scrim_time).timestamp())}:t>", inline=True)
         embed.add_field(name="🇭 Reactions:", value=format_field('Reactions'), inline=True)
         embed.add_field(name="🇮 Ping Role:", value=format_field('Ping Role'), inline=True)
         embed.add_field(name="🇯 Open Role:", value=format_field('Open Role'), inline=True)
@@ -164,7 +174,7 @@ class ScrimEditView(discord.ui.View):
         embed.add_field(name="🇴 Autodelete Late Messages:", value=format_field('Autodelete Late Messages'), inline=True)
         embed.add_field(name="🇵 Slotlist Start from:", value=format_field('Slotlist Start from'), inline=True)
         embed.add_field(name="🇶 Autoclean:", value=format_field('Autoclean'), inline=True)
-        embed.add_field(name="🇷 Scrim Days:", value=f"```{self.data['Scrim Days']}```", inline=True)
+        embed.add_field(name="🇷 Scrim Days:", value=f"```{format_days(self.data['Scrim Days'])}```", inline=True)
         embed.add_field(name="🇸 Required Lines:", value=format_field('Required Lines'), inline=True)
         embed.add_field(name="🇹 Duplicate / Fake Tags:", value=format_field('Duplicate / Fake Tags'), inline=True)
         
@@ -181,10 +191,13 @@ class ScrimEditView(discord.ui.View):
         await interaction.response.defer()
 
         try:
-            message = await self.bot.wait_for("message", timeout=60.0, check=lambda m: m.author == interaction.user and m.channel == interaction.channel)
+            message = await self.bot.prompts.ask(interaction.channel.id, interaction.user.id, timeout=60.0)
         except asyncio.TimeoutError:
             await prompt.delete()
             return await interaction.followup.send("You took too long to respond.", ephemeral=True)
+        except PromptCancelled:
+            # Replaced by a newer prompt from the same user in this channel.
+            return await prompt.delete()
 
         await prompt.delete()
         try: await message.delete()
@@ -195,23 +208,7 @@ class ScrimEditView(discord.ui.View):
     async def _return_to_dashboard(self, interaction: discord.Interaction):
         """A helper function to build and send the main scrim manager dashboard."""
         from .manager import ScrimManagerView
-        
-        scrims = await Scrim.filter(guild_id=interaction.guild.id).order_by("scrim_time")
-        
-        if not scrims:
-            description = "Click `Create Scrim` button for new scrim."
-        else:
-            lines = []
-            for i, s in enumerate(scrims, 1):
-                ist_time = s.scrim_time.astimezone(IST)
-                time_str = ist_time.strftime('%I:%M %p IST')
-                lines.append(f"{i:02}. <:positive:1397965897498628166> : <#{s.reg_channel_id}> - {time_str}")
-            description = "\n".join(lines) + "\n\nClick the `Create Scrim` button to start a new scrim."
-
-        embed = self.bot.embed(title="Scrims Manager", description=description)
-        embed.set_footer(text=f"Total Scrims in this server: {len(scrims)}", icon_url=interaction.user.display_avatar.url)
-        
-        view = ScrimManagerView(self.bot, scrims_exist=bool(scrims))
+        embed, view = await ScrimManagerView.render(self.bot, interaction.guild.id, interaction.user)
         await self.original_interaction.edit_original_response(embed=embed, view=view)
 
     # --- BUTTONS (A-T) ---
@@ -285,7 +282,9 @@ class ScrimEditView(discord.ui.View):
 
     @discord.ui.button(label="R", style=discord.ButtonStyle.secondary, row=3)
     async def set_r(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self._get_chat_input(interaction, "Scrim Days")
+        day_view = DaySelectorView(parent_view=self)
+        day_embed = day_view.build_embed()
+        await interaction.response.edit_message(embed=day_embed, view=day_view)
 
     @discord.ui.button(label="S", style=discord.ButtonStyle.secondary, row=3)
     async def set_s(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -309,6 +308,8 @@ class ScrimEditView(discord.ui.View):
         
         if confirm_view.value is True:
             await self.scrim.delete()
+            dashboards.invalidate(self.scrim.guild_id)
+            self.bot.dispatch("scrim_delete", self.scrim)
             await interaction.followup.send("Scrim has been deleted.", ephemeral=True)
             await self._return_to_dashboard(interaction)
         else:
@@ -320,6 +321,12 @@ class ScrimEditView(discord.ui.View):
         self.scrim.title = self.data["Name"]
         self.scrim.total_slots = self.data["Slots"]
         self.scrim.scrim_days = self.data["Scrim Days"]
+        self.scrim.required_mentions = self.data["Mentions"]
+        self.scrim.required_lines = self.data["Required Lines"] if isinstance(self.data["Required Lines"], int) else 0
+        self.scrim.multiregister = self.data["Multi-Register"] == "Allowed"
+        self.scrim.duplicate_name = self.data["Duplicate Team Name"] == "Allowed"
+        self.scrim.duplicate_tags = self.data["Duplicate / Fake Tags"] == "Allowed"
+        self.scrim.slotlist_start = self.data["Slotlist Start from"]
         
         if isinstance(self.data["Registration Channel"], discord.TextChannel):
             self.scrim.reg_channel_id = self.data["Registration Channel"].id
@@ -329,13 +336,12 @@ class ScrimEditView(discord.ui.View):
             self.scrim.success_role_id = self.data["Success Role"].id
         if isinstance(self.data["Ping Role"], discord.Role):
             self.scrim.ping_role_id = self.data["Ping Role"].id
-            
-        try:
-            self.scrim.scrim_time = parse_time(self.data["Open Time"])
-        except ValueError as e:
-            return await interaction.response.send_message(f"Error in Open Time: {e}", ephemeral=True)
+
+        self.scrim.scrim_time = self.scrim_time
 
         await self.scrim.save()
+        dashboards.invalidate(self.scrim.guild_id)
+        self.bot.dispatch("scrim_update", self.scrim)
         
         await interaction.response.send_message("✅ Changes saved successfully!", ephemeral=True)
         await self._return_to_dashboard(interaction)
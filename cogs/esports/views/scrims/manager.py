@@ -1,73 +1,119 @@
 import discord
-import asyncio
+from typing import Tuple
 from core.Bot import ME
-from models.esports.scrims import Scrim
+from core.views import BaseView, PersistentItem
 
 # Import the views for the wizard, editor, and our new selector
 from ._wiz import ScrimWizardView
+from .bans import ScrimBanView
 from .edit import ScrimEditView
+from .reserves import ScrimReserveView
 from .selector import ScrimSelectorView
+from ...helper.dashboard import Dashboard, dashboards
 
-class ScrimManagerView(discord.ui.View):
-    """A view containing all the buttons for the scrim manager dashboard."""
+# action -> (label, style, row). The action is part of the custom_id, so keep these keys stable.
+ACTIONS = {
+    "create": ("Create Scrim", discord.ButtonStyle.success, 0),
+    "edit": ("Edit Settings", discord.ButtonStyle.primary, 0),
+    "toggle_reg": ("Instant Start/Stop Reg", discord.ButtonStyle.danger, 0),
+    "reserve": ("Reserve Slots", discord.ButtonStyle.success, 0),
+    "ban": ("Ban/Unban", discord.ButtonStyle.danger, 0),
+    "design": ("Design", discord.ButtonStyle.primary, 1),
+    "slotlist": ("Manage Slotlist", discord.ButtonStyle.success, 1),
+    "toggle": ("Enable/Disable", discord.ButtonStyle.danger, 1),
+    "help": ("Need Help!", discord.ButtonStyle.danger, 1),
+    "drop": ("Drop Location Panel", discord.ButtonStyle.primary, 1),
+    "prev": ("◀", discord.ButtonStyle.secondary, 2),
+    "next": ("▶", discord.ButtonStyle.secondary, 2),
+}
 
-    def __init__(self, bot: ME, scrims_exist: bool):
+
+class ManagerButton(PersistentItem, discord.ui.DynamicItem[discord.ui.Button], template=r"sm:(?P<action>[a-z_]+):(?P<page>\d+)"):
+    """A dashboard button; its custom_id `sm:<action>:<page>` holds the page the dashboard shows."""
+
+    def __init__(self, action: str, page: int = 0, disabled: bool = False):
+        label, style, row = ACTIONS[action]
+        super().__init__(discord.ui.Button(
+            label=label, style=style, row=row, disabled=disabled, custom_id=f"sm:{action}:{page}"
+        ))
+        self.action = action
+        self.page = page
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match["action"], int(match["page"]))
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # The dashboard outlives the smanager call, so check who is clicking.
+        if interaction.user.guild_permissions.manage_guild:
+            return True
+        await interaction.response.send_message("You need the Manage Server permission to use this.", ephemeral=True)
+        return False
+
+    async def handle(self, interaction: discord.Interaction):
+        bot: ME = interaction.client
+
+        if self.action == "create":
+            wizard_view = ScrimWizardView(bot, interaction)
+            wizard_embed = await wizard_view.build_embed()
+            await interaction.response.edit_message(embed=wizard_embed, view=wizard_view)
+
+        elif self.action == "edit":
+            # Displays a dropdown to select a scrim to edit.
+            dashboard = await dashboards.get(interaction.guild.id)
+            selector_view = ScrimSelectorView(bot, dashboard.page(self.page), original_interaction=interaction)
+            prompt_embed = bot.embed(description="Please select a scrim to edit from the dropdown below.")
+            await interaction.response.edit_message(embed=prompt_embed, view=selector_view)
+
+        elif self.action == "reserve":
+            dashboard = await dashboards.get(interaction.guild.id)
+            reserve_view = ScrimReserveView(bot, dashboard.page(self.page), original_interaction=interaction)
+            await interaction.response.edit_message(embed=await reserve_view.build_embed(), view=reserve_view)
+
+        elif self.action == "ban":
+            dashboard = await dashboards.get(interaction.guild.id)
+            ban_view = ScrimBanView(bot, dashboard.page(self.page), original_interaction=interaction)
+            await interaction.response.edit_message(embed=await ban_view.build_embed(), view=ban_view)
+
+        elif self.action in ("prev", "next"):
+            page = self.page - 1 if self.action == "prev" else self.page + 1
+            embed, view = await ScrimManagerView.render(bot, interaction.guild.id, interaction.user, page)
+            await interaction.response.edit_message(embed=embed, view=view)
+
+        else:
+            await interaction.response.send_message("This feature is not yet implemented.", ephemeral=True)
+
+
+class ScrimManagerView(BaseView):
+    """
+    The buttons of the scrim manager dashboard.
+
+    Only ManagerButtons, which are dispatched by custom_id, so sending this
+    keeps nothing in memory and the dashboard keeps working after a restart.
+    """
+
+    def __init__(self, dashboard: Dashboard, page: int = 0):
         super().__init__(timeout=None)
-        self.bot = bot
-
-        if not scrims_exist:
-            for item in self.children:
-                if isinstance(item, discord.ui.Button) and item.label != "Create Scrim":
-                    item.disabled = True
-
-    async def placeholder_callback(self, interaction: discord.Interaction):
-        await interaction.response.send_message("This feature is not yet implemented.", ephemeral=True)
-
-    @discord.ui.button(label="Create Scrim", style=discord.ButtonStyle.success, row=0)
-    async def create_scrim(self, interaction: discord.Interaction, button: discord.ui.Button):
-        wizard_view = ScrimWizardView(self.bot, interaction)
-        wizard_embed = await wizard_view.build_embed()
-        await interaction.response.edit_message(embed=wizard_embed, view=wizard_view)
-
-    @discord.ui.button(label="Edit Settings", style=discord.ButtonStyle.primary, row=0)
-    async def edit_settings(self, interaction: discord.Interaction, button: discord.ui.Button):
-        """Displays a dropdown to select a scrim to edit."""
-        scrims = await Scrim.filter(guild_id=interaction.guild.id).order_by("scrim_time")
-        
-        selector_view = ScrimSelectorView(self.bot, scrims, original_interaction=interaction)
-        prompt_embed = self.bot.embed(description="Please select a scrim to edit from the dropdown below.")
-        
-        await interaction.response.edit_message(embed=prompt_embed, view=selector_view)
-
-
-    @discord.ui.button(label="Instant Start/Stop Reg", style=discord.ButtonStyle.danger, row=0)
-    async def toggle_reg(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.placeholder_callback(interaction)
-
-    @discord.ui.button(label="Reserve Slots", style=discord.ButtonStyle.success, row=0)
-    async def reserve_slots(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.placeholder_callback(interaction)
-        
-    @discord.ui.button(label="Ban/Unban", style=discord.ButtonStyle.danger, row=0)
-    async def ban_unban(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.placeholder_callback(interaction)
-
-    @discord.ui.button(label="Design", style=discord.ButtonStyle.primary, row=1)
-    async def design(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.placeholder_callback(interaction)
-
-    @discord.ui.button(label="Manage Slotlist", style=discord.ButtonStyle.success, row=1)
-    async def manage_slotlist(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.placeholder_callback(interaction)
-
-    @discord.ui.button(label="Enable/Disable", style=discord.ButtonStyle.danger, row=1)
-    async def enable_disable(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.placeholder_callback(interaction)
-        
-    @discord.ui.button(label="Need Help!", style=discord.ButtonStyle.danger, row=1)
-    async def need_help(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.placeholder_callback(interaction)
-        
-    @discord.ui.button(label="Drop Location Panel", style=discord.ButtonStyle.primary, row=1)
-    async def drop_location(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self.placeholder_callback(interaction)
+        self.page = max(0, min(page, dashboard.pages - 1))
+
+        for action in ACTIONS:
+            if action in ("prev", "next"):
+                if dashboard.pages == 1:
+                    continue
+                disabled = self.page == (0 if action == "prev" else dashboard.pages - 1)
+            else:
+                disabled = not dashboard and action != "create"
+            self.add_item(ManagerButton(action, self.page, disabled=disabled))
+
+    @classmethod
+    async def render(cls, bot: ME, guild_id: int, user: discord.abc.User, page: int = 0) -> Tuple[discord.Embed, "ScrimManagerView"]:
+        """Builds the dashboard embed and view for a guild from the cached dashboard."""
+        dashboard = await dashboards.get(guild_id)
+        view = cls(dashboard, page)
+
+        embed = bot.embed(title="Scrims Manager", description=dashboard.description(view.page))
+        footer = f"Total Scrims in this server: {len(dashboard)}"
+        if dashboard.pages > 1:
+            footer += f" | Page {view.page + 1}/{dashboard.pages}"
+        embed.set_footer(text=footer, icon_url=user.display_avatar.url)
+        return embed, view
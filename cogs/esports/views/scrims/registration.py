@@ -1,17 +1,117 @@
 import discord
+from core.outbound import Priority
+from core.views import BaseView, PersistentItem
+from core.writebehind import FlushError
+from models.esports.scrims import Scrim, ScrimSlot
+
+from ...helper.claims import SlotHeld
+
+# action -> (label, style). The action is part of the custom_id, so keep these keys stable.
+ACTIONS = {
+    "myslot": ("My Slot", discord.ButtonStyle.primary),
+    "cancel": ("Cancel Slot", discord.ButtonStyle.danger),
+    "claim": ("Claim Slot", discord.ButtonStyle.success),
+}
+
+
+class ScrimButton(PersistentItem, discord.ui.DynamicItem[discord.ui.Button], template=r"scrim:(?P<action>[a-z]+):(?P<scrim_id>\d+)"):
+    """A button on a scrim's registration message, dispatched by its custom_id `scrim:<action>:<scrim id>`."""
+
+    def __init__(self, action: str, scrim_id: int):
+        label, style = ACTIONS[action]
+        super().__init__(discord.ui.Button(label=label, style=style, custom_id=f"scrim:{action}:{scrim_id}"))
+        self.action = action
+        self.scrim_id = scrim_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match["action"], int(match["scrim_id"]))
+
+    async def handle(self, interaction: discord.Interaction):
+        automation = interaction.client.get_cog("ScrimAutomation")
+        registration = automation.registrations.get(self.scrim_id) if automation else None
+
+        if self.action == "myslot":
+            if registration:
+                slots = registration.slots_of(interaction.user.id)
+            else:
+                slots = [
+                    slot for slot in await ScrimSlot.filter(scrim_id=self.scrim_id)
+                    if slot.user_id == interaction.user.id or interaction.user.id in slot.members
+                ]
+            if not slots:
+                return await interaction.response.send_message("You don't have a slot in this scrim.", ephemeral=True)
+            lines = "\n".join(f"Slot **{slot.slot_no}**: {slot.team_name}" for slot in sorted(slots, key=lambda s: s.slot_no))
+            await interaction.response.send_message(lines, ephemeral=True)
+
+        elif self.action == "cancel":
+            if not registration:
+                return await self._cancel_closed(interaction, automation)
+            if not registration.slots_of(interaction.user.id):
+                return await interaction.response.send_message("You don't have a slot in this scrim.", ephemeral=True)
+            cancelled = registration.cancel(interaction.user.id)
+            if not cancelled:
+                return await interaction.response.send_message("Only the team's registrant can cancel a slot.", ephemeral=True)
+            slots = ", ".join(str(slot.slot_no) for slot in cancelled)
+            await interaction.response.send_message(f"Cancelled your slot ({slots}).", ephemeral=True)
+
+        elif self.action == "claim":
+            # When many users click at once a claim may retry against the database, which can outlast the 3 second reply window.
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            if registration:
+                return await interaction.followup.send("Registration is still open, register in this channel instead.", ephemeral=True)
+            scrim = await Scrim.get_or_none(id=self.scrim_id)
+            if not scrim or not automation:
+                return await interaction.followup.send("This scrim no longer exists.", ephemeral=True)
+            if await automation.bans.is_banned(scrim.id, interaction.user.id):
+                return await interaction.followup.send("You are banned from this scrim.", ephemeral=True)
+            try:
+                slot = await automation.claims.claim(scrim, interaction.user)
+            except SlotHeld:
+                return await interaction.followup.send("You already have a slot in this scrim.", ephemeral=True)
+            if not slot:
+                return await interaction.followup.send("Too late, every free slot has been claimed.", ephemeral=True)
+            await interaction.followup.send(f"You claimed slot **{slot.slot_no}**!", ephemeral=True)
+
+    async def _cancel_closed(self, interaction: discord.Interaction, automation):
+        """Cancels a slot after registration closed: the slot goes to a reserve or is put up for claims."""
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        scrim = await Scrim.get_or_none(id=self.scrim_id)
+        if not scrim or not automation:
+            return await interaction.followup.send("This scrim no longer exists.", ephemeral=True)
+
+        try:
+            released = await automation.claims.cancel(scrim, interaction.user.id)
+        except FlushError:
+            return await interaction.followup.send("Couldn't reach the database, please try again in a moment.", ephemeral=True)
+        if not released:
+            return await interaction.followup.send("You don't have a slot you registered in this scrim.", ephemeral=True)
+
+        slots = ", ".join(str(slot.slot_no) for slot, _ in released)
+        await interaction.followup.send(f"Cancelled your slot ({slots}).", ephemeral=True)
+
+        vacant = [slot.slot_no for slot, reserve in released if reserve is None]
+        channel = interaction.client.get_channel(scrim.reg_channel_id) if scrim.reg_channel_id else None
+        if vacant and channel:
+            numbers = ", ".join(f"**{n}**" for n in vacant)
+            interaction.client.outbound.send(
+                channel, Priority.user, content=f"Slot {numbers} is free, first to claim it gets it!", view=ClaimView(scrim.id),
+            )
+
+
+class RegistrationView(BaseView):
+    """The buttons on a scrim's registration message; only ScrimButtons, so nothing is kept per message."""
 
-class RegistrationView(discord.ui.View):
     def __init__(self, scrim_id: int):
         super().__init__(timeout=None)
         self.scrim_id = scrim_id
+        for action in ("myslot", "cancel"):
+            self.add_item(ScrimButton(action, scrim_id))
+
 
-    # @discord.ui.button(label="Register", style=discord.ButtonStyle.green, custom_id="register_button")
-    # async def register_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-    #     """
-    #     This button will be attached to the scrim registration message.
-    #     When a user clicks it, we will open a modal (a pop-up form)
-    #     to ask for their team name and player tags.
-    #     """
-    #     pass
+class ClaimView(BaseView):
+    """Posted when a slot of a closed scrim frees up and no reserve is waiting for it."""
 
-    # We will add other buttons here later, like "View Slot List" or "Cancel Registration".
+    def __init__(self, scrim_id: int):
+        super().__init__(timeout=None)
+        self.add_item(ScrimButton("claim", scrim_id))
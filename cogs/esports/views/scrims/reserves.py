@@ -0,0 +1,118 @@
+import asyncio
+from typing import Optional
+
+import discord
+from core.Bot import ME
+from core.prompts import PromptCancelled
+from core.views import BaseView
+from models.esports.scrims import Scrim, ScrimReserve
+from ...helper.claims import parse_team
+from ...helper.dashboard import DashboardRow
+
+# Reserves listed in the embed; the rest are counted.
+SHOWN_RESERVES = 20
+
+
+class ReserveScrimSelect(discord.ui.Select):
+    """Chooses the scrim whose reserve list the view manages."""
+
+    def __init__(self, bot: ME, scrims: list[DashboardRow]):
+        options = []
+        for scrim in scrims:
+            channel = bot.get_channel(scrim.reg_channel_id)
+            label_name = channel.name if channel else scrim.title
+            options.append(discord.SelectOption(label=f"ID: {scrim.id} | #{label_name}", value=str(scrim.id)))
+        super().__init__(placeholder="Select a scrim...", options=options)
+
+    async def callback(self, interaction: discord.Interaction):
+        view: ScrimReserveView = self.view
+        view.scrim = await Scrim.get_or_none(id=int(self.values[0]))
+        view.add.disabled = view.remove.disabled = view.scrim is None
+        await interaction.response.edit_message(embed=await view.build_embed(), view=view)
+
+
+class ScrimReserveView(BaseView):
+    """Adds teams to and removes them from a scrim's reserve list, from the scrim manager."""
+
+    def __init__(self, bot: ME, scrims: list[DashboardRow], original_interaction: discord.Interaction):
+        super().__init__(timeout=180.0)
+        self.bot = bot
+        self.original_interaction = original_interaction
+        self.scrim: Optional[Scrim] = None
+        self.add_item(ReserveScrimSelect(bot, scrims))
+        self.add.disabled = self.remove.disabled = True
+
+    @property
+    def claims(self):
+        return self.bot.get_cog("ScrimAutomation").claims
+
+    async def build_embed(self) -> discord.Embed:
+        if self.scrim is None:
+            return self.bot.embed(title="Reserve Slots", description="Select the scrim whose reserve list you want to manage.")
+
+        total = await ScrimReserve.filter(scrim_id=self.scrim.id).count()
+        lines = [
+            f"{n}. {reserve.team_name} (<@{reserve.user_id}>)"
+            for n, reserve in enumerate(
+                await ScrimReserve.filter(scrim_id=self.scrim.id).order_by("created_at", "id").limit(SHOWN_RESERVES), 1
+            )
+        ]
+        if total > SHOWN_RESERVES:
+            lines.append(f"...and {total - SHOWN_RESERVES} more")
+
+        embed = self.bot.embed(title=f"Reserve Slots | {self.scrim.title}", description="\n".join(lines) or "No team is waiting.")
+        embed.set_footer(text=f"Reserves: {total} | Cleared when the next registration round opens")
+        return embed
+
+    async def _get_chat_input(self, interaction: discord.Interaction, action: str):
+        """Asks for the team to add, or the leaders to remove, in the chat and applies it."""
+        if action == "add":
+            hint = "Mention the team's leader first, then its players, and write the team name."
+        else:
+            hint = "Mention the leaders of the teams to take off the reserve list, or paste their IDs."
+        prompt = await interaction.channel.send(embed=discord.Embed(description=hint, color=self.bot.config.COLOR))
+        await interaction.response.defer()
+
+        try:
+            message = await self.bot.prompts.ask(interaction.channel.id, interaction.user.id, timeout=60.0)
+        except asyncio.TimeoutError:
+            await prompt.delete()
+            return await interaction.followup.send("You took too long to respond.", ephemeral=True)
+        except PromptCancelled:
+            return await prompt.delete()
+
+        await prompt.delete()
+        try: await message.delete()
+        except discord.NotFound: pass
+
+        user_ids, team_name = parse_team(message.content)
+        if not user_ids:
+            return await interaction.followup.send("No users found, mention them or paste their IDs.", ephemeral=True)
+
+        if action == "add":
+            if not team_name:
+                return await interaction.followup.send("Write the team name along with the mentions.", ephemeral=True)
+            if await self.claims.add_reserve(self.scrim, user_ids, team_name):
+                summary = f"Added **{team_name}** to the reserves."
+            else:
+                summary = f"<@{user_ids[0]}> already leads a team on the reserve list."
+        else:
+            removed = await self.claims.remove_reserves(self.scrim, user_ids)
+            summary = f"Removed {removed} team(s) from the reserves." if removed else "None of them lead a reserve team."
+
+        await interaction.followup.send(summary, ephemeral=True)
+        await self.original_interaction.edit_original_response(embed=await self.build_embed(), view=self)
+
+    @discord.ui.button(label="Add", style=discord.ButtonStyle.success, row=1)
+    async def add(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._get_chat_input(interaction, "add")
+
+    @discord.ui.button(label="Remove", style=discord.ButtonStyle.danger, row=1)
+    async def remove(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._get_chat_input(interaction, "remove")
+
+    @discord.ui.button(label="Back", style=discord.ButtonStyle.secondary, row=1)
+    async def back(self, interaction: discord.Interaction, button: discord.ui.Button):
+        from .manager import ScrimManagerView
+        embed, view = await ScrimManagerView.render(self.bot, interaction.guild.id, interaction.user)
+        await interaction.response.edit_message(embed=embed, view=view)
@@ -1,12 +1,14 @@
 import discord
 from core.Bot import ME
+from core.views import BaseView
 from models.esports.scrims import Scrim
 from .edit import ScrimEditView
+from ...helper.dashboard import DashboardRow
 
 class ScrimSelect(discord.ui.Select):
     """A select menu to choose a scrim to edit."""
     # --- UPDATED: Accept the new argument ---
-    def __init__(self, bot: ME, scrims: list[Scrim], original_interaction: discord.Interaction):
+    def __init__(self, bot: ME, scrims: list[DashboardRow], original_interaction: discord.Interaction):
         self.bot = bot
         self.original_interaction = original_interaction
         
@@ -36,10 +38,10 @@ class ScrimSelect(discord.ui.Select):
         
         await interaction.response.edit_message(embed=edit_embed, view=edit_view)
 
-class ScrimSelectorView(discord.ui.View):
+class ScrimSelectorView(BaseView):
     """A view that contains the scrim selection dropdown."""
     # --- UPDATED: Accept the new argument ---
-    def __init__(self, bot: ME, scrims: list[Scrim], original_interaction: discord.Interaction):
+    def __init__(self, bot: ME, scrims: list[DashboardRow], original_interaction: discord.Interaction):
         super().__init__(timeout=180.0)
         # Pass the argument down to the Select menu
         self.add_item(ScrimSelect(bot, scrims, original_interaction))
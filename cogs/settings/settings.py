@@ -1,5 +1,6 @@
 import discord
 from discord.ext import commands
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 # Import the main bot class for type hinting
 from core.Bot import ME
@@ -23,6 +24,7 @@ class Settings(commands.Cog):
             return await ctx.send("The prefix can't be longer than 10 characters.")
 
         await Guild.update_or_create(defaults={"prefix": new_prefix}, id=ctx.guild.id)
+        self.bot.prefixes.set(ctx.guild.id, new_prefix)
 
         embed = self.bot.embed(
             title="✅ Prefix Updated",
@@ -30,6 +32,27 @@ class Settings(commands.Cog):
         )
         await ctx.send(embed=embed)
 
+    @commands.command(name="settimezone", aliases=["settz"])
+    @commands.has_permissions(manage_guild=True)
+    async def set_timezone(self, ctx: commands.Context, timezone: str):
+        """Sets the timezone scrim open times are entered and scheduled in (e.g. `Europe/Berlin`)."""
+
+        try:
+            ZoneInfo(timezone)
+        except (ValueError, ZoneInfoNotFoundError):
+            return await ctx.send("Unknown timezone. Use a name like `Asia/Kolkata` or `Europe/Berlin`.")
+
+        old_tz = self.bot.timezones.get(ctx.guild.id)
+        await Guild.update_or_create(defaults={"timezone": timezone}, id=ctx.guild.id)
+        self.bot.timezones.set(ctx.guild.id, timezone)
+        self.bot.dispatch("guild_timezone_update", ctx.guild.id, old_tz, self.bot.timezones.get(ctx.guild.id))
+
+        embed = self.bot.embed(
+            title="✅ Timezone Updated",
+            description=f"Scrim times in this server now use `{timezone}`.",
+        )
+        await ctx.send(embed=embed)
+
 
 async def setup(bot: ME):
     """The setup function is required for the bot to load the cog."""
@@ -1,6 +1,6 @@
+import asyncio
 import discord
 from discord.ext import commands
-import psutil
 import time
 # Import the main bot class for type hinting
 from core.Bot import ME
@@ -16,27 +16,112 @@ class Utility(commands.Cog):
     async def ping(self, ctx: commands.Context):
         """Checks the bot's latency and system status."""
 
-        # 1. Get Discord API Latency
-        api_latency = self.bot.latency * 1000  # Convert to milliseconds
+        # Answer from the background sampler; only sample inline right after startup.
+        sample = self.bot.sampler.latest or await self.bot.sampler.sample()
+        trends = {seconds: self.bot.sampler.window(seconds) for seconds in (60, 300)}
 
-        # 2. Measure Database Latency
-        db_start_time = time.perf_counter()
-        # Execute a simple query to check the connection and measure response time
-        await self.bot.db.execute_query("SELECT 1")
-        db_end_time = time.perf_counter()
-        db_latency = (db_end_time - db_start_time) * 1000
+        def line(label: str, field: str, unit: str) -> str:
+            value = getattr(sample, field)
+            text = f"<a:dot_red:1397925925882036254> {label}: **{'-' if value is None else f'{value:.1f}{unit}'}**"
+            averages = [window[field][0] for window in trends.values() if field in window]
+            if len(averages) == 2:
+                text += f" (1m `{averages[0]:.1f}` / 5m `{averages[1]:.1f}`)"
+            return text
 
-        # 3. Get CPU Utilization
-        cpu_usage = psutil.cpu_percent()
-
-        # Create the embed with all the new information
         embed = self.bot.embed(
             title="<a:srt_discordloading:1397925447550898187> Pong!",
+            description="\n".join((
+                line("API Latency", "gateway", "ms"),
+                line("Database Latency", "db", "ms"),
+                line("CPU Utilization", "cpu", "%"),
+                line("Event Loop Lag", "loop_lag", "ms"),
+                f"<a:dot_red:1397925925882036254> Memory: **{sample.rss / 2**20:.0f} MB**",
+            )),
+        )
+        embed.set_footer(text=f"Sampled {time.time() - sample.at:.0f}s ago · {self.bot.config.FOOTER}")
+
+        # In cluster mode, add the totals reported by every cluster
+        if self.bot.cluster:
+            try:
+                clusters = await self.bot.cluster.stats()
+            except (asyncio.TimeoutError, ConnectionError):
+                clusters = {}
+            for cluster_id, stats in sorted(clusters.items()):
+                latency = f"{stats['latency'] * 1000:.2f}ms" if stats["latency"] is not None else "starting"
+                shards = f"{stats['shards'][0]}-{stats['shards'][-1]}" if stats["shards"] else "-"
+                embed.add_field(
+                    name=f"Cluster {cluster_id}" + (" (this)" if cluster_id == self.bot.cluster_id else ""),
+                    value=f"Shards: `{shards}`\nGuilds: `{stats['guilds']}`\nLatency: `{latency}`",
+                    inline=True,
+                )
+        await ctx.send(embed=embed)
+
+    @commands.command(name="dbstats", hidden=True)
+    @commands.check(lambda ctx: ctx.author.id in ctx.bot.config.DEVS)
+    async def db_stats(self, ctx: commands.Context, action: str = None):
+        """Shows query latency, pool usage and slow queries of this process. `reset` clears them."""
+
+        metrics = self.bot.db_metrics
+        if action == "reset":
+            metrics.reset()
+            return await ctx.send("Database metrics reset.")
+
+        stats = metrics.snapshot(self.bot.db)
+        lines = [
+            f"{kind:<6} {h['count']:>8} {h['avg_ms']:>8.2f} {h['p50_ms']:>8.1f} {h['p99_ms']:>8.1f} {h['max_ms']:>8.1f}"
+            for kind, h in stats["queries"].items()
+        ]
+        wait = stats["pool_wait"]
+        embed = self.bot.embed(
+            title="Database",
+            description=(
+                "```\nTYPE      COUNT   AVG ms   P50 ms   P99 ms   MAX ms\n"
+                + ("\n".join(lines) or "no queries yet")
+                + "\n```"
+            ),
+        )
+        embed.add_field(
+            name="Queries",
+            value=(
+                f"In flight: `{stats['in_flight']}` (peak `{stats['peak_in_flight']}`)\n"
+                f"Errors: `{stats['errors']}`\nSince: <t:{int(stats['since'])}:R>"
+            ),
+        )
+        pool = stats["pool"]
+        embed.add_field(
+            name="Pool",
+            value=(
+                f"Size: `{pool['size']}` ({pool['idle']} idle, {pool['min']}-{pool['max']})\n"
+                f"Wait p99: `{wait['p99_ms']:.1f}ms` (max `{wait['max_ms']:.1f}ms`)"
+            ) if pool else "Not pooled",
+        )
+        if stats["slow"]:
+            slow = "\n".join(f"`{q['ms']:.0f}ms` {q['sql'][:80]}" for q in stats["slow"][-5:])
+            embed.add_field(name="Slowest recent", value=slow[:1024], inline=False)
+        await ctx.send(embed=embed)
+
+    @commands.command(name="spans", hidden=True)
+    @commands.check(lambda ctx: ctx.author.id in ctx.bot.config.DEVS)
+    async def spans(self, ctx: commands.Context, action: str = None):
+        """Shows the slowest commands and buttons of this process by p99. `reset` clears them."""
+
+        telemetry = self.bot.telemetry
+        if action == "reset":
+            telemetry.reset()
+            return await ctx.send("Telemetry reset.")
+
+        rows = telemetry.snapshot()["spans"][:15]
+        lines = [
+            f"{row['name'][:28]:<28} {row['count']:>6} {row['errors']:>4} {row['p50_ms']:>7.0f} {row['p99_ms']:>7.0f} {row['max_ms']:>7.0f}"
+            for row in rows
+        ]
+        embed = self.bot.embed(
+            title="Slowest commands & interactions",
             description=(
-                f"<a:dot_red:1397925925882036254> API Latency: **{api_latency:.2f}ms**\n"
-                f"<a:dot_red:1397925925882036254> Database Latency: **{db_latency:.2f}ms**\n"
-                f"<a:dot_red:1397925925882036254> CPU Utilization: **{cpu_usage:.1f}%**"
-            )
+                "```\nNAME                          COUNT  ERR  P50 ms  P99 ms  MAX ms\n"
+                + ("\n".join(lines) or "nothing recorded yet")
+                + "\n```"
+            ),
         )
         await ctx.send(embed=embed)
 
@@ -6,7 +6,35 @@ SUPABASE_URL = ""
 
 SUPABASE_KEY = ""
 
-TORTOISE = {}
+# Connection pool size of each process (every cluster opens its own pool).
+# Keep DB_POOL_MAX * clusters below the database's connection limit.
+DB_POOL_MIN = 1
+DB_POOL_MAX = 10
+
+TORTOISE = {
+    "connections": {
+        "default": {
+            "engine": "tortoise.backends.asyncpg",
+            "credentials": {
+                "host": "",
+                "port": 5432,
+                "user": "",
+                "password": "",
+                "database": "postgres",
+                "minsize": DB_POOL_MIN,
+                "maxsize": DB_POOL_MAX,
+            },
+        },
+    },
+    "apps": {
+        "models": {
+            "models": ["models.misc.guild", "models.esports.scrims", "aerich.models"],
+            "default_connection": "default",
+        },
+    },
+}
+# A URL works too; pool sizes then go in the query string:
+# "default": SUPABASE_CONNECTION_STRING + "?minsize=1&maxsize=10"
 
 EXTENSIONS = ()
 
@@ -31,4 +59,36 @@ DEVS = ()
 # LOGS
 SHARD_LOG = ""
 ERROR_LOG = ""
-PUBLIC_LOG = ""
\ No newline at end of file
+PUBLIC_LOG = ""
+
+# SCRIM WRITE-BEHIND (see core/writebehind.py)
+JOURNAL_DIR = "journal"
+
+WRITE_FLUSH_INTERVAL = 1.0  # seconds between batched writes
+
+# SHARDING / CLUSTERS (see launcher.py)
+CLUSTERS = 1
+
+SHARD_COUNT = None  # None = use Discord's recommended shard count
+
+IPC_PATH = "/tmp/me-cluster.sock"
+
+CLUSTER_START_DELAY = 5
+
+# Point these at tools/mock_gateway.py to run clusters without Discord
+API_BASE = None
+
+GATEWAY_URL = None
+
+# Seconds between CPU/memory/latency samples shown by the ping command
+SAMPLE_INTERVAL = 5.0
+
+# Report callbacks that block the event loop longer than this many seconds
+# to ERROR_LOG (e.g. 0.25). None disables the watchdog.
+WATCHDOG_THRESHOLD = None
+
+# How many registration DMs may be sent at the same time
+DM_CONCURRENCY = 5
+
+# Seconds slotlist changes are collected before the posted slotlist is edited
+SLOTLIST_EDIT_DELAY = 2.0
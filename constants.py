@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 
 import discord
-import pytz
+from zoneinfo import ZoneInfo
 
 import config
 
@@ -24,6 +24,11 @@ class Day(Enum):
     sunday = "sunday"
 
 
+# Scrim days are stored as a 7-bit mask: bit 0 is Monday, bit 6 is Sunday (matching datetime.weekday()).
+DAY_BITS = {day: 1 << i for i, day in enumerate(Day)}
+ALL_DAYS = sum(DAY_BITS.values())
+
+
 class PremiumPurchase(Enum):
     GIFT = "gift"
     PARTNERSHIP = "partner"
@@ -60,6 +65,9 @@ class EsportsLog(Enum):
     open = "open"
     closed = "closed"
     success = "reg_success"
+    cancel = "slot_cancel"
+    claim = "slot_claim"
+    reserve = "slot_reserve"
 
 
 class EsportsRole(Enum):
@@ -221,4 +229,6 @@ class HelpGIF(Enum):
 
 
 MISSING = _Sentinel()
-IST = pytz.timezone("Asia/Kolkata")
\ No newline at end of file
+# Guilds that never ran `settimezone` use this timezone for scrim times.
+DEFAULT_TIMEZONE = "Asia/Kolkata"
+IST = ZoneInfo(DEFAULT_TIMEZONE)
\ No newline at end of file
@@ -1,17 +1,30 @@
 import asyncio
 import os
 from datetime import datetime
+from typing import List, Optional
 
 import discord
+import yarl
 from discord.ext import commands
 from tortoise import Tortoise, connections
+from tortoise.expressions import Q, RawSQL
 
 # Import your configuration file
 import config as cfg
+from constants import DEFAULT_TIMEZONE
 
 # Import the Guild model at the top level
 from models.misc.guild import Guild
 from core.help import MyHelp
+from core.cache import PrefixCache, TimezoneCache
+from core.cluster import ClusterClient
+from core.outbound import Outbound
+from core.prompts import PromptRouter
+from core.db import DatabaseMetrics, metrics as db_metrics
+from core.sampler import SystemSampler
+from core.telemetry import TelemetryTree, log, telemetry
+from core.watchdog import LoopWatchdog
+from core.writebehind import ScrimWriteBuffer
 
 
 # --- Basic Bot Setup ---
@@ -23,17 +36,55 @@ os.environ["JISHAKU_HIDE"] = "True"
 os.environ["JISHAKU_NO_UNDERSCORE"] = "True"
 os.environ["JISHAKU_NO_DM_TRACEBACK"] = "True"
 
+# Optional overrides for running against a local mock of the Discord API (see tools/mock_gateway.py).
+if getattr(cfg, "API_BASE", None):
+    discord.http.Route.BASE = cfg.API_BASE
+if getattr(cfg, "GATEWAY_URL", None):
+    discord.gateway.DiscordWebSocket.DEFAULT_GATEWAY = yarl.URL(cfg.GATEWAY_URL)
+
 
 # --- The Main Bot Class ---
-class ME(commands.Bot):
-    def __init__(self):
+class ME(commands.AutoShardedBot):
+    def __init__(
+        self,
+        *,
+        shard_ids: Optional[List[int]] = None,
+        shard_count: Optional[int] = None,
+        cluster_id: Optional[int] = None,
+        ipc_path: Optional[str] = None,
+    ):
         super().__init__(
             command_prefix=self.get_prefix,
             intents=intents,
             help_command=MyHelp(),
+            tree_cls=TelemetryTree,
+            shard_ids=shard_ids,
+            shard_count=shard_count,
         )
         self.start_time = datetime.utcnow()
 
+        # Set when this process is one cluster of several (see launcher.py).
+        self.cluster_id = cluster_id
+        self.ipc_path = ipc_path
+        self.cluster: Optional[ClusterClient] = None
+        # Batches scrim and slot writes during registration (see core/writebehind.py).
+        self.scrim_writes: Optional[ScrimWriteBuffer] = None
+        # Query latency, pool wait and in-flight counts (see core/db.py).
+        self.db_metrics: DatabaseMetrics = db_metrics
+        # Per-command and per-button spans with latency rollups (see core/telemetry.py).
+        self.telemetry = telemetry
+        self.sampler = SystemSampler(self, interval=getattr(self.config, "SAMPLE_INTERVAL", 5.0))
+        # Opt-in: reports callbacks that block the event loop (see core/watchdog.py).
+        self.watchdog: Optional[LoopWatchdog] = None
+        self.prefixes = PrefixCache(self.config.PREFIX)
+        self.timezones = TimezoneCache(DEFAULT_TIMEZONE)
+        # Rate-limit aware queue for bulk sends, edits, role grants, DMs and logs (see core/outbound.py).
+        self.outbound = Outbound(dm_concurrency=getattr(self.config, "DM_CONCURRENCY", 5))
+        # Chat-input prompts of the scrim wizard and editor (see core/prompts.py).
+        self.prompts = PromptRouter()
+        # Channels of scrims that are currently taking registrations.
+        self.reg_channels: set[int] = set()
+
     # --- Properties ---
     @property
     def config(self):
@@ -50,34 +101,101 @@ class ME(commands.Bot):
 
     # --- Core Methods ---
     async def setup_hook(self):
-        print("Running setup hook...")
+        telemetry.start()
+        log.info("Running setup hook...")
         try:
             await Tortoise.init(self.config.TORTOISE)
+            self.db_metrics.install()
             await Tortoise.generate_schemas(safe=True)
-            print("Successfully connected to the database.")
+            log.info("Successfully connected to the database.")
+            await self.load_guild_settings()
         except Exception as e:
-            print(f"Error connecting to database: {e}")
+            log.error("Error connecting to database: %s", e)
+
+        # Each cluster keeps its own journal so they never replay each other's writes.
+        self.scrim_writes = ScrimWriteBuffer(
+            getattr(self.config, "JOURNAL_DIR", "journal"),
+            name=f"scrims-{self.cluster_id or 0}",
+            interval=getattr(self.config, "WRITE_FLUSH_INTERVAL", 1.0),
+        )
+        await self.scrim_writes.replay()
+        self.scrim_writes.start()
+        self.sampler.start()
+        if getattr(self.config, "WATCHDOG_THRESHOLD", None):
+            self.watchdog = LoopWatchdog(self, threshold=self.config.WATCHDOG_THRESHOLD)
+            self.watchdog.start()
+
+        if self.ipc_path is not None:
+            self.cluster = ClusterClient(self, self.ipc_path, self.cluster_id)
+            try:
+                await self.cluster.start()
+                log.info("Cluster %s connected to the launcher (shards %s).", self.cluster_id, self.shard_ids)
+            except OSError as e:
+                log.error("Error connecting to the launcher: %s", e)
+                self.cluster = None
 
-        print("Loading extensions...")
+        log.info("Loading extensions...")
         for extension in self.config.EXTENSIONS:
             try:
                 await self.load_extension(extension)
-                print(f"-> Loaded '{extension}'")
+                log.info("-> Loaded '%s'", extension)
             except Exception as e:
-                print(f"-> Failed to load '{extension}': {e}")
+                log.error("-> Failed to load '%s': %s", extension, e)
 
     async def close(self):
-        print("Closing database connections...")
+        self.sampler.close()
+        if self.watchdog:
+            self.watchdog.close()
+        if self.cluster:
+            await self.cluster.close()
+        try:
+            await asyncio.wait_for(self.outbound.drain(), timeout=5)
+        except asyncio.TimeoutError:
+            log.warning("Dropping %d queued Discord calls.", len(self.outbound))
+        self.outbound.close()
+        if self.scrim_writes:
+            log.info("Flushing pending scrim writes...")
+            await self.scrim_writes.close()
+        log.info("Closing database connections...")
         await Tortoise.close_connections()
         await super().close()
+        telemetry.stop()
 
     # --- Helper Methods ---
+    def owns_guild(self, guild_id: int) -> bool:
+        """Whether a guild is served by one of this process's shards."""
+        if self.shard_ids is None or self.shard_count is None:
+            return True
+        return (guild_id >> 22) % self.shard_count in self.shard_ids
+
+    async def load_guild_settings(self):
+        """Fills the prefix and timezone caches from the guilds table in a single query."""
+        query = Guild.filter(~Q(prefix=self.config.PREFIX) | ~Q(timezone=DEFAULT_TIMEZONE))
+        if self.shard_ids is not None and self.shard_count is not None:
+            # owns_guild, evaluated by the database, so other clusters' rows are never sent here.
+            query = query.annotate(
+                shard=RawSQL(f'("id" >> 22) % {int(self.shard_count)}')
+            ).filter(shard__in=list(self.shard_ids))
+        rows = await query.values_list("id", "prefix", "timezone")
+
+        self.prefixes.fill((guild_id, prefix) for guild_id, prefix, _ in rows if prefix != self.config.PREFIX)
+        self.timezones.fill((guild_id, tz) for guild_id, _, tz in rows if tz != DEFAULT_TIMEZONE)
+        log.info("Cached %d custom prefixes and %d custom timezones.", len(self.prefixes), len(self.timezones))
+
+    async def resolve_prefix(self, guild_id: int) -> str:
+        """Returns the prefix for a guild, only asking the database on a cache miss."""
+        prefix = self.prefixes.get(guild_id)
+        if prefix is None:
+            guild_config = await Guild.get_or_none(id=guild_id)
+            prefix = guild_config.prefix if guild_config else self.config.PREFIX
+            self.prefixes.set(guild_id, prefix)
+        return prefix
+
     async def get_prefix(self, message: discord.Message):
         if not message.guild:
             return commands.when_mentioned_or(self.config.PREFIX)(self, message)
 
-        guild_config = await Guild.get_or_none(id=message.guild.id)
-        prefix = guild_config.prefix if guild_config else self.config.PREFIX
+        prefix = await self.resolve_prefix(message.guild.id)
         return commands.when_mentioned_or(prefix)(self, message)
 
     def embed(self, title: str = "", description: str = "") -> discord.Embed:
@@ -89,31 +207,51 @@ class ME(commands.Bot):
 
     # --- Event Listeners ---
     async def on_ready(self):
-        print("-" * 20)
-        print(f"Logged in as: {self.user.name} ({self.user.id})")
-        print(f"discord.py version: {discord.__version__}")
-        print(f"Bot started at: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')} UTC")
-        print("-" * 20)
+        log.info(
+            "Logged in as %s (%s), discord.py %s, started at %s UTC",
+            self.user.name, self.user.id, discord.__version__, self.start_time.strftime('%Y-%m-%d %H:%M:%S'),
+        )
 
     async def on_message(self, message: discord.Message):
         if message.author.bot:
             return
+
+        # Answers to a pending prompt are consumed here, before registration or commands see them.
+        if self.prompts.resolve(message):
+            return
+
+        # Registration traffic goes straight to the registration engine.
+        if message.channel.id in self.reg_channels:
+            return self.dispatch("registration_message", message)
+
+        # Drop chatter that can't be a command before any prefix lookup or parsing.
+        # peek() leaves the hit/miss count to get_prefix, which looks the prefix up again.
+        if message.guild:
+            prefix = self.prefixes.peek(message.guild.id)
+            if prefix is not None and not message.content.startswith(
+                (prefix, f"<@{self.user.id}>", f"<@!{self.user.id}>")
+            ):
+                return
+
         await self.process_commands(message)
 
         if message.content == f'<@{self.user.id}>':
             # Check if the user has admin-level permissions
             if message.author.guild_permissions.manage_guild:
                 # Fetch the prefix for the current guild
-                guild_config = await Guild.get_or_none(id=message.guild.id)
-                prefix = guild_config.prefix if guild_config else self.config.PREFIX
+                prefix = await self.resolve_prefix(message.guild.id)
                 # Send the prefix information
                 await message.channel.send(f"My prefix in this server is `{prefix}`.")
 
-    async def on_command(self, ctx: commands.Context):
-        print(
-            f"Command invoked: '{ctx.command.name}' by {ctx.author} ({ctx.author.id}) "
-            f"in guild {ctx.guild.name} ({ctx.guild.id})"
-        )
+    async def invoke(self, ctx: commands.Context):
+        if ctx.command is None:
+            return await super().invoke(ctx)
+
+        # Logged and rolled up per command by core/telemetry.py.
+        async with telemetry.span("command", ctx.command.qualified_name, ctx.guild and ctx.guild.id, ctx.author.id) as span:
+            await super().invoke(ctx)
+            if ctx.command_failed:
+                span.outcome = "failed"
 
 
 # --- Create an instance of the bot ---
@@ -0,0 +1,120 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from core.telemetry import log
+
+
+class PrefixCache:
+    """
+    A bounded, in-memory map of guild ID -> command prefix.
+
+    Only guilds with a custom prefix are stored. While the cache is
+    "complete" (filled from the whole `guilds` table and nothing has been
+    evicted since), a missing guild simply uses the default prefix and no
+    database call is needed.
+    """
+
+    def __init__(self, default: str, maxsize: int = 50_000):
+        self.default = default
+        self.maxsize = maxsize
+        self.complete = False
+
+        self.hits = 0
+        self.misses = 0
+
+        self._data: "OrderedDict[int, str]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def fill(self, rows: Iterable[Tuple[int, str]]):
+        """Replaces the cache contents with (guild_id, prefix) rows from the database."""
+        self._data.clear()
+        self.complete = True
+        for guild_id, prefix in rows:
+            self.set(guild_id, prefix)
+
+    def get(self, guild_id: int) -> Optional[str]:
+        """Returns the cached prefix, or None if the database has to be asked."""
+        prefix = self._data.get(guild_id)
+        if prefix is not None:
+            self._data.move_to_end(guild_id)
+            self.hits += 1
+            return prefix
+
+        if self.complete:
+            self.hits += 1
+            return self.default
+
+        self.misses += 1
+        return None
+
+    def peek(self, guild_id: int) -> Optional[str]:
+        """Like get(), but doesn't count towards the stats or refresh the guild's place."""
+        prefix = self._data.get(guild_id)
+        if prefix is None and self.complete:
+            return self.default
+        return prefix
+
+    def set(self, guild_id: int, prefix: str):
+        """Stores a prefix. Call this whenever a guild's prefix changes."""
+        if prefix == self.default and self.complete:
+            self._data.pop(guild_id, None)
+            return
+
+        self._data[guild_id] = prefix
+        self._data.move_to_end(guild_id)
+
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            # An evicted guild may have a custom prefix, so a miss no longer means "default".
+            self.complete = False
+
+    @property
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "complete": self.complete,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+class TimezoneCache:
+    """
+    Guild ID -> ZoneInfo for guilds that picked a timezone other than the default.
+
+    Filled from the same guilds query as the prefixes, so looking up a guild's
+    timezone never touches the database and never re-parses the tz name.
+    """
+
+    def __init__(self, default: str):
+        self.default = ZoneInfo(default)
+        self._data: Dict[int, ZoneInfo] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def fill(self, rows: Iterable[Tuple[int, str]]):
+        """Replaces the cache contents with (guild_id, timezone) rows from the database."""
+        self._data.clear()
+        for guild_id, name in rows:
+            try:
+                self.set(guild_id, name)
+            except (ValueError, ZoneInfoNotFoundError):
+                log.warning("Ignoring unknown timezone %r of guild %s.", name, guild_id)
+
+    def get(self, guild_id: Optional[int]) -> ZoneInfo:
+        return self._data.get(guild_id, self.default)
+
+    def set(self, guild_id: int, name: str):
+        """Stores a timezone. Call this whenever a guild's timezone changes."""
+        tz = ZoneInfo(name)
+        if tz == self.default:
+            self._data.pop(guild_id, None)
+        else:
+            self._data[guild_id] = tz
@@ -0,0 +1,130 @@
+import asyncio
+import itertools
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .Bot import ME
+
+
+def shard_ranges(shard_count: int, clusters: int) -> List[List[int]]:
+    """Splits shard IDs into `clusters` contiguous, near-equal ranges."""
+    clusters = max(1, min(clusters, shard_count))
+    size, extra = divmod(shard_count, clusters)
+
+    ranges, start = [], 0
+    for i in range(clusters):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append(list(range(start, end)))
+        start = end
+    return ranges
+
+
+class ClusterServer:
+    """
+    Runs in the launcher and collects stats pushed by every cluster over a
+    local unix socket. Clusters can ask for the aggregated view at any time.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.clusters: Dict[int, dict] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+
+    async def close(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                message = json.loads(line)
+
+                if message["op"] == "push":
+                    self.clusters[message["cluster"]] = {**message["data"], "updated": time.time()}
+
+                elif message["op"] == "stats":
+                    reply = {"nonce": message["nonce"], "clusters": self.clusters}
+                    writer.write(json.dumps(reply).encode() + b"\n")
+                    await writer.drain()
+        except (ConnectionError, json.JSONDecodeError):
+            pass
+        finally:
+            writer.close()
+
+
+class ClusterClient:
+    """Connects a cluster to the launcher's ClusterServer and pushes its stats periodically."""
+
+    def __init__(self, bot: "ME", path: str, cluster_id: int, interval: float = 10.0):
+        self.bot = bot
+        self.path = path
+        self.cluster_id = cluster_id
+        self.interval = interval
+
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._nonces = itertools.count()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        reader, self._writer = await asyncio.open_unix_connection(self.path)
+        self._tasks = [asyncio.create_task(self._read(reader)), asyncio.create_task(self._push_loop())]
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        if self._writer:
+            self._writer.close()
+
+    def snapshot(self) -> dict:
+        bot = self.bot
+        return {
+            "shards": sorted(bot.shard_ids or bot.shards),
+            "guilds": len(bot.guilds),
+            "users": len(bot.users),
+            "latency": bot.latency if bot.is_ready() else None,
+        }
+
+    async def stats(self) -> Dict[int, dict]:
+        """Returns the latest stats of every cluster, keyed by cluster ID."""
+        reply = await self._request("stats")
+        return {int(cluster_id): data for cluster_id, data in reply["clusters"].items()}
+
+    async def _send(self, payload: dict):
+        self._writer.write(json.dumps(payload).encode() + b"\n")
+        await self._writer.drain()
+
+    async def _request(self, op: str, timeout: float = 5.0) -> dict:
+        nonce = next(self._nonces)
+        future = self._pending[nonce] = asyncio.get_running_loop().create_future()
+        try:
+            await self._send({"op": op, "nonce": nonce})
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self._pending.pop(nonce, None)
+
+    async def _read(self, reader: asyncio.StreamReader):
+        while line := await reader.readline():
+            message = json.loads(line)
+            future = self._pending.get(message.get("nonce"))
+            if future and not future.done():
+                future.set_result(message)
+
+    async def _push_loop(self):
+        while True:
+            try:
+                await self._send({"op": "push", "cluster": self.cluster_id, "data": self.snapshot()})
+            except ConnectionError:
+                return
+            await asyncio.sleep(self.interval)
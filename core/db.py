@@ -0,0 +1,207 @@
+import contextvars
+import functools
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+QUERY_METHODS = ("execute_insert", "execute_many", "execute_query", "execute_query_dict", "execute_script")
+QUERY_TYPES = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+# Upper bounds of the histogram buckets, in milliseconds; the last bucket is open-ended.
+BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class Histogram:
+    """A fixed-bucket latency histogram; cheap enough to update on every query."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, ms: float):
+        i = 0
+        while i < len(BUCKETS_MS) and ms > BUCKETS_MS[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket holding the given percentile, capped at the max seen."""
+        if not self.count:
+            return 0.0
+        rank, seen = self.count * pct / 100, 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(BUCKETS_MS[i], self.max) if i < len(BUCKETS_MS) else self.max
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max,
+            "buckets": dict(zip([*map(str, BUCKETS_MS), "inf"], self.counts)),
+        }
+
+
+class _TimedPool:
+    """One client's connection pool, with acquire() timed; everything else goes straight to the pool."""
+
+    def __init__(self, pool, metrics: "DatabaseMetrics"):
+        self._pool = pool
+        self._metrics = metrics
+
+    def __getattr__(self, name):
+        return getattr(self._pool, name)
+
+    async def acquire(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await self._pool.acquire(*args, **kwargs)
+        finally:
+            self._metrics.pool_wait.observe((time.perf_counter() - started) * 1000)
+
+
+class DatabaseMetrics:
+    """
+    Records latency per query type, connection pool wait time and in-flight
+    queries for every Tortoise connection in this process.
+
+    `install()` wraps the execute methods of the Tortoise client classes, so
+    plain queries and transactions are both seen, and wraps each client's
+    connection pool in a _TimedPool, which records how long acquire() waits.
+    Tortoise imports its backends in `Tortoise.init`, so install after that.
+    Query latency includes the pool wait, which is also recorded on its own.
+    """
+
+    def __init__(self, slow_ms: float = 250.0):
+        self.slow_ms = slow_ms
+        self.queries: Dict[str, Histogram] = {}
+        self.pool_wait = Histogram()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.errors = 0
+        self.slow: Deque[Tuple[float, str, str]] = deque(maxlen=20)  # (ms, type, sql)
+        self.since = time.time()
+        # Called with (query type, ms) after every query, e.g. to count queries per command.
+        self.observers: List[Callable[[str, float], None]] = []
+
+        self._inside = contextvars.ContextVar("inside_query", default=False)
+
+    @property
+    def total(self) -> int:
+        return sum(h.count for h in self.queries.values())
+
+    # --- Instrumentation ---
+    def install(self):
+        """Instruments every client class imported so far; safe to call again."""
+        pending: List[type] = [BaseDBAsyncClient]
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+            for name in QUERY_METHODS:
+                method = cls.__dict__.get(name)
+                if method is not None and not hasattr(method, "__db_metrics__"):
+                    setattr(cls, name, self._wrap_query(method))
+            # Pools are made on first use; create_pool is Tortoise's hook for making them.
+            create_pool = cls.__dict__.get("create_pool")
+            if create_pool is not None and not hasattr(create_pool, "__db_metrics__"):
+                setattr(cls, "create_pool", self._wrap_create_pool(create_pool))
+
+        # Pools that were made before this was installed.
+        for client in connections.all():
+            pool = getattr(client, "_pool", None)
+            if pool is not None and not isinstance(pool, _TimedPool):
+                client._pool = _TimedPool(pool, self)
+
+    def _wrap_query(self, method):
+        @functools.wraps(method)
+        async def wrapper(client, query: str, *args, **kwargs):
+            # One execute method may call another; only the outermost call is recorded.
+            if self._inside.get():
+                return await method(client, query, *args, **kwargs)
+
+            token = self._inside.set(True)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            started = time.perf_counter()
+            try:
+                return await method(client, query, *args, **kwargs)
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                ms = (time.perf_counter() - started) * 1000
+                self.in_flight -= 1
+                self._inside.reset(token)
+                self._observe(query, ms)
+        wrapper.__db_metrics__ = True
+        return wrapper
+
+    def _wrap_create_pool(self, create_pool):
+        @functools.wraps(create_pool)
+        async def wrapper(client, *args, **kwargs):
+            return _TimedPool(await create_pool(client, *args, **kwargs), self)
+        wrapper.__db_metrics__ = True
+        return wrapper
+
+    def _observe(self, query: str, ms: float):
+        kind = query.lstrip()[:6].upper()
+        if kind not in QUERY_TYPES:
+            kind = "OTHER"
+
+        histogram = self.queries.get(kind)
+        if histogram is None:
+            histogram = self.queries[kind] = Histogram()
+        histogram.observe(ms)
+
+        if ms >= self.slow_ms:
+            self.slow.append((ms, kind, " ".join(query.split())[:300]))
+        for observer in self.observers:
+            observer(kind, ms)
+
+    # --- Snapshot API ---
+    def reset(self):
+        self.queries.clear()
+        self.pool_wait = Histogram()
+        self.peak_in_flight = self.in_flight
+        self.errors = 0
+        self.slow.clear()
+        self.since = time.time()
+
+    def snapshot(self, connection: Optional[BaseDBAsyncClient] = None) -> dict:
+        """A JSON-serializable view of the metrics, plus pool sizes if `connection` is pooled."""
+        pool = getattr(connection, "_pool", None)
+        return {
+            "since": self.since,
+            "queries": {kind: h.snapshot() for kind, h in sorted(self.queries.items())},
+            "total": self.total,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "pool_wait": self.pool_wait.snapshot(),
+            "pool": {
+                "size": pool.get_size(),
+                "idle": pool.get_idle_size(),
+                "min": pool.get_min_size(),
+                "max": pool.get_max_size(),
+            } if pool is not None and hasattr(pool, "get_size") else None,
+            "slow": [{"ms": ms, "type": kind, "sql": sql} for ms, kind, sql in self.slow],
+        }
+
+
+# One per process; installed by ME.setup_hook.
+metrics = DatabaseMetrics()
@@ -0,0 +1,172 @@
+import asyncio
+import heapq
+import itertools
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+import discord
+
+from core.telemetry import log
+
+# Discord accepts at most this many embeds per message; queued log entries are merged up to it.
+MAX_EMBEDS = 10
+
+
+class Priority(IntEnum):
+    user = 0      # replies and reactions someone is waiting for
+    normal = 1    # announcements, role grants, DMs, slotlist edits
+    log = 2       # log channel entries
+
+
+class _Job:
+    __slots__ = ("priority", "seq", "call", "kwargs", "future", "merge_key")
+
+    def __init__(self, priority: int, seq: int, call: Callable[..., Awaitable], kwargs: dict, merge_key: Optional[Hashable]):
+        self.priority = priority
+        self.seq = seq
+        self.call = call
+        self.kwargs = kwargs
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.merge_key = merge_key
+
+    def __lt__(self, other: "_Job") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class _Bucket:
+    """Queued calls that share a Discord rate limit, run by up to `concurrency` workers."""
+
+    __slots__ = ("jobs", "workers", "concurrency", "mergeable")
+
+    def __init__(self, concurrency: int):
+        self.jobs: List[_Job] = []                       # heap, highest priority first
+        self.workers: Set[asyncio.Task] = set()
+        self.concurrency = concurrency
+        self.mergeable: Dict[Hashable, _Job] = {}        # queued jobs later calls can be merged into
+
+
+class Outbound:
+    """
+    Queues outgoing Discord calls per rate-limit bucket.
+
+    Calls to one channel (or one guild's members, or all DMs) run in priority
+    order instead of all at once, so a burst waits in our queue rather than
+    in a 429 retry loop. Queued edits of the same message collapse into one
+    edit and queued log entries for a channel are sent as one message with up
+    to ten embeds. DMs run at most `dm_concurrency` at a time.
+
+    Every method returns a future of the call's result (None if it failed);
+    awaiting it is optional. Workers exist only while a bucket has work.
+    """
+
+    def __init__(self, dm_concurrency: int = 5):
+        self.dm_concurrency = dm_concurrency
+        self.buckets: Dict[Hashable, _Bucket] = {}
+        self.calls = 0
+        self.merged = 0
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return sum(len(bucket.jobs) for bucket in self.buckets.values())
+
+    # --- Calls ---
+    def send(self, channel: discord.abc.Messageable, priority: Priority = Priority.normal, **kwargs) -> asyncio.Future:
+        return self._submit(("channel", channel.id), priority, channel.send, kwargs)
+
+    def reply(self, message: discord.Message, priority: Priority = Priority.user, **kwargs) -> asyncio.Future:
+        return self._submit(("channel", message.channel.id), priority, message.reply, kwargs)
+
+    def react(self, message: discord.Message, emoji: str, priority: Priority = Priority.user) -> asyncio.Future:
+        return self._submit(("reaction", message.channel.id), priority, message.add_reaction, {"emoji": emoji})
+
+    def edit(self, message: discord.Message, priority: Priority = Priority.normal, **kwargs) -> asyncio.Future:
+        """Edits a message; a queued edit of the same message is updated instead of adding another."""
+        return self._submit(
+            ("channel", message.channel.id), priority, message.edit, kwargs,
+            merge_key=("edit", message.id), merge=lambda queued: queued.update(kwargs),
+        )
+
+    def add_roles(self, member: discord.Member, *roles: discord.abc.Snowflake, reason: Optional[str] = None,
+                  priority: Priority = Priority.normal) -> asyncio.Future:
+        return self._submit(("guild", member.guild.id), priority, lambda: member.add_roles(*roles, reason=reason), {})
+
+    def dm(self, user: discord.abc.User, priority: Priority = Priority.normal, **kwargs) -> asyncio.Future:
+        return self._submit(("dm",), priority, user.send, kwargs)
+
+    def log(self, channel: discord.abc.Messageable, embed: discord.Embed) -> asyncio.Future:
+        """Posts a log entry at the lowest priority, sharing a message with other queued entries."""
+        def merge(queued: dict) -> bool:
+            if len(queued["embeds"]) >= MAX_EMBEDS:
+                return False
+            queued["embeds"].append(embed)
+            return True
+
+        return self._submit(
+            ("channel", channel.id), Priority.log, channel.send, {"embeds": [embed]},
+            merge_key=("log", channel.id), merge=merge,
+        )
+
+    # --- Queue ---
+    def _submit(self, bucket_key: Hashable, priority: Priority, call: Callable[..., Awaitable], kwargs: dict,
+                merge_key: Optional[Hashable] = None, merge: Optional[Callable[[dict], Any]] = None) -> asyncio.Future:
+        bucket = self.buckets.get(bucket_key)
+        if bucket is None:
+            concurrency = self.dm_concurrency if bucket_key == ("dm",) else 1
+            bucket = self.buckets[bucket_key] = _Bucket(concurrency)
+
+        if merge_key is not None:
+            queued = bucket.mergeable.get(merge_key)
+            if queued is not None and merge(queued.kwargs) is not False:
+                self.merged += 1
+                if priority < queued.priority:
+                    queued.priority = priority
+                    heapq.heapify(bucket.jobs)
+                return queued.future
+
+        job = _Job(priority, next(self._seq), call, kwargs, merge_key)
+        heapq.heappush(bucket.jobs, job)
+        if merge_key is not None:
+            bucket.mergeable[merge_key] = job
+
+        if len(bucket.workers) < bucket.concurrency:
+            worker = asyncio.create_task(self._work(bucket_key, bucket))
+            bucket.workers.add(worker)
+        return job.future
+
+    async def _work(self, bucket_key: Hashable, bucket: _Bucket):
+        while bucket.jobs:
+            job = heapq.heappop(bucket.jobs)
+            if bucket.mergeable.get(job.merge_key) is job:
+                del bucket.mergeable[job.merge_key]
+
+            result = None
+            try:
+                self.calls += 1
+                result = await job.call(**job.kwargs)
+            except discord.HTTPException as e:
+                log.warning("Outbound call to %s failed: %s", bucket_key, e)
+            except Exception:
+                log.exception("Outbound call to %s raised", bucket_key)
+            if not job.future.done():
+                job.future.set_result(result)
+
+        bucket.workers.discard(asyncio.current_task())
+        if not bucket.workers and not bucket.jobs:
+            self.buckets.pop(bucket_key, None)
+
+    async def drain(self):
+        """Waits until every queued call has run."""
+        while True:
+            workers = [worker for bucket in self.buckets.values() for worker in bucket.workers]
+            if not workers:
+                return
+            await asyncio.gather(*workers)
+
+    def close(self):
+        for bucket in self.buckets.values():
+            for worker in bucket.workers:
+                worker.cancel()
+            for job in bucket.jobs:
+                if not job.future.done():
+                    job.future.set_result(None)
+        self.buckets.clear()
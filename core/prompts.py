@@ -0,0 +1,53 @@
+import asyncio
+from typing import Dict, Tuple
+
+import discord
+
+
+class PromptCancelled(Exception):
+    """Raised in a waiting prompt that was cancelled or replaced by a newer one."""
+
+
+class PromptRouter:
+    """
+    Pending chat-input prompts, keyed by (channel_id, user_id).
+
+    Unlike `bot.wait_for("message", check=...)`, which runs every pending
+    check against every message, `resolve` is a single dict lookup per
+    message. A user has at most one prompt per channel; asking again
+    cancels the older one. Finished, timed-out and cancelled prompts are
+    always removed, so nothing is left behind.
+    """
+
+    def __init__(self):
+        self._pending: Dict[Tuple[int, int], asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def ask(self, channel_id: int, user_id: int, timeout: float = 60.0) -> discord.Message:
+        """Waits for the user's next message in the channel. Raises asyncio.TimeoutError or PromptCancelled."""
+        key = (channel_id, user_id)
+        self.cancel(channel_id, user_id)
+
+        future = self._pending[key] = asyncio.get_running_loop().create_future()
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def resolve(self, message: discord.Message) -> bool:
+        """Hands a message to the prompt waiting for it. Returns False if there is none."""
+        future = self._pending.pop((message.channel.id, message.author.id), None)
+        if future is None or future.done():
+            return False
+        future.set_result(message)
+        return True
+
+    def cancel(self, channel_id: int, user_id: int) -> bool:
+        future = self._pending.pop((channel_id, user_id), None)
+        if future is None or future.done():
+            return False
+        future.set_exception(PromptCancelled())
+        return True
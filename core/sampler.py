@@ -0,0 +1,103 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, NamedTuple, Optional
+
+import psutil
+
+from core.telemetry import log
+
+if TYPE_CHECKING:
+    from core.Bot import ME
+
+
+class Sample(NamedTuple):
+    at: float                    # time.time() of the sample
+    cpu: float                   # system CPU %, averaged since the previous sample
+    rss: int                     # resident memory of this process, in bytes
+    loop_lag: float              # ms the sampler woke up late
+    gateway: Optional[float]     # ms, None while not connected
+    db: Optional[float]          # ms for SELECT 1, None if it failed
+
+
+FIELDS = ("cpu", "rss", "loop_lag", "gateway", "db")
+
+
+class SystemSampler:
+    """
+    Samples CPU, memory, event-loop lag, gateway and database latency every
+    `interval` seconds into a ring buffer, so commands can read them instantly.
+
+    psutil runs in a worker thread; its CPU reading covers the whole interval
+    instead of the 0.0 an unprimed `cpu_percent()` call returns.
+    """
+
+    def __init__(self, bot: "ME", interval: float = 5.0, size: int = 120):
+        self.bot = bot
+        self.interval = interval
+        self.samples: Deque[Sample] = deque(maxlen=size)
+        self._process = psutil.Process()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def latest(self) -> Optional[Sample]:
+        return self.samples[-1] if self.samples else None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            psutil.cpu_percent(None)  # primes the counter the first sample is measured from
+            self._task = asyncio.create_task(self._run())
+
+    def close(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def window(self, seconds: float) -> dict:
+        """{field: (avg, max)} over the samples of the last `seconds`; fields without data are left out."""
+        since = time.time() - seconds
+        recent = [s for s in self.samples if s.at >= since]
+        stats = {}
+        for field in FIELDS:
+            values = [getattr(s, field) for s in recent if getattr(s, field) is not None]
+            if values:
+                stats[field] = (sum(values) / len(values), max(values))
+        return stats
+
+    # --- Sampling ---
+    def _read_system(self):
+        return psutil.cpu_percent(None), self._process.memory_info().rss
+
+    async def _db_latency(self) -> Optional[float]:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.bot.db.execute_query("SELECT 1"), timeout=self.interval)
+        except Exception:
+            return None
+        return (time.perf_counter() - started) * 1000
+
+    async def sample(self, loop_lag: float = 0.0) -> Sample:
+        cpu, rss = await asyncio.to_thread(self._read_system)
+        latency = self.bot.latency
+        sample = Sample(
+            at=time.time(),
+            cpu=cpu,
+            rss=rss,
+            loop_lag=loop_lag,
+            gateway=latency * 1000 if math.isfinite(latency) else None,
+            db=await self._db_latency(),
+        )
+        self.samples.append(sample)
+        return sample
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            before = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - before - self.interval) * 1000
+            try:
+                await self.sample(lag)
+            except Exception as e:
+                log.error("System sampler failed: %s", e)
@@ -0,0 +1,169 @@
+import contextvars
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Tuple
+
+import discord
+from discord import app_commands
+
+from core.db import Histogram, metrics as db_metrics
+
+log = logging.getLogger("me")
+span_log = logging.getLogger("me.spans")
+
+
+class Span:
+    """One command or interaction: what ran, where, how long, and what it cost."""
+
+    __slots__ = ("kind", "name", "guild_id", "user_id", "started", "duration", "outcome", "queries", "http")
+
+    def __init__(self, kind: str, name: str, guild_id: Optional[int] = None, user_id: Optional[int] = None):
+        self.kind = kind              # "command", "slash" or "component"
+        self.name = name
+        self.guild_id = guild_id
+        self.user_id = user_id
+        self.started = time.perf_counter()
+        self.duration = 0.0           # ms
+        self.outcome = "ok"           # "ok", "failed" (command error, handled by discord.py) or "error"
+        self.queries = 0
+        self.http = 0
+
+    def as_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.__slots__ if field != "started"}
+
+
+# The span of the command or interaction the current task runs for; tasks it spawns inherit it.
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+class Telemetry:
+    """
+    Records a span per command and component interaction and rolls them up
+    into latency histograms per (kind, name).
+
+    Log records from the "me" logger, span records included, go through a
+    QueueHandler; a QueueListener thread does the actual writing, so logging
+    never blocks the event loop.
+    """
+
+    def __init__(self):
+        self.rollups: Dict[Tuple[str, str], Histogram] = {}
+        self.errors: Dict[Tuple[str, str], int] = {}
+        self.since = time.time()
+
+        self._queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._installed = False
+
+    # --- Setup ---
+    def start(self, level: int = logging.INFO):
+        """Routes the "me" logger through the queue and counts DB queries and HTTP calls per span."""
+        if not self._installed:
+            self._installed = True
+            log.setLevel(level)
+            log.propagate = False
+            log.addHandler(logging.handlers.QueueHandler(self._queue))
+            db_metrics.observers.append(self._count_query)
+            discord.http.HTTPClient.request = self._wrap_request(discord.http.HTTPClient.request)
+
+        if self._listener is None:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(name)s: %(message)s"))
+            self._listener = logging.handlers.QueueListener(self._queue, handler)
+            self._listener.start()
+
+    def stop(self):
+        """Writes out queued records and stops the listener thread."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    @staticmethod
+    def _count_query(kind: str, ms: float):
+        span = _current.get()
+        if span is not None:
+            span.queries += 1
+
+    @staticmethod
+    def _wrap_request(request):
+        async def wrapper(http, route, **kwargs):
+            span = _current.get()
+            if span is not None:
+                span.http += 1
+            return await request(http, route, **kwargs)
+        return wrapper
+
+    # --- Spans ---
+    @asynccontextmanager
+    async def span(self, kind: str, name: str, guild_id: Optional[int] = None, user_id: Optional[int] = None):
+        span = Span(kind, name, guild_id, user_id)
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException:
+            span.outcome = "error"
+            raise
+        finally:
+            _current.reset(token)
+            self.finish(span)
+
+    def finish(self, span: Span):
+        span.duration = (time.perf_counter() - span.started) * 1000
+        key = (span.kind, span.name)
+        histogram = self.rollups.get(key)
+        if histogram is None:
+            histogram = self.rollups[key] = Histogram()
+        histogram.observe(span.duration)
+        if span.outcome != "ok":
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+        span_log.info(
+            "%s %s guild=%s %.1fms %s db=%d http=%d",
+            span.kind, span.name, span.guild_id, span.duration, span.outcome, span.queries, span.http,
+            extra={"span": span.as_dict()},
+        )
+
+    # --- Rollups ---
+    def reset(self):
+        self.rollups.clear()
+        self.errors.clear()
+        self.since = time.time()
+
+    def snapshot(self) -> dict:
+        """Latency percentiles per span name, slowest p99 first."""
+        rows = [
+            {
+                "kind": kind,
+                "name": name,
+                "count": h.count,
+                "errors": self.errors.get((kind, name), 0),
+                "avg_ms": h.total / h.count,
+                "p50_ms": h.percentile(50),
+                "p95_ms": h.percentile(95),
+                "p99_ms": h.percentile(99),
+                "max_ms": h.max,
+            }
+            for (kind, name), h in self.rollups.items()
+        ]
+        rows.sort(key=lambda row: (row["p99_ms"], row["max_ms"]), reverse=True)
+        return {"since": self.since, "spans": rows}
+
+
+telemetry = Telemetry()
+
+
+class TelemetryTree(app_commands.CommandTree):
+    """Records a span for every slash command."""
+
+    async def _call(self, interaction: discord.Interaction):
+        name = interaction.command.qualified_name if interaction.command else (interaction.data or {}).get("name", "?")
+        async with telemetry.span("slash", name, interaction.guild_id, interaction.user.id):
+            await super()._call(interaction)
@@ -0,0 +1,51 @@
+from typing import Any
+
+import discord
+
+from core.telemetry import current_span, telemetry
+
+
+def item_name(item: discord.ui.Item) -> str:
+    """A stable name for a component: its callback's name, else its class or label."""
+    callback = getattr(item.callback, "callback", item.callback)  # decorated items wrap the function
+    name = getattr(callback, "__name__", "callback")
+    if name != "callback":
+        return name
+    if type(item) not in (discord.ui.Button, discord.ui.Select):
+        return type(item).__name__
+    return getattr(item, "label", None) or type(item).__name__
+
+
+class BaseView(discord.ui.View):
+    """A view whose component callbacks are recorded as telemetry spans, e.g. `component ScrimManagerView.edit`."""
+
+    async def _scheduled_task(self, item: discord.ui.Item[Any], interaction: discord.Interaction):
+        async with telemetry.span(
+            "component", f"{type(self).__name__}.{item_name(item)}", interaction.guild_id, interaction.user.id
+        ):
+            await super()._scheduled_task(item, interaction)
+
+    async def on_error(self, interaction: discord.Interaction, error: Exception, item: discord.ui.Item[Any]):
+        # The base class catches callback errors before they reach the span.
+        span = current_span()
+        if span is not None:
+            span.outcome = "error"
+        await super().on_error(interaction, error, item)
+
+
+class PersistentItem:
+    """
+    Mixin for `discord.ui.DynamicItem`s, whose state lives in their custom_id.
+
+    They are registered once with `bot.add_dynamic_items` and keep working
+    across restarts; no view is kept in memory per message. Subclasses set
+    `action` and implement `handle`, which runs in a telemetry span.
+    """
+
+    action: str
+
+    async def callback(self, interaction: discord.Interaction):
+        async with telemetry.span(
+            "component", f"{type(self).__name__}.{self.action}", interaction.guild_id, interaction.user.id
+        ):
+            await self.handle(interaction)
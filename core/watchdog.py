@@ -0,0 +1,162 @@
+import asyncio
+import queue
+import sys
+import threading
+import time
+import traceback
+from typing import TYPE_CHECKING, List, NamedTuple, Optional
+
+import discord
+from discord.ext import commands
+
+from core.telemetry import log
+
+if TYPE_CHECKING:
+    from core.Bot import ME
+
+
+class Stall(NamedTuple):
+    started: float           # time.time() the loop stopped responding
+    duration: float          # seconds, measured once the loop came back
+    blamed: str              # cog / view / command the stack points at
+    stack: str
+
+
+def blame(frame) -> str:
+    """Names the view, cog and command found in a stack, innermost first."""
+    found: List[str] = []
+    while frame is not None:
+        local = frame.f_locals
+        owner = local.get("self")
+        if isinstance(owner, discord.ui.View):
+            found.append(f"view {type(owner).__name__}")
+        elif isinstance(owner, discord.ui.Item) and owner.view is not None:
+            found.append(f"view {type(owner.view).__name__}")
+        elif isinstance(owner, commands.Cog):
+            found.append(f"cog {owner.qualified_name}")
+
+        ctx = local.get("ctx")
+        if isinstance(ctx, commands.Context) and ctx.command:
+            found.append(f"command {ctx.command.qualified_name}")
+        interaction = local.get("interaction")
+        if isinstance(interaction, discord.Interaction) and interaction.data:
+            name = interaction.data.get("custom_id") or interaction.data.get("name")
+            if name:
+                found.append(f"interaction {name}")
+        frame = frame.f_back
+
+    if not found:
+        return "unknown"
+    return ", ".join(dict.fromkeys(found))  # de-duplicated, innermost first
+
+
+class LoopWatchdog:
+    """
+    Detects event-loop stalls from a separate thread.
+
+    A task on the loop stamps a heartbeat every `interval` seconds. When the
+    thread sees no heartbeat for `threshold` seconds, it captures the loop
+    thread's stack (which is then inside the blocking callback) and blames the
+    cog, view or command on it. Stalls are posted to the ERROR_LOG webhook,
+    at most one message per `report_every` seconds.
+    """
+
+    def __init__(self, bot: "ME", threshold: float = 0.25, interval: float = 0.05, report_every: float = 30.0):
+        self.bot = bot
+        self.threshold = threshold
+        self.interval = interval
+        self.report_every = report_every
+
+        self.stalls = 0
+        self.max_lag = 0.0
+
+        self._beat = time.monotonic()
+        self._pending: Optional[Stall] = None  # captured by the thread, finished by the loop
+        self._reports: "queue.SimpleQueue[Stall]" = queue.SimpleQueue()
+        self._loop_thread: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._tasks = [asyncio.create_task(self._heartbeat()), asyncio.create_task(self._reporter())]
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._stop.set()
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self._thread = None
+
+    # --- Loop side ---
+    async def _heartbeat(self):
+        while True:
+            before = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self.max_lag = max(self.max_lag, now - before - self.interval)
+            self._beat = now
+
+            stall, self._pending = self._pending, None
+            if stall is not None:
+                self.stalls += 1
+                self._reports.put(stall._replace(duration=now - before - self.interval))
+
+    async def _reporter(self):
+        while True:
+            await asyncio.sleep(self.report_every)
+            stalls = []
+            while not self._reports.empty():
+                stalls.append(self._reports.get())
+            if stalls:
+                try:
+                    await self._send(stalls)
+                except Exception as e:
+                    log.error("Failed to report %d event loop stalls: %s", len(stalls), e)
+
+    async def _send(self, stalls: List[Stall]):
+        worst = max(stalls, key=lambda stall: stall.duration)
+        for stall in stalls:
+            log.warning("Event loop blocked for %.0fms (%s)", stall.duration * 1000, stall.blamed)
+
+        url = getattr(self.bot.config, "ERROR_LOG", "")
+        if not url:
+            return
+        embed = discord.Embed(
+            title=f"Event loop blocked {len(stalls)}x",
+            description=f"Worst: **{worst.duration * 1000:.0f}ms** in {worst.blamed}\n```py\n{worst.stack[-3900:]}\n```",
+            color=discord.Color.red(),
+            timestamp=discord.utils.utcnow(),
+        )
+        others = "\n".join(f"`{s.duration * 1000:.0f}ms` {s.blamed}" for s in stalls if s is not worst)
+        if others:
+            embed.add_field(name="Others", value=others[:1024], inline=False)
+        embed.set_footer(text=f"Cluster {self.bot.cluster_id}" if self.bot.cluster_id is not None else self.bot.config.FOOTER)
+        await discord.Webhook.from_url(url, client=self.bot).send(embed=embed)
+
+    # --- Watchdog thread ---
+    def _watch(self):
+        reported_beat = None
+        while not self._stop.wait(self.interval):
+            beat = self._beat
+            if time.monotonic() - beat < self.threshold or beat == reported_beat:
+                continue
+
+            # One capture per stall: the first one after the threshold shows the blocking call.
+            reported_beat = beat
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            self._pending = Stall(
+                started=time.time() - (time.monotonic() - beat),
+                duration=0.0,
+                blamed=blame(frame),
+                stack="".join(traceback.format_stack(frame, limit=15)),
+            )
@@ -0,0 +1,341 @@
+import asyncio
+import json
+import os
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from tortoise.exceptions import DBConnectionError, IntegrityError, OperationalError
+from tortoise.transactions import in_transaction
+
+from core.telemetry import log
+from models.esports.scrims import Scrim, ScrimReserve, ScrimSlot
+
+try:
+    import asyncpg
+except ImportError:  # SQLite-only setups
+    asyncpg = None
+
+# Errors a retry can get past. Anything else (a constraint violation, bad data) fails the same way every time.
+TRANSIENT_ERRORS = (DBConnectionError, ConnectionError, OSError, asyncio.TimeoutError)
+DATA_ERRORS: tuple = ()
+if asyncpg:
+    TRANSIENT_ERRORS += (asyncpg.PostgresConnectionError, asyncpg.InterfaceError,
+                         asyncpg.CannotConnectNowError, asyncpg.TooManyConnectionsError)
+    # Tortoise wraps these in OperationalError, next to genuinely operational ones.
+    DATA_ERRORS = (asyncpg.DataError, asyncpg.SyntaxOrAccessError)
+
+
+class FlushError(Exception):
+    """Raised by ScrimWriteBuffer.flush when the database couldn't be reached; the writes stay queued."""
+
+
+def _is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, IntegrityError):  # a subclass of OperationalError
+        return False
+    if isinstance(exc, OperationalError):
+        original = exc.args[0] if exc.args else None
+        return not isinstance(original, DATA_ERRORS)
+    return isinstance(exc, TRANSIENT_ERRORS)
+
+
+def _encode(value):
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    raise TypeError(f"Can't journal {type(value).__name__}")
+
+
+def _decode(obj: dict):
+    return datetime.fromisoformat(obj["$dt"]) if "$dt" in obj else obj
+
+
+class _Batch:
+    """Coalesced changes waiting to be written, plus the journal segments that record them."""
+
+    def __init__(self, *journals: str):
+        self.journals = list(journals)
+        self.updates: Dict[int, dict] = {}               # scrim_id -> {field: value}
+        self.resets: set[int] = set()                    # scrims whose slots and reserves are all deleted
+        self.inserts: Dict[int, Dict[int, dict]] = {}    # scrim_id -> slot_no -> row
+        self.deletes: Dict[int, set[int]] = {}           # scrim_id -> slot numbers
+
+    def __bool__(self) -> bool:
+        return bool(self.updates or self.resets or self.inserts or self.deletes)
+
+    def apply(self, op: dict):
+        scrim_id = op["scrim"]
+
+        if op["op"] == "update":
+            self.updates.setdefault(scrim_id, {}).update(op["fields"])
+
+        elif op["op"] == "forget":
+            self.forget(scrim_id)
+
+        elif op["op"] == "reset":
+            self.resets.add(scrim_id)
+            self.inserts.pop(scrim_id, None)
+            self.deletes.pop(scrim_id, None)
+
+        elif op["op"] == "insert":
+            for row in op["rows"]:
+                self.inserts.setdefault(scrim_id, {})[row["slot_no"]] = row
+
+        elif op["op"] == "delete":
+            slot_no = op["slot_no"]
+            # A slot inserted and removed within the same batch never has to reach the database.
+            if self.inserts.get(scrim_id, {}).pop(slot_no, None) is None or slot_no in self.deletes.get(scrim_id, ()):
+                self.deletes.setdefault(scrim_id, set()).add(slot_no)
+
+    def forget(self, scrim_id: int):
+        self.updates.pop(scrim_id, None)
+        self.resets.discard(scrim_id)
+        self.inserts.pop(scrim_id, None)
+        self.deletes.pop(scrim_id, None)
+
+    def scrims(self) -> set[int]:
+        return set(self.updates) | self.resets | set(self.inserts) | set(self.deletes)
+
+    def take(self, scrim_id: int) -> "_Batch":
+        """Moves one scrim's changes into a batch of their own."""
+        part = _Batch()
+        if scrim_id in self.updates:
+            part.updates[scrim_id] = self.updates[scrim_id]
+        if scrim_id in self.resets:
+            part.resets.add(scrim_id)
+        if scrim_id in self.inserts:
+            part.inserts[scrim_id] = self.inserts[scrim_id]
+        if scrim_id in self.deletes:
+            part.deletes[scrim_id] = self.deletes[scrim_id]
+        self.forget(scrim_id)
+        return part
+
+    def merge(self, part: "_Batch"):
+        """Puts back changes taken out with `take`."""
+        self.updates.update(part.updates)
+        self.resets.update(part.resets)
+        self.inserts.update(part.inserts)
+        self.deletes.update(part.deletes)
+
+    def ops(self) -> List[dict]:
+        """The journal entries that rebuild this batch."""
+        ops = [{"op": "reset", "scrim": scrim_id} for scrim_id in self.resets]
+        for scrim_id, slot_nos in self.deletes.items():
+            ops.extend({"op": "delete", "scrim": scrim_id, "slot_no": slot_no} for slot_no in slot_nos)
+        ops.extend({"op": "insert", "scrim": scrim_id, "rows": list(rows.values())} for scrim_id, rows in self.inserts.items())
+        ops.extend({"op": "update", "scrim": scrim_id, "fields": fields} for scrim_id, fields in self.updates.items())
+        return ops
+
+    async def write(self):
+        """Writes the batch in one transaction with as few statements as possible."""
+        async with in_transaction() as conn:
+            if self.resets:
+                await ScrimSlot.filter(scrim_id__in=self.resets).using_db(conn).delete()
+                # Reserves wait for a slot of one round, so the next round starts without them.
+                await ScrimReserve.filter(scrim_id__in=self.resets).using_db(conn).delete()
+
+            for scrim_id, slot_nos in self.deletes.items():
+                if slot_nos:
+                    await ScrimSlot.filter(scrim_id=scrim_id, slot_no__in=slot_nos).using_db(conn).delete()
+
+            rows = [ScrimSlot(scrim_id=scrim_id, **row) for scrim_id, slots in self.inserts.items() for row in slots.values()]
+            if rows:
+                await ScrimSlot.bulk_create(rows, using_db=conn)
+
+            # Scrims that ended up with identical changes share a single UPDATE.
+            groups: Dict[tuple, List[int]] = {}
+            for scrim_id, fields in self.updates.items():
+                groups.setdefault(tuple(sorted(fields.items())), []).append(scrim_id)
+            for fields, scrim_ids in groups.items():
+                await Scrim.filter(id__in=scrim_ids).using_db(conn).update(**dict(fields))
+
+
+class ScrimWriteBuffer:
+    """
+    A write-behind layer for scrim state.
+
+    Changes are applied to the in-memory objects right away, coalesced per scrim
+    and written to Postgres in batches every `interval` seconds (and on close).
+    Every change is also appended to a local journal first, so changes that were
+    not flushed yet are replayed after a crash. The journal segment is fsync'd
+    when it is rotated at each flush; until then its lines are only in the OS
+    page cache, so they survive a crash of the bot but not of the host.
+
+    If the database can't be reached, the batch stays queued and flush() raises
+    FlushError. If it rejects a batch (e.g. a constraint violation), each scrim
+    is written on its own and the changes of the scrims that still fail are
+    moved to the dead-letter file `<name>.dead.jsonl`, so one bad scrim doesn't
+    hold back everyone else's writes.
+    """
+
+    def __init__(self, directory: str, name: str = "scrims", interval: float = 1.0):
+        self.directory = directory
+        self.name = name
+        self.interval = interval
+
+        os.makedirs(directory, exist_ok=True)
+        self._segment = 0
+        self._batch = self._new_batch()
+        self._retry: List[_Batch] = []  # batches that failed to write, oldest first
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+        self.flushes = 0
+        self.dead_letters = 0
+
+    # --- Journal ---
+    def _segments(self) -> List[str]:
+        names = [f for f in os.listdir(self.directory) if f.startswith(f"{self.name}.") and f.endswith(".journal")]
+        return sorted((os.path.join(self.directory, f) for f in names), key=lambda p: int(p.rsplit(".", 2)[1]))
+
+    def _new_batch(self) -> _Batch:
+        existing = self._segments()
+        if existing:
+            self._segment = max(self._segment, int(existing[-1].rsplit(".", 2)[1]) + 1)
+        path = os.path.join(self.directory, f"{self.name}.{self._segment}.journal")
+        self._segment += 1
+        self._journal = open(path, "a", buffering=1)
+        return _Batch(path)
+
+    def _sync_journal(self):
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    def _rewrite_journal(self, batch: _Batch):
+        """Replaces a batch's journal segments with one holding only what is still pending."""
+        path = batch.journals[0]
+        with open(path + ".tmp", "w") as f:
+            for op in batch.ops():
+                f.write(json.dumps(op, default=_encode) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+        for old in batch.journals[1:]:
+            os.remove(old)
+        batch.journals = [path]
+
+    def _dead_letter(self, scrim_id: int, part: _Batch, error: Exception):
+        entry = {"at": datetime.now(timezone.utc), "scrim": scrim_id, "error": repr(error), "ops": part.ops()}
+        with open(os.path.join(self.directory, f"{self.name}.dead.jsonl"), "a") as f:
+            f.write(json.dumps(entry, default=_encode) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.dead_letters += 1
+
+    def _record(self, op: dict):
+        self._journal.write(json.dumps(op, default=_encode) + "\n")
+        self._batch.apply(op)
+
+    # --- Mutations ---
+    def update(self, scrim: Scrim, **fields):
+        """Sets fields on the scrim now and writes them to the scrims row later."""
+        for name, value in fields.items():
+            setattr(scrim, name, value)
+        self._record({"op": "update", "scrim": scrim.id, "fields": fields})
+
+    def reset_slots(self, scrim_id: int):
+        """Drops every slot and reserve of a scrim, e.g. when a new registration round opens."""
+        self._record({"op": "reset", "scrim": scrim_id})
+
+    def insert_slots(self, scrim_id: int, slots: List[ScrimSlot]):
+        rows = [
+            {"slot_no": s.slot_no, "user_id": s.user_id, "team_name": s.team_name, "members": s.members, "message_id": s.message_id}
+            for s in slots
+        ]
+        self._record({"op": "insert", "scrim": scrim_id, "rows": rows})
+
+    def delete_slot(self, scrim_id: int, slot_no: int):
+        self._record({"op": "delete", "scrim": scrim_id, "slot_no": slot_no})
+
+    def forget(self, scrim_id: int):
+        """Drops everything pending for a scrim that was deleted."""
+        for batch in self._retry:
+            batch.forget(scrim_id)
+        self._record({"op": "forget", "scrim": scrim_id})
+
+    # --- Flushing ---
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        try:
+            await self.flush()
+        except FlushError:
+            log.warning("Closing with unflushed scrim writes; they are replayed from the journal on the next start.")
+        self._journal.close()
+        if not self._retry:
+            os.remove(self._batch.journals[0])
+
+    async def replay(self):
+        """Re-applies journal segments left behind by a previous run and writes them."""
+        segments = [path for path in self._segments() if path != self._batch.journals[0]]
+        if not segments:
+            return
+
+        batch = _Batch(*segments)
+        for path in segments:
+            with open(path) as f:
+                for line in f:
+                    try:
+                        batch.apply(json.loads(line, object_hook=_decode))
+                    except json.JSONDecodeError:
+                        break  # torn final write
+        log.info("Replaying %d scrim write journal(s)...", len(segments))
+        self._retry.insert(0, batch)
+        try:
+            await self.flush()
+        except FlushError:
+            pass  # retried by the flush loop
+
+    async def flush(self):
+        """
+        Writes everything pending, oldest batch first.
+        Raises FlushError if the database couldn't be reached; nothing is lost, the next flush retries.
+        """
+        async with self._lock:
+            if self._batch:
+                self._sync_journal()
+                self._journal.close()
+                self._retry.append(self._batch)
+                self._batch = self._new_batch()
+
+            while self._retry:
+                batch = self._retry[0]
+                try:
+                    await batch.write()
+                except Exception as e:
+                    if _is_transient(e):
+                        log.exception("Failed to flush scrim writes (will retry)")
+                        raise FlushError("Scrim writes are waiting for the database") from e
+                    log.exception("Scrim writes were rejected; writing each scrim on its own")
+                    await self._isolate(batch)
+                self._retry.pop(0)
+                self.flushes += 1
+                for path in batch.journals:
+                    os.remove(path)
+
+    async def _isolate(self, batch: _Batch):
+        """Writes a rejected batch scrim by scrim, dead-lettering the scrims whose writes are rejected."""
+        for scrim_id in sorted(batch.scrims()):
+            part = batch.take(scrim_id)
+            try:
+                await part.write()
+            except Exception as e:
+                if _is_transient(e):
+                    # Keep only what is left, so a replay doesn't repeat the scrims written above.
+                    batch.merge(part)
+                    self._rewrite_journal(batch)
+                    log.exception("Failed to flush scrim writes (will retry)")
+                    raise FlushError("Scrim writes are waiting for the database") from e
+                log.exception("Moving rejected writes of scrim %s to the dead-letter file", scrim_id)
+                self._dead_letter(scrim_id, part, e)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except FlushError:
+                pass  # logged by flush; try again next round
@@ -0,0 +1,111 @@
+"""
+Runs ME as several clusters, each a separate process owning a range of shards.
+
+    python launcher.py --clusters 4
+    python launcher.py --clusters 4 --shards 16
+
+Each cluster runs its own event loop, gateway connections, scrim scheduler
+and caches for the guilds on its shards. The launcher collects stats from
+every cluster over a local unix socket so `ping` can show all of them.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import signal
+
+import aiohttp
+import discord
+
+import config as cfg
+import core.Bot  # noqa: F401 - applies the API_BASE / GATEWAY_URL overrides
+from core.cluster import ClusterServer, shard_ranges
+
+
+def run_cluster(cluster_id: int, shard_ids: list, shard_count: int, ipc_path: str):
+    """Entry point of a cluster process."""
+    from core.Bot import ME
+
+    bot = ME(shard_ids=shard_ids, shard_count=shard_count, cluster_id=cluster_id, ipc_path=ipc_path)
+    bot.run(cfg.DISCORD_TOKEN)
+
+
+async def recommended_shards() -> int:
+    """Asks Discord (or the configured mock) how many shards the bot should use."""
+    url = f"{discord.http.Route.BASE}/gateway/bot"
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url, headers={"Authorization": f"Bot {cfg.DISCORD_TOKEN}"}) as resp:
+            resp.raise_for_status()
+            return (await resp.json())["shards"]
+
+
+class Launcher:
+    def __init__(self, clusters: int, shard_count: int, ipc_path: str):
+        self.ranges = shard_ranges(shard_count, clusters)
+        self.shard_count = shard_count
+        self.ipc_path = ipc_path
+        self.server = ClusterServer(ipc_path)
+        self.processes = {}
+        self.closing = False
+
+    def spawn(self, cluster_id: int):
+        ctx = multiprocessing.get_context("spawn")
+        process = ctx.Process(
+            target=run_cluster,
+            args=(cluster_id, self.ranges[cluster_id], self.shard_count, self.ipc_path),
+            name=f"ME-cluster-{cluster_id}",
+            daemon=True,
+        )
+        process.start()
+        self.processes[cluster_id] = process
+        print(f"-> Started cluster {cluster_id} (shards {self.ranges[cluster_id]}, pid {process.pid})")
+
+    async def run(self):
+        await self.server.start()
+        for cluster_id in range(len(self.ranges)):
+            self.spawn(cluster_id)
+            # Identify is rate limited per bot, so don't start every cluster at the same instant.
+            await asyncio.sleep(getattr(cfg, "CLUSTER_START_DELAY", 5))
+
+        while not self.closing:
+            for cluster_id, process in list(self.processes.items()):
+                if not process.is_alive() and not self.closing:
+                    print(f"Cluster {cluster_id} exited with code {process.exitcode}, restarting...")
+                    self.server.clusters.pop(cluster_id, None)
+                    self.spawn(cluster_id)
+            await asyncio.sleep(5)
+
+    async def close(self):
+        self.closing = True
+        for process in self.processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in self.processes.values():
+            process.join(timeout=10)
+        await self.server.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Run ME as multiple sharded clusters.")
+    parser.add_argument("--clusters", type=int, default=getattr(cfg, "CLUSTERS", 1))
+    parser.add_argument("--shards", type=int, default=getattr(cfg, "SHARD_COUNT", None))
+    parser.add_argument("--ipc", default=getattr(cfg, "IPC_PATH", "/tmp/me-cluster.sock"))
+    args = parser.parse_args()
+
+    shard_count = args.shards or await recommended_shards()
+    launcher = Launcher(args.clusters, shard_count, args.ipc)
+    print(f"Launching {len(launcher.ranges)} clusters for {shard_count} shards...")
+
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    runner = asyncio.create_task(launcher.run())
+    await stop.wait()
+    print("Shutting down clusters...")
+    runner.cancel()
+    await launcher.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,43 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "guilds" (
+    "id" BIGSERIAL NOT NULL PRIMARY KEY,
+    "prefix" VARCHAR(10) NOT NULL
+);
+COMMENT ON TABLE "guilds" IS 'Represents the settings for a guild in the database.';
+CREATE TABLE IF NOT EXISTS "scrims" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "guild_id" BIGINT NOT NULL,
+    "host_id" BIGINT NOT NULL,
+    "title" VARCHAR(200) NOT NULL,
+    "scrim_time" TIMESTAMPTZ NOT NULL,
+    "scrim_days" VARCHAR(100) NOT NULL,
+    "total_slots" INT NOT NULL,
+    "is_open" BOOL NOT NULL,
+    "reg_channel_id" BIGINT,
+    "slotlist_channel_id" BIGINT,
+    "reg_message_id" BIGINT,
+    "log_channel_id" BIGINT,
+    "ping_role_id" BIGINT,
+    "success_role_id" BIGINT,
+    "registered_teams" JSONB NOT NULL,
+    "reserves" JSONB NOT NULL,
+    "banned_users" JSONB NOT NULL,
+    "open_message" TEXT,
+    "dm_message" TEXT
+);
+COMMENT ON TABLE "scrims" IS 'Represents a scrim event in the database, with full customization options.';
+CREATE TABLE IF NOT EXISTS "aerich" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "version" VARCHAR(255) NOT NULL,
+    "app" VARCHAR(100) NOT NULL,
+    "content" JSONB NOT NULL
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
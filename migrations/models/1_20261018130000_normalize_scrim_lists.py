@@ -0,0 +1,95 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "scrim_slots" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "slot_no" INT NOT NULL,
+    "user_id" BIGINT NOT NULL,
+    "team_name" VARCHAR(200) NOT NULL,
+    "members" JSONB NOT NULL,
+    "message_id" BIGINT,
+    "registered_at" TIMESTAMPTZ NOT NULL,
+    "scrim_id" INT NOT NULL REFERENCES "scrims" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_scrim_slots_scrim_i_0752ef" UNIQUE ("scrim_id", "slot_no")
+);
+CREATE INDEX IF NOT EXISTS "idx_scrim_slots_scrim_i_5e3d55" ON "scrim_slots" ("scrim_id", "user_id");
+COMMENT ON TABLE "scrim_slots" IS 'A team holding a slot in a scrim''s current registration round.';
+        CREATE TABLE IF NOT EXISTS "scrim_reserves" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "user_id" BIGINT NOT NULL,
+    "team_name" VARCHAR(200) NOT NULL,
+    "members" JSONB NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "scrim_id" INT NOT NULL REFERENCES "scrims" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_scrim_reser_scrim_i_973b60" UNIQUE ("scrim_id", "user_id")
+);
+COMMENT ON TABLE "scrim_reserves" IS 'A team waiting for a slot to free up, in the order they were added.';
+        CREATE TABLE IF NOT EXISTS "scrim_bans" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "user_id" BIGINT NOT NULL,
+    "banned_by" BIGINT,
+    "reason" VARCHAR(200),
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "scrim_id" INT NOT NULL REFERENCES "scrims" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_scrim_bans_scrim_i_c95a83" UNIQUE ("scrim_id", "user_id")
+);
+COMMENT ON TABLE "scrim_bans" IS 'A user who is not allowed to register for a scrim.';
+        -- Move the JSON lists across. Teams are objects such as
+        -- {"team_name": ..., "user_id"/"leader_id": ..., "members": [...], "slot_no": ...};
+        -- bans are plain user IDs. Array position is used when no slot number was stored.
+        INSERT INTO "scrim_slots" ("scrim_id", "slot_no", "user_id", "team_name", "members", "message_id", "registered_at")
+            SELECT s."id",
+                   COALESCE((t.team->>'slot_no')::INT, t.pos::INT),
+                   COALESCE(t.team->>'user_id', t.team->>'leader_id')::BIGINT,
+                   LEFT(COALESCE(t.team->>'team_name', 'Team ' || t.pos), 200),
+                   COALESCE(t.team->'members', '[]'::JSONB),
+                   (t.team->>'message_id')::BIGINT,
+                   NOW()
+            FROM "scrims" s, JSONB_ARRAY_ELEMENTS(s."registered_teams") WITH ORDINALITY AS t(team, pos)
+            WHERE JSONB_TYPEOF(t.team) = 'object'
+              AND COALESCE(t.team->>'user_id', t.team->>'leader_id') IS NOT NULL
+        ON CONFLICT DO NOTHING;
+        INSERT INTO "scrim_reserves" ("scrim_id", "user_id", "team_name", "members", "created_at")
+            SELECT s."id",
+                   COALESCE(t.team->>'user_id', t.team->>'leader_id')::BIGINT,
+                   LEFT(COALESCE(t.team->>'team_name', 'Team ' || t.pos), 200),
+                   COALESCE(t.team->'members', '[]'::JSONB),
+                   NOW()
+            FROM "scrims" s, JSONB_ARRAY_ELEMENTS(s."reserves") WITH ORDINALITY AS t(team, pos)
+            WHERE JSONB_TYPEOF(t.team) = 'object'
+              AND COALESCE(t.team->>'user_id', t.team->>'leader_id') IS NOT NULL
+            ORDER BY s."id", t.pos
+        ON CONFLICT DO NOTHING;
+        INSERT INTO "scrim_bans" ("scrim_id", "user_id", "created_at")
+            SELECT s."id", u.user_id::BIGINT, NOW()
+            FROM "scrims" s, JSONB_ARRAY_ELEMENTS_TEXT(s."banned_users") AS u(user_id)
+            WHERE u.user_id ~ '^[0-9]+$'
+        ON CONFLICT DO NOTHING;
+        ALTER TABLE "scrims" DROP COLUMN "registered_teams";
+        ALTER TABLE "scrims" DROP COLUMN "reserves";
+        ALTER TABLE "scrims" DROP COLUMN "banned_users";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "scrims" ADD "registered_teams" JSONB NOT NULL DEFAULT '[]'::JSONB;
+        ALTER TABLE "scrims" ADD "reserves" JSONB NOT NULL DEFAULT '[]'::JSONB;
+        ALTER TABLE "scrims" ADD "banned_users" JSONB NOT NULL DEFAULT '[]'::JSONB;
+        UPDATE "scrims" s SET
+            "registered_teams" = COALESCE((
+                SELECT JSONB_AGG(JSONB_BUILD_OBJECT(
+                    'slot_no', x."slot_no", 'user_id', x."user_id", 'team_name', x."team_name",
+                    'members', x."members", 'message_id', x."message_id") ORDER BY x."slot_no")
+                FROM "scrim_slots" x WHERE x."scrim_id" = s."id"), '[]'::JSONB),
+            "reserves" = COALESCE((
+                SELECT JSONB_AGG(JSONB_BUILD_OBJECT(
+                    'user_id', x."user_id", 'team_name', x."team_name", 'members', x."members") ORDER BY x."id")
+                FROM "scrim_reserves" x WHERE x."scrim_id" = s."id"), '[]'::JSONB),
+            "banned_users" = COALESCE((
+                SELECT JSONB_AGG(x."user_id" ORDER BY x."id")
+                FROM "scrim_bans" x WHERE x."scrim_id" = s."id"), '[]'::JSONB);
+        DROP TABLE IF EXISTS "scrim_slots";
+        DROP TABLE IF EXISTS "scrim_reserves";
+        DROP TABLE IF EXISTS "scrim_bans";"""
@@ -0,0 +1,19 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "scrims" ADD "required_mentions" INT NOT NULL DEFAULT 4;
+        ALTER TABLE "scrims" ADD "required_lines" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "scrims" ADD "multiregister" BOOL NOT NULL DEFAULT False;
+        ALTER TABLE "scrims" ADD "duplicate_name" BOOL NOT NULL DEFAULT True;
+        ALTER TABLE "scrims" ADD "duplicate_tags" BOOL NOT NULL DEFAULT True;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "scrims" DROP COLUMN "required_mentions";
+        ALTER TABLE "scrims" DROP COLUMN "required_lines";
+        ALTER TABLE "scrims" DROP COLUMN "multiregister";
+        ALTER TABLE "scrims" DROP COLUMN "duplicate_name";
+        ALTER TABLE "scrims" DROP COLUMN "duplicate_tags";"""
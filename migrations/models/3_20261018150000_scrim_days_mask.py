@@ -0,0 +1,31 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "scrims" ALTER COLUMN "scrim_days" DROP DEFAULT;
+        ALTER TABLE "scrims" ALTER COLUMN "scrim_days" TYPE SMALLINT USING (
+            (CASE WHEN "scrim_days" LIKE '%Mo%' THEN 1 ELSE 0 END)
+          | (CASE WHEN "scrim_days" LIKE '%Tu%' THEN 2 ELSE 0 END)
+          | (CASE WHEN "scrim_days" LIKE '%We%' THEN 4 ELSE 0 END)
+          | (CASE WHEN "scrim_days" LIKE '%Th%' THEN 8 ELSE 0 END)
+          | (CASE WHEN "scrim_days" LIKE '%Fr%' THEN 16 ELSE 0 END)
+          | (CASE WHEN "scrim_days" LIKE '%Sa%' THEN 32 ELSE 0 END)
+          | (CASE WHEN "scrim_days" LIKE '%Su%' THEN 64 ELSE 0 END)
+        );
+        ALTER TABLE "scrims" ALTER COLUMN "scrim_days" SET DEFAULT 127;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "scrims" ALTER COLUMN "scrim_days" DROP DEFAULT;
+        ALTER TABLE "scrims" ALTER COLUMN "scrim_days" TYPE VARCHAR(100) USING concat_ws(', ',
+            CASE WHEN "scrim_days" & 1 > 0 THEN 'Mo' END,
+            CASE WHEN "scrim_days" & 2 > 0 THEN 'Tu' END,
+            CASE WHEN "scrim_days" & 4 > 0 THEN 'We' END,
+            CASE WHEN "scrim_days" & 8 > 0 THEN 'Th' END,
+            CASE WHEN "scrim_days" & 16 > 0 THEN 'Fr' END,
+            CASE WHEN "scrim_days" & 32 > 0 THEN 'Sa' END,
+            CASE WHEN "scrim_days" & 64 > 0 THEN 'Su' END
+        );
+        ALTER TABLE "scrims" ALTER COLUMN "scrim_days" SET DEFAULT 'Mo, Tu, We, Th, Fr, Sa, Su';"""
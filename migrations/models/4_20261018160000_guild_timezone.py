@@ -0,0 +1,11 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "guilds" ADD "timezone" VARCHAR(64) NOT NULL DEFAULT 'Asia/Kolkata';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "guilds" DROP COLUMN "timezone";"""
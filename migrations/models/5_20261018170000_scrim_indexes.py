@@ -0,0 +1,15 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_scrims_reg_cha_1e0acb" ON "scrims" ("reg_channel_id");
+        CREATE INDEX IF NOT EXISTS "idx_scrims_guild_i_26a3b5" ON "scrims" ("guild_id", "scrim_time");
+        CREATE INDEX IF NOT EXISTS "idx_scrims_is_open_18a26f" ON "scrims" ("is_open", "scrim_time");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_scrims_reg_cha_1e0acb";
+        DROP INDEX IF EXISTS "idx_scrims_guild_i_26a3b5";
+        DROP INDEX IF EXISTS "idx_scrims_is_open_18a26f";"""
@@ -0,0 +1,13 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "scrims" ADD "slotlist_start" SMALLINT NOT NULL DEFAULT 1;
+        ALTER TABLE "scrims" ADD "slotlist_message_id" BIGINT;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "scrims" DROP COLUMN "slotlist_start";
+        ALTER TABLE "scrims" DROP COLUMN "slotlist_message_id";"""
@@ -0,0 +1,14 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "scrim_slots" ALTER COLUMN "user_id" DROP NOT NULL;
+        ALTER TABLE "scrim_slots" ADD "version" INT NOT NULL DEFAULT 0;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DELETE FROM "scrim_slots" WHERE "user_id" IS NULL;
+        ALTER TABLE "scrim_slots" ALTER COLUMN "user_id" SET NOT NULL;
+        ALTER TABLE "scrim_slots" DROP COLUMN "version";"""
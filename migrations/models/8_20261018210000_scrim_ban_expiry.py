@@ -0,0 +1,19 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "scrim_bans" ADD "guild_id" BIGINT;
+        UPDATE "scrim_bans" SET "guild_id" = "scrims"."guild_id" FROM "scrims" WHERE "scrims"."id" = "scrim_bans"."scrim_id";
+        ALTER TABLE "scrim_bans" ALTER COLUMN "guild_id" SET NOT NULL;
+        ALTER TABLE "scrim_bans" ADD "expires_at" TIMESTAMPTZ;
+        CREATE INDEX "idx_scrim_bans_expires_a9a25b" ON "scrim_bans" ("expires_at");
+        CREATE INDEX "idx_scrim_bans_guild_i_008d80" ON "scrim_bans" ("guild_id", "user_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_scrim_bans_guild_i_008d80";
+        DROP INDEX IF EXISTS "idx_scrim_bans_expires_a9a25b";
+        ALTER TABLE "scrim_bans" DROP COLUMN "expires_at";
+        ALTER TABLE "scrim_bans" DROP COLUMN "guild_id";"""
@@ -1,6 +1,9 @@
 from tortoise import fields
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.expressions import F, Subquery
 from tortoise.models import Model
 import datetime
+from typing import Iterable, Optional
 
 class Scrim(Model):
     """Represents a scrim event in the database, with full customization options."""
@@ -13,15 +16,24 @@ class Scrim(Model):
     # --- Scrim Details ---
     title = fields.CharField(max_length=200)
     scrim_time = fields.DatetimeField()
-    scrim_days = fields.CharField(max_length=100, default="Mo, Tu, We, Th, Fr, Sa, Su")
+    scrim_days = fields.SmallIntField(default=0b1111111)  # bitmask of constants.DAY_BITS, Monday = bit 0
     
     # --- Registration Details ---
     total_slots = fields.IntField(default=25)
     is_open = fields.BooleanField(default=True)
+
+    # --- Registration Rules ---
+    required_mentions = fields.IntField(default=4)
+    required_lines = fields.IntField(default=0)
+    multiregister = fields.BooleanField(default=False)
+    duplicate_name = fields.BooleanField(default=True)
+    duplicate_tags = fields.BooleanField(default=True)
+    slotlist_start = fields.SmallIntField(default=1)  # number shown for the first slot
     
     # --- Channel and Message IDs ---
-    reg_channel_id = fields.BigIntField(null=True)
+    reg_channel_id = fields.BigIntField(null=True, index=True)
     slotlist_channel_id = fields.BigIntField(null=True) # <-- NEW FIELD
+    slotlist_message_id = fields.BigIntField(null=True)  # the slotlist posted for the current round
     reg_message_id = fields.BigIntField(null=True)
     log_channel_id = fields.BigIntField(null=True)
 
@@ -29,10 +41,8 @@ class Scrim(Model):
     ping_role_id = fields.BigIntField(null=True)
     success_role_id = fields.BigIntField(null=True) # <-- NEW FIELD
     
-    # --- Data Storage (JSON) ---
-    registered_teams = fields.JSONField(default=list)
-    reserves = fields.JSONField(default=list)
-    banned_users = fields.JSONField(default=list)
+    # Registered teams, reserves and bans live in their own tables:
+    # see ScrimSlot, ScrimReserve and ScrimBan below.
 
     # --- Customization Fields ---
     open_message = fields.TextField(null=True, default="Registration is now open!")
@@ -40,6 +50,99 @@ class Scrim(Model):
     
     class Meta:
         table = "scrims"
+        # Dashboard: filter(guild_id).order_by(scrim_time); scheduler/resume: filter(is_open).order_by(scrim_time)
+        indexes = (("guild_id", "scrim_time"), ("is_open", "scrim_time"))
 
     def __str__(self):
         return f"Scrim(id={self.id}, title='{self.title}')"
+
+
+class ScrimSlot(Model):
+    """A team holding a slot in a scrim's current registration round."""
+
+    id = fields.IntField(pk=True)
+    scrim = fields.ForeignKeyField("models.Scrim", related_name="slots", on_delete=fields.CASCADE)
+    slot_no = fields.IntField()
+
+    # The team leader (the member who registered the team); None while the slot is up for claims.
+    user_id = fields.BigIntField(null=True)
+    team_name = fields.CharField(max_length=200)
+    members = fields.JSONField(default=list)
+    message_id = fields.BigIntField(null=True)
+    registered_at = fields.DatetimeField(auto_now_add=True)
+    version = fields.IntField(default=0)  # bumped whenever the slot changes hands, see swap()
+
+    class Meta:
+        table = "scrim_slots"
+        unique_together = (("scrim", "slot_no"),)
+        # Not unique: a leader can hold several slots when the scrim allows multi-register.
+        indexes = (("scrim", "user_id"),)
+
+    def __str__(self):
+        return f"ScrimSlot(scrim_id={self.scrim_id}, slot_no={self.slot_no}, team='{self.team_name}')"
+
+    @property
+    def is_vacant(self) -> bool:
+        return self.user_id is None
+
+    @classmethod
+    async def swap(cls, slot: "ScrimSlot", user_id: Optional[int], team_name: str = "", members: Iterable[int] = (),
+                   using_db: Optional[BaseDBAsyncClient] = None) -> bool:
+        """
+        Hands a slot to another team, or frees it with user_id=None, unless it changed since it was read
+        or the new holder already has a slot in the scrim. This is a compare-and-set on the row's version:
+        of several concurrent swaps of one slot exactly one updates a row. Returns whether this one did;
+        `slot` is updated in place if so.
+        """
+        members = list(members)
+        query = cls.filter(id=slot.id, version=slot.version)
+        if user_id is not None:
+            # The holder check is part of the UPDATE itself rather than a separate read before it.
+            holders = cls.filter(scrim_id=slot.scrim_id, user_id=user_id).values("scrim_id")
+            query = query.exclude(scrim_id__in=Subquery(holders))
+        updated = await query.using_db(using_db).update(
+            user_id=user_id, team_name=team_name, members=members, message_id=None, version=F("version") + 1,
+        )
+        if updated:
+            slot.user_id, slot.team_name, slot.members, slot.message_id = user_id, team_name, members, None
+            slot.version += 1
+        return bool(updated)
+
+
+class ScrimReserve(Model):
+    """A team waiting for a slot to free up, in the order they were added."""
+
+    id = fields.IntField(pk=True)
+    scrim = fields.ForeignKeyField("models.Scrim", related_name="reserves", on_delete=fields.CASCADE)
+    user_id = fields.BigIntField()
+    team_name = fields.CharField(max_length=200)
+    members = fields.JSONField(default=list)
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "scrim_reserves"
+        unique_together = (("scrim", "user_id"),)
+
+    def __str__(self):
+        return f"ScrimReserve(scrim_id={self.scrim_id}, user_id={self.user_id})"
+
+
+class ScrimBan(Model):
+    """A user who is not allowed to register for a scrim, until `expires_at` if that is set."""
+
+    id = fields.IntField(pk=True)
+    guild_id = fields.BigIntField()
+    scrim = fields.ForeignKeyField("models.Scrim", related_name="bans", on_delete=fields.CASCADE)
+    user_id = fields.BigIntField()
+    banned_by = fields.BigIntField(null=True)
+    reason = fields.CharField(max_length=200, null=True)
+    created_at = fields.DatetimeField(auto_now_add=True)
+    expires_at = fields.DatetimeField(null=True, index=True)  # removed by the scheduler once passed
+
+    class Meta:
+        table = "scrim_bans"
+        unique_together = (("scrim", "user_id"),)
+        indexes = (("guild_id", "user_id"),)
+
+    def __str__(self):
+        return f"ScrimBan(scrim_id={self.scrim_id}, user_id={self.user_id})"
@@ -1,6 +1,7 @@
 from tortoise import fields
 from tortoise.models import Model
 import config as cfg
+from constants import DEFAULT_TIMEZONE
 
 class Guild(Model):
     """Represents the settings for a guild in the database."""
@@ -15,6 +16,9 @@ class Guild(Model):
     # from your config file.
     prefix = fields.CharField(max_length=10, default=cfg.PREFIX)
 
+    # IANA timezone name (e.g. "Europe/Berlin") used to read and schedule scrim times.
+    timezone = fields.CharField(max_length=64, default=DEFAULT_TIMEZONE)
+
     def __str__(self):
         return f"Guild(id={self.id}, prefix='{self.prefix}')"
 
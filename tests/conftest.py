@@ -0,0 +1,13 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# config.py is local to each deployment; fall back to the example so modules that read it import.
+if importlib.util.find_spec("config") is None:
+    spec = importlib.util.spec_from_file_location("config", ROOT / "config-example.py")
+    config = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(config)
+    sys.modules["config"] = config
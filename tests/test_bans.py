@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+import pytest
+
+from cogs.esports.helper.bans import parse_targets
+
+
+def test_parse_targets_splits_users_duration_and_reason():
+    user_ids, duration, reason = parse_targets("<@123456789012345678> 223456789012345678 7d  fake tags")
+    assert user_ids == [123456789012345678, 223456789012345678]
+    assert duration == timedelta(days=7)
+    assert reason == "fake tags"
+
+
+def test_parse_targets_without_duration_is_permanent():
+    assert parse_targets("<@!123456789012345678>") == ([123456789012345678], None, None)
+
+
+@pytest.mark.parametrize("text", ["0h", "00d", "0 w", "0m toxic"])
+def test_parse_targets_rejects_zero_durations(text):
+    with pytest.raises(ValueError):
+        parse_targets(f"123456789012345678 {text}")
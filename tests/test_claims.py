@@ -0,0 +1,15 @@
+from cogs.esports.helper.claims import parse_team
+
+
+def test_parse_team_keeps_the_leader_first():
+    user_ids, team_name = parse_team("<@223456789012345678> <@!123456789012345678> 323456789012345678 Night Owls")
+    assert user_ids == [223456789012345678, 123456789012345678, 323456789012345678]
+    assert team_name == "Night Owls"
+
+
+def test_parse_team_reads_a_team_name_line():
+    assert parse_team("Team Name: **Night Owls**\n<@123456789012345678>") == ([123456789012345678], "Night Owls")
+
+
+def test_parse_team_without_name():
+    assert parse_team("<@123456789012345678> <@123456789012345678>") == ([123456789012345678], None)
@@ -0,0 +1,46 @@
+from cogs.esports.helper.teams import TeamIndex, normalize_name
+from models.esports.scrims import ScrimSlot
+
+
+def test_normalize_name_folds_case_and_whitespace():
+    assert normalize_name("Team  X") == normalize_name("team x") == normalize_name(" TEAM\tX ") == "teamx"
+
+
+def test_normalize_name_folds_compatibility_forms():
+    # NFKD turns full-width letters and ligatures into their plain forms.
+    assert normalize_name("Ｔｅａｍ Ｘ") == "teamx"
+    assert normalize_name("ﬁve") == "five"
+
+
+def test_normalize_name_strips_accents():
+    assert normalize_name("Téam Ẋ") == normalize_name("Team X")
+
+
+def test_normalize_name_strips_zero_width_and_format_characters():
+    assert normalize_name("TEAM​X") == "teamx"           # zero-width space
+    assert normalize_name("Te‍am⁠ X﻿") == "teamx"  # joiner, word joiner, BOM
+    assert normalize_name("‮Team X") == "teamx"           # bidi override
+
+
+def slot(slot_no, user_id, team_name, members):
+    return ScrimSlot(slot_no=slot_no, user_id=user_id, team_name=team_name, members=members)
+
+
+def test_team_index_lookups():
+    index = TeamIndex([slot(1, 10, "Alpha", [10, 11]), slot(2, 20, "Beta", [20, 11])])
+
+    assert index.has_name("ALPHA") and index.has_name("Al​pha")
+    assert index.has_leader(10) and not index.has_leader(11)
+    assert index.tagged([99, 11]) == 11
+    assert [s.slot_no for s in index.slots_of(11)] == [1, 2]
+
+
+def test_team_index_remove_keeps_members_tagged_elsewhere():
+    index = TeamIndex([slot(1, 10, "Alpha", [10, 11]), slot(2, 20, "Beta", [20, 11])])
+
+    index.remove(1)
+    assert not index.has_name("alpha") and not index.has_leader(10)
+    assert index.tagged([11]) == 11
+
+    index.remove(2)
+    assert not index.names and not index.leaders and not index.members
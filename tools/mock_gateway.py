@@ -0,0 +1,168 @@
+"""
+A small stand-in for the Discord REST API and gateway, for running ME clusters
+on one machine without touching Discord.
+
+    python tools/mock_gateway.py --port 8765 --guilds 2000 --shards 8
+
+Then point the bot at it in config.py and start the launcher as usual:
+
+    API_BASE = "http://127.0.0.1:8765/api/v10"
+    GATEWAY_URL = "ws://127.0.0.1:8765/gateway"
+
+Every shard gets READY and a GUILD_CREATE for each guild that hashes to it,
+heartbeats are acknowledged and member chunk requests are answered empty.
+REST calls other than the ones needed to log in return an empty object.
+"""
+import argparse
+import json
+import time
+
+from aiohttp import WSMsgType, web
+
+BOT_ID = 100000000000000000
+GUILD_BASE = 300000000000000000
+
+
+def json_response(data: dict) -> web.Response:
+    # discord.py only decodes bodies whose content type is exactly "application/json" (no charset).
+    return web.Response(body=json.dumps(data).encode(), headers={"Content-Type": "application/json"})
+
+
+def user_payload() -> dict:
+    return {"id": str(BOT_ID), "username": "ME", "discriminator": "0000", "global_name": None, "avatar": None, "bot": True}
+
+
+def guild_payload(guild_id: int) -> dict:
+    return {
+        "id": str(guild_id),
+        "name": f"Mock Guild {guild_id}",
+        "icon": None,
+        "owner_id": str(BOT_ID),
+        "member_count": 1,
+        "large": False,
+        "unavailable": False,
+        "features": [],
+        "verification_level": 0,
+        "default_message_notifications": 0,
+        "explicit_content_filter": 0,
+        "mfa_level": 0,
+        "nsfw_level": 0,
+        "premium_tier": 0,
+        "preferred_locale": "en-US",
+        "roles": [{"id": str(guild_id), "name": "@everyone", "permissions": "0", "position": 0, "color": 0,
+                   "hoist": False, "managed": False, "mentionable": False}],
+        "emojis": [],
+        "stickers": [],
+        "channels": [{"id": str(guild_id + 1), "type": 0, "name": "general", "position": 0,
+                      "permission_overwrites": []}],
+        "threads": [],
+        "members": [],
+        "voice_states": [],
+        "presences": [],
+        "stage_instances": [],
+        "guild_scheduled_events": [],
+        "soundboard_sounds": [],
+    }
+
+
+class MockDiscord:
+    def __init__(self, host: str, port: int, guilds: int, shards: int):
+        self.host = host
+        self.port = port
+        self.shards = shards
+        # Snowflakes are spaced so the guilds spread evenly over the shards.
+        self.guild_ids = [GUILD_BASE + (i << 22) for i in range(guilds)]
+
+    def guilds_for(self, shard_id: int, shard_count: int):
+        return [g for g in self.guild_ids if (g >> 22) % shard_count == shard_id]
+
+    # --- REST ---
+    async def gateway_bot(self, request: web.Request):
+        return json_response({
+            "url": f"ws://{self.host}:{self.port}/gateway",
+            "shards": self.shards,
+            "session_start_limit": {"total": 1000, "remaining": 1000, "reset_after": 0, "max_concurrency": 16},
+        })
+
+    async def users_me(self, request: web.Request):
+        return json_response(user_payload())
+
+    async def application(self, request: web.Request):
+        return json_response({
+            "id": str(BOT_ID), "name": "ME", "description": "", "icon": None, "bot_public": True,
+            "bot_require_code_grant": False, "owner": user_payload(), "verify_key": "", "flags": 0,
+            "team": None, "summary": "",
+        })
+
+    async def fallback(self, request: web.Request):
+        return json_response({})
+
+    # --- Gateway ---
+    async def gateway(self, request: web.Request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        seq = 0
+
+        async def dispatch(event: str, data: dict):
+            nonlocal seq
+            seq += 1
+            await ws.send_str(json.dumps({"op": 0, "t": event, "s": seq, "d": data}))
+
+        await ws.send_str(json.dumps({"op": 10, "d": {"heartbeat_interval": 41250}}))
+
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            payload = json.loads(msg.data)
+            op, data = payload["op"], payload.get("d")
+
+            if op == 1:  # Heartbeat
+                await ws.send_str(json.dumps({"op": 11}))
+
+            elif op in (2, 6):  # Identify / Resume
+                shard_id, shard_count = (data.get("shard") or [0, 1]) if op == 2 else (0, 1)
+                guild_ids = self.guilds_for(shard_id, shard_count)
+                await dispatch("READY", {
+                    "v": 10,
+                    "user": user_payload(),
+                    "guilds": [{"id": str(g), "unavailable": True} for g in guild_ids],
+                    "session_id": f"mock-{shard_id}-{time.time_ns()}",
+                    "resume_gateway_url": f"ws://{self.host}:{self.port}/gateway",
+                    "shard": [shard_id, shard_count],
+                    "application": {"id": str(BOT_ID), "flags": 0},
+                })
+                for guild_id in guild_ids:
+                    await dispatch("GUILD_CREATE", guild_payload(guild_id))
+
+            elif op == 8:  # Request guild members
+                await dispatch("GUILD_MEMBERS_CHUNK", {
+                    "guild_id": data["guild_id"], "members": [], "chunk_index": 0, "chunk_count": 1,
+                    "nonce": data.get("nonce"),
+                })
+
+        return ws
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/api/v10/gateway/bot", self.gateway_bot)
+        app.router.add_get("/api/v10/users/@me", self.users_me)
+        app.router.add_get("/api/v10/oauth2/applications/@me", self.application)
+        app.router.add_get("/gateway", self.gateway)
+        app.router.add_route("*", "/api/v10/{tail:.*}", self.fallback)
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock Discord REST API and gateway.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--guilds", type=int, default=100)
+    parser.add_argument("--shards", type=int, default=4)
+    args = parser.parse_args()
+
+    mock = MockDiscord(args.host, args.port, args.guilds, args.shards)
+    web.run_app(mock.app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()